@@ -11,6 +11,7 @@ import os
 import pandas as pd
 from rdflib import Graph, URIRef, Literal, Namespace
 from rdflib.namespace import RDFS, RDF, SKOS
+from rdfconv import terms
 
 BASE_PATH = "../data/reconciled/"
 RELATIONS_PATH = "../data/csv/relations.csv"
@@ -109,14 +110,14 @@ for prefix, ns in namespaces.items():
 print("Processing archives...")
 json_data = json.loads(archives.to_json(orient="records"))
 for work in json_data:
-    subject_uri = URIRef(f"{DA}{int(work['id'])}")
+    subject_uri = terms.uri(f"{DA}{int(work['id'])}")
 
     # Add the entity type
     g.add(
         (
             subject_uri,
             RDF.type,
-            LMDIAMM["Archive"],
+            terms.uri(f"{LMDIAMM}Archive"),
         )
     )
 
@@ -126,7 +127,7 @@ for work in json_data:
             (
                 subject_uri,
                 DIAMM_SCHEMA["wikidata_id"],
-                URIRef(f"{WD}{work['name_@id']}"),
+                terms.uri(f"{WD}{work['name_@id']}"),
             )
         )
     g.add((subject_uri, DIAMM_SCHEMA["name"], Literal(work["name"])))
@@ -159,14 +160,14 @@ for work in json_data:
 print("Processing cities...")
 json_data = json.loads(cities.to_json(orient="records"))
 for work in json_data:
-    subject_uri = URIRef(f"{DI}{int(work['id'])}")
+    subject_uri = terms.uri(f"{DI}{int(work['id'])}")
 
     # Add the entity type
     g.add(
         (
             subject_uri,
             RDF.type,
-            LMDIAMM["City"],
+            terms.uri(f"{LMDIAMM}City"),
         )
     )
 
@@ -176,7 +177,7 @@ for work in json_data:
             (
                 subject_uri,
                 DIAMM_SCHEMA["wikidata_id"],
-                URIRef(f"{WD}{work['name_@id']}"),
+                terms.uri(f"{WD}{work['name_@id']}"),
             )
         )
     g.add((subject_uri, DIAMM_SCHEMA["name"], Literal(work["name"])))
@@ -185,14 +186,14 @@ print("Processing compositions...")
 json_data = json.loads(compositions.to_json(orient="records"))
 for work in json_data:
     if work["id"] is not None:  # If it is none, skip to the genre
-        subject_uri = URIRef(f"{DM}{int(work['id'])}")
+        subject_uri = terms.uri(f"{DM}{int(work['id'])}")
 
         # Add the entity type
         g.add(
             (
                 subject_uri,
                 RDF.type,
-                LMDIAMM["Composition"],
+                terms.uri(f"{LMDIAMM}Composition"),
             )
         )
 
@@ -203,7 +204,7 @@ for work in json_data:
                 (
                     subject_uri,
                     DIAMM_SCHEMA["composer"],
-                    WD["Q4233718"],  # Q-ID for anonymous
+                    terms.uri(f"{WD}Q4233718"),  # Q-ID for anonymous
                 )
             )
 
@@ -213,7 +214,7 @@ for work in json_data:
                 (
                     subject_uri,
                     DIAMM_SCHEMA["genre"],
-                    URIRef(f"{WD}{work['genres_@id']}"),
+                    terms.uri(f"{WD}{work['genres_@id']}"),
                 )
             )
         else:
@@ -221,21 +222,21 @@ for work in json_data:
                 (
                     subject_uri,
                     DIAMM_SCHEMA["genre"],
-                    Literal(work["genres"]),
+                    terms.literal(work["genres"]),
                 )
             )
 
 print("Processing countries...")
 json_data = json.loads(countres.to_json(orient="records"))
 for work in json_data:
-    subject_uri = URIRef(f"{DN}{int(work['id'])}")
+    subject_uri = terms.uri(f"{DN}{int(work['id'])}")
 
     # Add the entity type
     g.add(
         (
             subject_uri,
             RDF.type,
-            LMDIAMM["Country"],
+            terms.uri(f"{LMDIAMM}Country"),
         )
     )
 
@@ -245,7 +246,7 @@ for work in json_data:
             (
                 subject_uri,
                 DIAMM_SCHEMA["wikidata_id"],
-                URIRef(f"{WD}{work['name_@id']}"),
+                terms.uri(f"{WD}{work['name_@id']}"),
             )
         )
     g.add((subject_uri, DIAMM_SCHEMA["name"], Literal(work["name"])))
@@ -254,14 +255,14 @@ print("Processing organizations...")
 json_data = json.loads(organizations.to_json(orient="records"))
 for work in json_data:
     if work["id"] is not None:  # If it is none, skip to the type
-        subject_uri = URIRef(f"{DO}{int(work['id'])}")
+        subject_uri = terms.uri(f"{DO}{int(work['id'])}")
 
         # Add the entity type
         g.add(
             (
                 subject_uri,
                 RDF.type,
-                LMDIAMM["Organization"],
+                terms.uri(f"{LMDIAMM}Organization"),
             )
         )
 
@@ -271,7 +272,7 @@ for work in json_data:
                 (
                     subject_uri,
                     DIAMM_SCHEMA["wikidata_id"],
-                    URIRef(f"{WD}{work['name_@id']}"),
+                    terms.uri(f"{WD}{work['name_@id']}"),
                 )
             )
         g.add((subject_uri, DIAMM_SCHEMA["name"], Literal(work["name"])))
@@ -282,7 +283,7 @@ for work in json_data:
                 (
                     subject_uri,
                     DIAMM_SCHEMA["type"],
-                    URIRef(f"{WD}{work['organization_type_@id']}"),
+                    terms.uri(f"{WD}{work['organization_type_@id']}"),
                 )
             )
         else:
@@ -290,21 +291,21 @@ for work in json_data:
                 (
                     subject_uri,
                     DIAMM_SCHEMA["type"],
-                    Literal(work["organization_type"]),
+                    terms.literal(work["organization_type"]),
                 )
             )
 
 print("Processing people...")
 json_data = json.loads(people.to_json(orient="records"))
 for work in json_data:
-    subject_uri = URIRef(f"{DP}{int(work['id'])}")
+    subject_uri = terms.uri(f"{DP}{int(work['id'])}")
 
     # Add the entity type
     g.add(
         (
             subject_uri,
             RDF.type,
-            LMDIAMM["Person"],
+            terms.uri(f"{LMDIAMM}Person"),
         )
     )
 
@@ -314,7 +315,7 @@ for work in json_data:
             (
                 subject_uri,
                 DIAMM_SCHEMA["wikidata_id"],
-                URIRef(f"{WD}{work['full_name_@id']}"),
+                terms.uri(f"{WD}{work['full_name_@id']}"),
             )
         )
     g.add(
@@ -340,7 +341,7 @@ for work in json_data:
             (
                 subject_uri,
                 DIAMM_SCHEMA["earliest_year"],
-                URIRef(f"{WD}{work['earliest_year_@id']}"),
+                terms.uri(f"{WD}{work['earliest_year_@id']}"),
             )
         )
     if work["latest_year_@id"] is not None:
@@ -348,7 +349,7 @@ for work in json_data:
             (
                 subject_uri,
                 DIAMM_SCHEMA["latest_year"],
-                URIRef(f"{WD}{work['latest_year_@id']}"),
+                terms.uri(f"{WD}{work['latest_year_@id']}"),
             )
         )
 
@@ -372,14 +373,14 @@ for work in json_data:
 print("Processing regions...")
 json_data = json.loads(regions.to_json(orient="records"))
 for work in json_data:
-    subject_uri = URIRef(f"{DR}{int(work['id'])}")
+    subject_uri = terms.uri(f"{DR}{int(work['id'])}")
 
     # Add the entity type
     g.add(
         (
             subject_uri,
             RDF.type,
-            LMDIAMM["Region"],
+            terms.uri(f"{LMDIAMM}Region"),
         )
     )
 
@@ -389,7 +390,7 @@ for work in json_data:
             (
                 subject_uri,
                 DIAMM_SCHEMA["wikidata_id"],
-                URIRef(f"{WD}{work['name_@id']}"),
+                terms.uri(f"{WD}{work['name_@id']}"),
             )
         )
     g.add((subject_uri, DIAMM_SCHEMA["name"], Literal(work["name"])))
@@ -397,14 +398,14 @@ for work in json_data:
 print("Processing sets...")
 json_data = json.loads(sets.to_json(orient="records"))
 for work in json_data:
-    subject_uri = URIRef(f"{DE}{int(work['id'])}")
+    subject_uri = terms.uri(f"{DE}{int(work['id'])}")
 
     # Add the entity type
     g.add(
         (
             subject_uri,
             RDF.type,
-            LMDIAMM["Set"],
+            terms.uri(f"{LMDIAMM}Set"),
         )
     )
 
@@ -413,11 +414,11 @@ for work in json_data:
             (
                 subject_uri,
                 DIAMM_SCHEMA["type"],
-                URIRef(f"{WD}{work['type_@id']}"),
+                terms.uri(f"{WD}{work['type_@id']}"),
             )
         )
     else:
-        g.add((subject_uri, DIAMM_SCHEMA["type"], Literal(work["type"])))
+        g.add((subject_uri, DIAMM_SCHEMA["type"], terms.literal(work["type"])))
 
     g.add(
         (
@@ -430,14 +431,14 @@ for work in json_data:
 print("Processing sources...")
 json_data = json.loads(sources.to_json(orient="records"))
 for work in json_data:
-    subject_uri = URIRef(f"{DS}{int(work['id'])}")
+    subject_uri = terms.uri(f"{DS}{int(work['id'])}")
 
     # Add the entity type
     g.add(
         (
             subject_uri,
             RDF.type,
-            LMDIAMM["Source"],
+            terms.uri(f"{LMDIAMM}Source"),
         )
     )
 
@@ -462,7 +463,7 @@ for work in json_data:
                 (
                     subject_uri,
                     DIAMM_SCHEMA["type"],
-                    URIRef(f"{WD}{work['source_type_@id']}"),
+                    terms.uri(f"{WD}{work['source_type_@id']}"),
                 )
             )
         else:
@@ -470,7 +471,7 @@ for work in json_data:
                 (
                     subject_uri,
                     DIAMM_SCHEMA["type"],
-                    Literal(work["source_type"]),
+                    terms.literal(work["source_type"]),
                 )
             )
 
@@ -484,52 +485,52 @@ for work in json_data:
     reverse = False
 
     if first_type == "archive":
-        first_uri = URIRef(f"{DA}{first_id}")
+        first_uri = terms.uri(f"{DA}{first_id}")
         if second_type == "city":
-            second_uri = URIRef(f"{DI}{second_id}")
+            second_uri = terms.uri(f"{DI}{second_id}")
             pred_uri = DIAMM_SCHEMA["city"]
         elif second_type == "source":
-            second_uri = URIRef(f"{DS}{second_id}")
+            second_uri = terms.uri(f"{DS}{second_id}")
             pred_uri = DIAMM_SCHEMA["holding_archive"]
             reverse = True
     elif first_type == "city":
-        first_uri = URIRef(f"{DI}{first_id}")
+        first_uri = terms.uri(f"{DI}{first_id}")
         if second_type == "country":
-            second_uri = URIRef(f"{DN}{second_id}")
+            second_uri = terms.uri(f"{DN}{second_id}")
             pred_uri = DIAMM_SCHEMA["country"]
         elif second_type == "organization":
-            second_uri = URIRef(f"{DO}{second_id}")
+            second_uri = terms.uri(f"{DO}{second_id}")
             pred_uri = DIAMM_SCHEMA["city"]
             reverse = True
         elif second_type == "region":
-            second_uri = URIRef(f"{DR}{second_id}")
+            second_uri = terms.uri(f"{DR}{second_id}")
             pred_uri = DIAMM_SCHEMA["region"]
         elif second_type == "source":
-            second_uri = URIRef(f"{DS}{second_id}")
+            second_uri = terms.uri(f"{DS}{second_id}")
             pred_uri = DIAMM_SCHEMA["city"]
             reverse = True
     elif first_type == "composition":
-        first_uri = URIRef(f"{DM}{first_id}")
+        first_uri = terms.uri(f"{DM}{first_id}")
         if second_type == "people":
-            second_uri = URIRef(f"{DP}{second_id}")
+            second_uri = terms.uri(f"{DP}{second_id}")
             pred_uri = DIAMM_SCHEMA["composer"]
         elif second_type == "source":
-            second_uri = URIRef(f"{DS}{second_id}")
+            second_uri = terms.uri(f"{DS}{second_id}")
             pred_uri = DIAMM_SCHEMA["composition_in_source"]
     elif first_type == "country":
-        first_uri = URIRef(f"{DN}{first_id}")
+        first_uri = terms.uri(f"{DN}{first_id}")
         if second_type == "organization":
-            second_uri = URIRef(f"{DO}{second_id}")
+            second_uri = terms.uri(f"{DO}{second_id}")
             pred_uri = DIAMM_SCHEMA["country"]
             reverse = True
         elif second_type == "region":
-            second_uri = URIRef(f"{DR}{second_id}")
+            second_uri = terms.uri(f"{DR}{second_id}")
             pred_uri = DIAMM_SCHEMA["country"]
             reverse = True
     elif first_type == "organization":
-        first_uri = URIRef(f"{DO}{first_id}")
+        first_uri = terms.uri(f"{DO}{first_id}")
         if second_type == "source":
-            second_uri = URIRef(f"{DS}{second_id}")
+            second_uri = terms.uri(f"{DS}{second_id}")
             reverse = True
             if work["type"] == "copied":
                 pred_uri = DIAMM_SCHEMA["copied_organization"]
@@ -542,11 +543,11 @@ for work in json_data:
                     if pred_map.startswith("r"):
                         reverse = False
                         pred_map = pred_map[1:]  # Remove 'r' prefix
-                    pred_uri = WDT[pred_map]
+                    pred_uri = terms.uri(f"{WDT}{pred_map}")
     elif first_type == "people":
-        first_uri = URIRef(f"{DP}{first_id}")
+        first_uri = terms.uri(f"{DP}{first_id}")
         if second_type == "source":
-            second_uri = URIRef(f"{DS}{second_id}")
+            second_uri = terms.uri(f"{DS}{second_id}")
             reverse = True
             if work["type"] == "copied":
                 pred_uri = DIAMM_SCHEMA["copied_people"]
@@ -557,11 +558,11 @@ for work in json_data:
                     if pred_map.startswith("r"):
                         reverse = False
                         pred_map = pred_map[1:]  # Remove 'r' prefix
-                    pred_uri = WDT[pred_map]
+                    pred_uri = terms.uri(f"{WDT}{pred_map}")
     elif first_type == "set":
-        first_uri = URIRef(f"{DE}{first_id}")
+        first_uri = terms.uri(f"{DE}{first_id}")
         if second_type == "source":
-            second_uri = URIRef(f"{DS}{second_id}")
+            second_uri = terms.uri(f"{DS}{second_id}")
             pred_uri = DIAMM_SCHEMA["set_in_source"]
             reverse = True
 
@@ -578,3 +579,4 @@ g.serialize(
     format="turtle",
     encoding="utf-8",
 )
+print(f"Term cache: {terms.format_cache_info()}")
@@ -25,6 +25,7 @@ Usage:
     <reconciled_folder> is the path to the folder containing reconciled mappings for types and keys,
     <config_folder> is the path to the folder containing configuration files for the schema and mappings,
     and <output_folder> is the path to the folder to save the generated Turtle files.
+    The `shared/` folder must be on PYTHONPATH, for the rdfconv.terms helpers.
     The script can also be run without arguments, in which case it will use default paths.
     The input folder should contain files named according to the entity type (e.g., artist.jsonl, release.jsonl).
     The output folder will contain the generated Turtle files named after the entity type.
@@ -57,6 +58,7 @@ from rdflib.namespace import XSD, RDF
 import pandas as pd
 import aiofiles
 from mapping_schema import MappingSchema
+from rdfconv import terms
 
 # Define namespaces
 WDT = Namespace("http://www.wikidata.org/prop/direct/")
@@ -141,9 +143,10 @@ def convert_date(date_str: str) -> Literal:
     """
     try:
         # Validate the date string, and catch any exception that might occur
-        return Literal(parse_date(date_str), datatype=XSD.date)
+        return terms.literal(parse_date(date_str), datatype=XSD.date)
     except (ISO8601Error, ValueError):
-        return Literal(date_str)  # Fallback to a plain literal if conversion fails
+        # Fallback to a plain literal if conversion fails
+        return terms.literal(date_str)
 
 
 def convert_datetime(date_str: str, time_str: str) -> Literal:
@@ -153,11 +156,12 @@ def convert_datetime(date_str: str, time_str: str) -> Literal:
     """
     try:
         # Validate the datetime string, and catch any exception that might occur
-        return Literal(
+        return terms.literal(
             parse_datetime(f"{date_str}T{time_str}:00"), datatype=XSD.dateTime
         )
     except (ISO8601Error, ValueError):
-        return Literal(date_str)  # Fallback to a plain literal if conversion fails
+        # Fallback to a plain literal if conversion fails
+        return terms.literal(date_str)
 
 
 def dashes_to_upper_camel(string: str) -> str:
@@ -189,7 +193,13 @@ def process_entity(
     subject_uri = URIRef(f"https://musicbrainz.org/{entity_type}/{entity_id}")
 
     # Add the entity type, use UpperCamelCase for entity type
-    g.add((subject_uri, RDF.type, LMMB[dashes_to_upper_camel(entity_type)]))
+    g.add(
+        (
+            subject_uri,
+            RDF.type,
+            terms.uri(f"{LMMB}{dashes_to_upper_camel(entity_type)}"),
+        )
+    )
 
     # Process name
     if name := data.get("name"):
@@ -207,11 +217,11 @@ def process_entity(
                     (
                         subject_uri,
                         entity_mb_schema["type"],
-                        URIRef(f"{WD}{converted_type}"),
+                        terms.uri(f"{WD}{converted_type}"),
                     )
                 )
             else:
-                g.add((subject_uri, entity_mb_schema["type"], Literal(t)))
+                g.add((subject_uri, entity_mb_schema["type"], terms.literal(t)))
 
     # Process address
     if address := data.get("address"):
@@ -253,7 +263,7 @@ def process_entity(
                 (
                     subject_uri,
                     entity_mb_schema["area"],
-                    URIRef(f"https://musicbrainz.org/area/{area_id}"),
+                    terms.uri(f"https://musicbrainz.org/area/{area_id}"),
                 )
             )
 
@@ -264,7 +274,7 @@ def process_entity(
                 (
                     subject_uri,
                     entity_mb_schema["artist"],
-                    URIRef(f"https://musicbrainz.org/artist/{artist_id}"),
+                    terms.uri(f"https://musicbrainz.org/artist/{artist_id}"),
                 )
             )
 
@@ -280,9 +290,9 @@ def process_entity(
                     and matched_wikidata(key_map)
                 ):
                     # If the attribute is the key and it is a Wikidata ID, use it directly
-                    attribute_value = URIRef(f"{WD}{key_map}")
+                    attribute_value = terms.uri(f"{WD}{key_map}")
                 else:
-                    attribute_value = Literal(attribute_value)
+                    attribute_value = terms.literal(attribute_value)
 
                 g.add(
                     (
@@ -303,7 +313,7 @@ def process_entity(
                         if data["type"] == "Person"
                         else entity_mb_schema["begin-area"]
                     ),
-                    URIRef(f"https://musicbrainz.org/area/{begin_area_id}"),
+                    terms.uri(f"https://musicbrainz.org/area/{begin_area_id}"),
                 )
             )
 
@@ -331,7 +341,7 @@ def process_entity(
                 (
                     subject_uri,
                     entity_mb_schema["end-area-person"],
-                    URIRef(f"https://musicbrainz.org/area/{end_area_id}"),
+                    terms.uri(f"https://musicbrainz.org/area/{end_area_id}"),
                 )
             )
 
@@ -350,9 +360,9 @@ def process_entity(
         if (gender_map := reconciled_mapping.get(gender)) and matched_wikidata(
             gender_map
         ):
-            gender = URIRef(f"{WD}{gender_map}")
+            gender = terms.uri(f"{WD}{gender_map}")
         else:
-            gender = Literal(gender)
+            gender = terms.literal(gender)
         g.add(
             (
                 subject_uri,
@@ -364,7 +374,7 @@ def process_entity(
     # Process genres
     for genre in data.get("genres", []):
         if genre_id := genre.get("id"):
-            genre_uri = URIRef(f"https://musicbrainz.org/genre/{genre_id}")
+            genre_uri = terms.uri(f"https://musicbrainz.org/genre/{genre_id}")
             g.add(
                 (
                     subject_uri,
@@ -381,7 +391,7 @@ def process_entity(
                 (
                     subject_uri,
                     entity_mb_schema["label"],
-                    URIRef(f"https://musicbrainz.org/label/{label_id}"),
+                    terms.uri(f"https://musicbrainz.org/label/{label_id}"),
                 )
             )
 
@@ -389,11 +399,11 @@ def process_entity(
     for lang in data.get("languages", []):
         if lang_map := reconciled_mapping.get(lang):
             if matched_wikidata(lang_map):
-                lang = URIRef(f"{WD}{lang_map}")
+                lang = terms.uri(f"{WD}{lang_map}")
             else:
-                lang = Literal(lang_map)
+                lang = terms.literal(lang_map)
         else:
-            lang = Literal(lang)
+            lang = terms.literal(lang)
         g.add(
             (
                 subject_uri,
@@ -410,7 +420,7 @@ def process_entity(
                 (
                     subject_uri,
                     entity_mb_schema["length"],
-                    Literal(str(length_seconds), datatype=XSD.decimal),
+                    terms.literal(str(length_seconds), datatype=XSD.decimal),
                 )
             )
         except (ValueError, TypeError):
@@ -470,7 +480,7 @@ def process_entity(
                     (
                         subject_uri,
                         entity_mb_schema["recording"],
-                        URIRef(f"https://musicbrainz.org/recording/{recording_id}"),
+                        terms.uri(f"https://musicbrainz.org/recording/{recording_id}"),
                     )
                 )
                 process_entity(
@@ -488,9 +498,9 @@ def process_entity(
         if (packaging_map := reconciled_mapping.get(packaging)) and matched_wikidata(
             packaging_map
         ):
-            packaging = URIRef(f"{WD}{packaging_map}")
+            packaging = terms.uri(f"{WD}{packaging_map}")
         else:
-            packaging = Literal(packaging)
+            packaging = terms.literal(packaging)
         g.add(
             (
                 subject_uri,
@@ -512,7 +522,7 @@ def process_entity(
             pred_uri = entity_mb_schema["url"]
             if WIKIDATA_REGEX.match(url):
                 # Convert Wikidata URL to URIRef
-                target = URIRef(
+                target = terms.uri(
                     re.sub(
                         r"^https?:\/\/www\.wikidata\.org\/wiki\/(Q\d+)",
                         f"{WD}\\g<1>",
@@ -535,7 +545,7 @@ def process_entity(
             # We need the underscores because the release group field will be `release_group`
             if target_id := relation.get(target_type.replace("-", "_"), {}).get("id"):
                 # If the target is a MusicBrainz entity, create a URIRef
-                target = URIRef(f"{MB}{target_type}/{target_id}")
+                target = terms.uri(f"{MB}{target_type}/{target_id}")
 
         # Handle instrument relationships
         if (
@@ -548,7 +558,7 @@ def process_entity(
                     (
                         subject_uri,
                         entity_mb_schema["instrument"],
-                        MBIN[inst],
+                        terms.uri(f"{MBIN}{inst}"),
                     )
                 )
 
@@ -567,7 +577,7 @@ def process_entity(
                 (
                     subject_uri,
                     entity_mb_schema["area"],
-                    URIRef(f"https://musicbrainz.org/area/{area_id}"),
+                    terms.uri(f"https://musicbrainz.org/area/{area_id}"),
                 )
             )
 
@@ -578,7 +588,9 @@ def process_entity(
                 (
                     subject_uri,
                     entity_mb_schema["release-group"],
-                    URIRef(f"https://musicbrainz.org/release-group/{release_group_id}"),
+                    terms.uri(
+                        f"https://musicbrainz.org/release-group/{release_group_id}"
+                    ),
                 )
             )
 
@@ -587,9 +599,9 @@ def process_entity(
         if (status_map := reconciled_mapping.get(status)) and matched_wikidata(
             status_map
         ):
-            status_rdf = URIRef(f"{WD}{status_map}")
+            status_rdf = terms.uri(f"{WD}{status_map}")
         else:
-            status_rdf = Literal(status)
+            status_rdf = terms.literal(status)
         g.add(
             (
                 subject_uri,
@@ -721,10 +733,16 @@ async def chunk_worker(
 
 
 def merge_subgraph(graph, subgraph):
-    """Merge a subgraph into the main graph."""
+    """
+    Merge a subgraph into the main graph.
+
+    Subgraphs are unpickled from worker processes, so their terms are new objects: the
+    predicates and objects are interned again, so that the main graph keeps a single copy
+    of each repeated term.
+    """
     for s, p, o in subgraph:
         try:
-            graph.add((s, p, o))
+            graph.add((s, terms.intern(p), terms.intern(o)))
         except Exception as e:
             with tqdm.get_lock():
                 tqdm.write(
@@ -1001,6 +1019,9 @@ async def create_graphs(
             chunk_bar.close()
             subgraph_bar.close()
             serialize_bar.close()
+            # Only the merge of subgraphs runs in this process: the counters cover the
+            # terms interned there, not those built by the worker processes
+            print(f"Term cache: {terms.format_cache_info()}")
         except KeyboardInterrupt:
             executor.shutdown(wait=False, cancel_futures=True)
 
@@ -18,6 +18,8 @@ Usage:
         - `<input_folder>` is the path to the folder containing the input CSV files.
         - `<mappings_folder>` is the path to the folder containing the mapping files.
         - `<output_folder>` is the path to the folder where the output RDF files will be saved.
+
+    The `shared/` folder must be on PYTHONPATH, for the rdfconv.terms helpers.
     
     The script can also be run without arguments, in which case it will use default paths.
     The output folder will contain the generated Turtle files named after the file number of the CSV files.
@@ -47,6 +49,7 @@ from isodate.isodates import parse_date
 from tqdm import tqdm
 from rdflib import Graph, URIRef, Literal, Namespace
 from rdflib.namespace import XSD, RDFS, DCTERMS, RDF
+from rdfconv import terms
 
 # Define namespaces
 WDT = Namespace("http://www.wikidata.org/prop/direct/")
@@ -85,9 +88,10 @@ def convert_date(date_str: str) -> Literal:
     """
     try:
         # Validate the date string, and catch any exception that might occur
-        return Literal(parse_date(date_str), datatype=XSD.date)
+        return terms.literal(parse_date(date_str), datatype=XSD.date)
     except (ISO8601Error, ValueError):
-        return Literal(date_str)  # Fallback to a plain literal if conversion fails
+        # Fallback to a plain literal if conversion fails
+        return terms.literal(date_str)
 
 
 def convert_literal(lit: str) -> Literal:
@@ -95,12 +99,12 @@ def convert_literal(lit: str) -> Literal:
     if "^^" in lit and (m := TYPED_PATTERN.match(lit)):
         # Handle literals that contain "^^" but that don't have a datatype
         if not URI_PATTERN.match(m.group(2)):
-            return Literal(lit)
-        return Literal(m.group(1), datatype=m.group(2))
+            return terms.literal(lit)
+        return terms.literal(m.group(1), datatype=m.group(2))
     elif "@" in lit and (m := LANG_PATTERN.match(lit)):
-        return Literal(m.group(1), lang=m.group(2))
+        return terms.literal(m.group(1), lang=m.group(2))
     else:
-        return Literal(lit)
+        return terms.literal(lit)
 
 
 def convert_rdf_object(obj: str) -> URIRef | Literal:
@@ -113,23 +117,23 @@ def convert_rdf_object(obj: str) -> URIRef | Literal:
         if URI_PATTERN.match(obj) and "^^" not in obj:
             if m := WIKIDATA_PATTERN.match(obj):
                 # Convert /wiki/... to /entity/...
-                return WD[m.group(1)]
-            return URIRef(obj)
+                return terms.uri(f"{WD}{m.group(1)}")
+            return terms.uri(obj)
         return convert_literal(obj)
     except ValueError:
-        return Literal(obj)
+        return terms.literal(obj)
 
 
 def process_triple(s, p, o, mapping, roles, old_graph, g):
     """Process a single triple from the file, and add it to the graph."""
-    # Make RDF Objects
-    s_rdf = URIRef(s)
-    p_rdf = URIRef(p)
+    # Make RDF Objects (interned: a subject repeats in every cell of its row)
+    s_rdf = terms.uri(s)
+    p_rdf = terms.uri(p)
     o_rdf = convert_rdf_object(o)
     p_map = mapping.get(p, None)
 
     if p_rdf == RDF.type:
-        g.add((s_rdf, RDF.type, LMRISM[o.removeprefix(str(RISM_API))]))
+        g.add((s_rdf, RDF.type, terms.uri(f"{LMRISM}{o.removeprefix(str(RISM_API))}")))
 
     elif p_rdf == RISM_API["hasEncoding"]:
         if not isinstance(o_rdf, URIRef) or not p_map:
@@ -271,6 +275,8 @@ def process_file(path, mapping, roles, output_file, namespaces):
             g.serialize(f, format="turtle", encoding="utf-8")
         with tqdm.get_lock():
             tqdm.write(f"Finished processing {path} to {output_file}")
+            # The counters cover every file converted so far by this worker process
+            tqdm.write(f"Term cache: {terms.format_cache_info()}")
     except Exception as e:
         with tqdm.get_lock():
             tqdm.write(f"Error serializing graph: {type(e).__name__}: {e}")
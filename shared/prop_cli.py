@@ -5,12 +5,26 @@ Supports:
 - Basic and fuzzy search of Wikidata entities (items and properties).
 - Finding forward/backward relationships (predicates) between two entities.
 - Listing all predicates (forward and backward) associated with a single entity.
+
+Set the `WIKIDATA_CACHE` environment variable to an SQLite file to cache Wikidata responses
+between sessions (see `wikidata_utils.cache`). Set `WIKIDATA_RECORD` or `WIKIDATA_REPLAY` to
+record the responses to a fixture archive, or to replay them offline (see
+`wikidata_utils.fixtures`). Set `WIKIDATA_METRICS` to a JSON file to receive the request
+metrics of the session (see `wikidata_utils.metrics`).
 """
 
 import asyncio
+import os
 import readline  # type: ignore[import-untyped]
-import aiohttp
-from wikidata_utils import WikidataAPIClient, build_wd_hyperlink, extract_wd_id
+from typing import TYPE_CHECKING
+from wikidata_utils import build_wd_hyperlink, extract_wd_id
+from wikidata_utils.cache import ResponseCache
+from wikidata_utils.fixtures import transport_from_env
+from wikidata_utils.metrics import METRICS_ENV_VAR
+
+if TYPE_CHECKING:
+    import aiohttp
+    from wikidata_utils import WikidataAPIClient
 
 
 def print_heading(title: str) -> None:
@@ -36,7 +50,7 @@ def print_separator() -> None:
 
 async def lookup_term(
     term: str,
-    client: WikidataAPIClient,
+    client: "WikidataAPIClient",
 ) -> str | None:
     """
     Attempt to resolve a search term to a Wikidata QID.
@@ -67,7 +81,7 @@ async def lookup_term(
         return None
 
 
-async def find_relation(client: WikidataAPIClient, term1: str, term2: str) -> None:
+async def find_relation(client: "WikidataAPIClient", term1: str, term2: str) -> None:
     """
     Print all Wikidata triples connecting two entities:
     - Forward (term1 → term2)
@@ -136,7 +150,7 @@ async def find_relation(client: WikidataAPIClient, term1: str, term2: str) -> No
     print_separator()
 
 
-async def find_all_predicates(client: WikidataAPIClient, term: str) -> None:
+async def find_all_predicates(client: "WikidataAPIClient", term: str) -> None:
     """
     Print all forward and backward predicates associated with a given entity.
 
@@ -217,7 +231,7 @@ async def find_all_predicates(client: WikidataAPIClient, term: str) -> None:
 
 
 async def basic_search(
-    client: WikidataAPIClient, term: str, entity_type: str = "property"
+    client: "WikidataAPIClient", term: str, entity_type: str = "property"
 ) -> None:
     """
     Print Wikidata entities/properties matching a given search term.
@@ -294,8 +308,12 @@ async def main():
 
     'exit' or 'quit': End the session.
     """
-    async with aiohttp.ClientSession() as session:
-        client = WikidataAPIClient(session)
+    # aiohttp is imported when the first command is entered, so that the prompt shows up
+    # without waiting for it
+    session: "aiohttp.ClientSession | None" = None
+    cache = ResponseCache.from_env()
+    transport = transport_from_env()
+    try:
         while True:
             user_input = input(
                 "\033[91mEnter a term, two terms (comma-separated), or a flag (--q, --r), or 'exit': \033[0m"
@@ -305,7 +323,14 @@ async def main():
                 print("Exiting...")
                 break
 
-            elif user_input.startswith("--r"):
+            if session is None:
+                import aiohttp
+                from wikidata_utils import WikidataAPIClient
+
+                session = aiohttp.ClientSession()
+                client = WikidataAPIClient(session, cache=cache, transport=transport)
+
+            if user_input.startswith("--r"):
                 term = user_input[3:].strip()
                 if not term:
                     print("Please provide a search term after --r")
@@ -333,6 +358,15 @@ async def main():
                 print(
                     "Examples: 'paris', 'paris, france', '--r paris', '--q france', or 'exit'"
                 )
+    finally:
+        if session is not None:
+            await session.close()
+            if metrics_file := os.environ.get(METRICS_ENV_VAR):
+                client.metrics.dump(metrics_file)
+        if cache is not None:
+            cache.close()
+        if transport is not None:
+            transport.close()
 
 
 if __name__ == "__main__":
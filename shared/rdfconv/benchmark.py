@@ -0,0 +1,444 @@
+"""
+Synthetic-data benchmark for the general RDF conversion script.
+
+This script generates OpenRefine-style CSV files (record mode: a PRIMARY_KEY value starts a
+record, followed by continuation rows with an empty PRIMARY_KEY) together with a matching
+TOML config that uses every kind of column mapping: plain predicates, `lang`, `datatype`,
+`prefix`, `subj`, `type`, and both vectorized and row-by-row `if` conditions.
+
+Each benchmark case converts the generated table with one engine and reports, for each
+phase of the conversion (see `rdfconv.stats.PHASES`), the time spent and the peak resident
+memory (RSS), along with the overall rows/sec and triples/sec. Every case runs in a fresh
+process, so that memory peaks of one case do not hide those of the next.
+
+Engines:
+    - `graph`: in-memory rdflib graph serialized to Turtle (`build_rdf_graph`)
+    - `oxigraph`: graph kept in an on-disk Oxigraph store (`graph_store = "oxigraph"`)
+    - `turtle`: streaming Turtle writer (`stream_rdf` with `TurtleWriter`)
+    - `ntriples`: streaming N-Triples writer (`stream_rdf` with `NTriplesWriter`)
+
+Results are printed as a table and can be written as JSON with `--output`, so that runs
+before and after a change can be compared.
+
+Usage:
+
+    python -m rdfconv.benchmark --rows 10000 100000 --engine graph ntriples
+    python -m rdfconv.benchmark --rows 1000000 --null-rate 0.5 --block-length 5 \\
+        --output benchmark.json
+"""
+
+import argparse
+import json
+import logging
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+import numpy as np
+import pandas as pd
+import tomli_w
+from rdfconv.convert import (
+    OUTPUT_FORMATS,
+    build_rdf_graph,
+    create_graph,
+    rdf_process_predicates,
+    stream_rdf,
+)
+from rdfconv.stats import ConversionStats, PHASES
+from rdfconv.writers import NTriplesWriter, TurtleWriter
+
+logger = logging.getLogger(__name__)
+if not logger.hasHandlers():
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+ENGINES = ("graph", "oxigraph", "turtle", "ntriples")
+# Engines that build a graph before serializing it
+GRAPH_ENGINES = ("graph", "oxigraph")
+# Name of the generated table (and CSV file)
+TABLE_NAME = "records"
+# Interval between two RSS samples, in seconds
+RSS_SAMPLE_INTERVAL = 0.005
+# Fraction of dates that are not valid ISO dates, as found in real sources
+INVALID_DATE_RATE = 0.01
+
+NAMESPACES = {
+    "wd": "http://www.wikidata.org/entity/",
+    "wdt": "http://www.wikidata.org/prop/direct/",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    "ex": "https://example.org/record/",
+}
+
+# Column mappings of the generated table
+TABLE_CONFIG = {
+    "PRIMARY_KEY": "id",
+    "id": {"type": "wd:Q2188189"},
+    "name": {"pred": "rdfs:label", "lang": "en"},
+    "date": {"pred": "P577", "datatype": "xsd:date"},
+    "code": {"pred": "P217", "prefix": "ex"},
+    "genre": {"pred": "P136", "type": "wd:Q188451"},
+    "work": {"pred": "P361"},
+    "work_title": {"pred": "rdfs:label", "lang": "fr", "subj": "work"},
+    "performer": {"pred": "P175", "if": "isinstance(obj, URIRef)"},
+    "note": {"pred": "P2916", "if": "row['genre'] is not None and len(obj) > 8"},
+}
+
+
+def current_rss() -> int:
+    """
+    Return the resident memory of the current process, in bytes.
+
+    Reads `/proc/self/statm` where available (Linux); elsewhere, falls back to the peak
+    RSS reported by `getrusage`, which never decreases.
+    """
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class PhaseProfiler(ConversionStats):
+    """
+    Conversion statistics that also record the peak RSS reached during each phase.
+
+    A background thread samples the RSS every `RSS_SAMPLE_INTERVAL` seconds while a phase
+    is running.
+
+    Attributes:
+        peak_rss (dict[str, int]): Peak RSS of each phase, in bytes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.peak_rss: dict[str, int] = dict.fromkeys(PHASES, 0)
+        self._peak = 0
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, daemon=True)
+        self._sampler.start()
+
+    def _sample(self) -> None:
+        while not self._stop.wait(RSS_SAMPLE_INTERVAL):
+            self._peak = max(self._peak, current_rss())
+
+    def stop(self) -> None:
+        """Stop the sampling thread."""
+        self._stop.set()
+        self._sampler.join()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self._peak = current_rss()
+        with super().phase(name):
+            yield
+        self._peak = max(self._peak, current_rss())
+        self.peak_rss[name] = max(self.peak_rss[name], self._peak)
+
+
+def generate_table(
+    rows: int,
+    cardinality: float,
+    null_rate: float,
+    block_length: float,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Generate a synthetic OpenRefine record-mode export.
+
+    Records have a geometric number of rows with mean `block_length`; only their first row
+    holds the PRIMARY_KEY and the single-valued columns, while multi-valued columns
+    (`genre`, `performer`, `note`) can have a value on every row.
+
+    Args:
+        rows (int): Number of rows.
+        cardinality (float): Number of distinct values of each column, as a fraction of the
+            number of rows (at least one value).
+        null_rate (float): Fraction of empty cells in each column (besides the empty cells
+            of continuation rows).
+        block_length (float): Mean number of rows per record (1 means no continuation
+            rows).
+        seed (int): Seed of the random generator.
+
+    Returns:
+        pd.DataFrame: The table, with string values and NaN for empty cells.
+    """
+    rng = np.random.default_rng(seed)
+    distinct = max(1, int(rows * cardinality))
+
+    # == Record structure ==
+    lengths = rng.geometric(1 / max(block_length, 1), size=rows)
+    starts = np.zeros(rows, dtype=bool)
+    starts[np.minimum(np.cumsum(lengths) - lengths, rows - 1)] = True
+    starts[0] = True
+    record_ids = np.cumsum(starts)
+
+    def pool(values: list[str]) -> np.ndarray:
+        return np.array(values, dtype=object)
+
+    def sample(values: np.ndarray, first_row_only: bool = False) -> np.ndarray:
+        column = values[rng.integers(0, len(values), size=rows)]
+        empty = rng.random(rows) < null_rate
+        if first_row_only:
+            empty |= ~starts
+        column[empty] = None
+        return column
+
+    qids = pool([f"Q{1_000_000 + i}" for i in range(distinct)])
+    dates = pool(
+        [
+            str(np.datetime64("1900-01-01") + int(day))
+            for day in rng.integers(0, 45_000, size=distinct)
+        ]
+    )
+    invalid = rng.random(distinct) < INVALID_DATE_RATE
+    dates[invalid] = [f"{date[:4]}?" for date in dates[invalid]]
+    # Half of the performers are reconciled (QIDs), the other half are plain names
+    performers = pool(
+        [f"Q{2_000_000 + i}" if i % 2 else f"Performer {i}" for i in range(distinct)]
+    )
+
+    table = {
+        "id": np.where(starts, [f"Q{3_000_000 + i}" for i in record_ids], None),
+        "name": sample(pool([f"Name {i}" for i in range(distinct)]), True),
+        "date": sample(dates, True),
+        "code": sample(pool([str(100_000 + i) for i in range(distinct)]), True),
+        "genre": sample(qids),
+        "work": sample(pool([f"Q{4_000_000 + i}" for i in range(distinct)]), True),
+        "work_title": sample(pool([f"Titre {i}" for i in range(distinct)]), True),
+        "performer": sample(performers),
+        "note": sample(pool([f"Note {'x' * (i % 12)}" for i in range(distinct)])),
+    }
+    return pd.DataFrame(table)
+
+
+def write_dataset(folder: Path, df: pd.DataFrame, engine: str) -> dict[str, dict]:
+    """
+    Write a generated table and its TOML config to a folder.
+
+    Args:
+        folder (Path): The folder to write to.
+        df (pd.DataFrame): The generated table.
+        engine (str): The engine the config is written for.
+
+    Returns:
+        dict: The raw config, as it would be read from the TOML file.
+    """
+    csv_folder = folder / "csv"
+    csv_folder.mkdir(parents=True, exist_ok=True)
+    df.to_csv(csv_folder / f"{TABLE_NAME}.csv", index=False)
+    general = {
+        "name": "benchmark",
+        # Absolute paths are not affected by the script-relative resolution
+        "csv_folder": str(csv_folder.resolve()),
+        "rdf_output_folder": str(folder.resolve()),
+        "test_mode": False,
+    }
+    if engine == "oxigraph":
+        general["graph_store"] = "oxigraph"
+    elif engine not in GRAPH_ENGINES:
+        general["streaming"] = True
+        general["output_format"] = engine
+    config = {"general": general, "namespaces": NAMESPACES, TABLE_NAME: TABLE_CONFIG}
+    with open(folder / "benchmark.toml", "wb") as f:
+        tomli_w.dump(config, f)
+    return config
+
+
+def run_case(case: dict[str, Any]) -> dict[str, Any]:
+    """
+    Generate the data of a benchmark case, convert it, and measure each phase.
+
+    This function runs in a dedicated worker process.
+
+    Args:
+        case (dict): The case parameters: "engine", "rows", "cardinality", "null_rate",
+            "block_length" and "seed".
+
+    Returns:
+        dict: The case parameters followed by its measurements.
+    """
+    engine = case["engine"]
+    df = generate_table(
+        case["rows"],
+        case["cardinality"],
+        case["null_rate"],
+        case["block_length"],
+        case["seed"],
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder = Path(tmp_dir)
+        config = write_dataset(folder, df, engine)
+        del df
+        baseline_rss = current_rss()
+        start = time.perf_counter()
+        processed_config = rdf_process_predicates(config)
+        profiler = PhaseProfiler()
+        output_path = (folder / "benchmark").with_suffix(
+            OUTPUT_FORMATS["turtle" if engine in GRAPH_ENGINES else engine]
+        )
+        try:
+            if engine in GRAPH_ENGINES:
+                store_path = folder / "store" if engine == "oxigraph" else None
+                graph = build_rdf_graph(
+                    processed_config, profiler, create_graph(NAMESPACES, store_path)
+                )
+                with profiler.phase("serialize"):
+                    graph.serialize(
+                        destination=output_path,
+                        format="ox-turtle" if store_path else "turtle",
+                    )
+                output_triples = len(graph)
+                if store_path:
+                    graph.close()
+                del graph
+            else:
+                writer_class = TurtleWriter if engine == "turtle" else NTriplesWriter
+                # Written triples: streaming writers only deduplicate within a chunk
+                output_triples = stream_rdf(
+                    processed_config, writer_class(output_path, NAMESPACES), profiler
+                )
+        finally:
+            profiler.stop()
+        elapsed = time.perf_counter() - start
+        output_bytes = output_path.stat().st_size
+
+    rows = profiler.tables[TABLE_NAME]["rows"]
+    triples = profiler.triple_count
+    return {
+        **case,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round(rows / elapsed, 1),
+        "triples": triples,
+        "output_triples": output_triples,
+        "triples_per_sec": round(triples / elapsed, 1),
+        "output_bytes": output_bytes,
+        "baseline_rss_mb": round(baseline_rss / 2**20, 1),
+        "phases": {
+            name: {
+                "seconds": round(profiler.phases[name], 3),
+                "peak_rss_mb": round(profiler.peak_rss[name] / 2**20, 1),
+            }
+            for name in PHASES
+        },
+    }
+
+
+def format_results(results: list[dict[str, Any]]) -> str:
+    """Format benchmark results as a plain-text table."""
+    header = ["engine", "rows", "seconds", "rows/s", "triples/s"]
+    header += [f"{name} (s / MB)" for name in PHASES]
+    lines = [header]
+    for result in results:
+        line = [
+            result["engine"],
+            str(result["rows"]),
+            f"{result['seconds']:.2f}",
+            f"{result['rows_per_sec']:.0f}",
+            f"{result['triples_per_sec']:.0f}",
+        ]
+        line += [
+            f"{phase['seconds']:.2f} / {phase['peak_rss_mb']:.0f}"
+            for phase in result["phases"].values()
+        ]
+        lines.append(line)
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(line, widths))
+        for line in lines
+    )
+
+
+def main():
+    """
+    Main entry point of the benchmark.
+
+    Runs every combination of `--rows` and `--engine` (`--repeat` times each), prints the
+    results, and writes them as JSON if `--output` is given.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the CSV to RDF converter on synthetic data."
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000],
+        help="Number of CSV rows of each case (default: 10000 100000)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        nargs="+",
+        default=list(ENGINES),
+        help="Conversion engines to benchmark (default: all)",
+    )
+    parser.add_argument(
+        "--cardinality",
+        type=float,
+        default=0.1,
+        help="Distinct values per column, as a fraction of the rows (default: 0.1)",
+    )
+    parser.add_argument(
+        "--null-rate",
+        type=float,
+        default=0.2,
+        help="Fraction of empty cells in each column (default: 0.2)",
+    )
+    parser.add_argument(
+        "--block-length",
+        type=float,
+        default=3.0,
+        help="Mean number of rows per OpenRefine record (default: 3)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Runs of each case (default: 1)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument(
+        "--output", type=str, help="Path of a JSON file to write the results to"
+    )
+    args = parser.parse_args()
+    if not 0 < args.cardinality <= 1:
+        parser.error("--cardinality must be in (0, 1]")
+    if not 0 <= args.null_rate < 1:
+        parser.error("--null-rate must be in [0, 1)")
+    if args.block_length < 1:
+        parser.error("--block-length must be at least 1")
+
+    # The converter logs every table it processes
+    logging.getLogger("rdfconv.convert").setLevel(logging.WARNING)
+    results = []
+    for rows in args.rows:
+        for engine in args.engine:
+            case = {
+                "engine": engine,
+                "rows": rows,
+                "cardinality": args.cardinality,
+                "null_rate": args.null_rate,
+                "block_length": args.block_length,
+                "seed": args.seed,
+            }
+            for _ in range(args.repeat):
+                logger.info("Running %s on %d rows...", engine, rows)
+                # A fresh process per run isolates memory peaks
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    results.append(executor.submit(run_case, case).result())
+
+    print(format_results(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"python": sys.version.split()[0], "results": results}, f, indent=2
+            )
+        logger.info("Results saved to: %s", args.output)
+
+
+if __name__ == "__main__":
+    main()
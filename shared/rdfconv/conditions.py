@@ -0,0 +1,225 @@
+"""
+Compilation of the `if` conditions found in RDF config files.
+
+An `if` condition is a Python expression evaluated with the variables `subj`, `obj` and
+`row` (see the config syntax guide in `doc/rdf_conversion/`). Conditions are compiled once
+when the config is loaded instead of being re-parsed for every cell.
+
+Conditions that only test `subj`/`obj` against None, `URIRef` or `Literal` are also
+translated into a small "vector plan", which is evaluated on whole columns at once:
+
+    isinstance(obj, Literal)
+    subj is not None and not isinstance(obj, URIRef)
+    isinstance(obj, (URIRef, Literal)) or obj == None
+
+Any other expression (string methods, `row` lookups, etc.) is evaluated row by row with the
+compiled code object.
+"""
+
+import ast
+from typing import Any
+import numpy as np
+from rdflib import URIRef, Literal
+
+# Names available to every condition, in addition to `subj`, `obj` and `row`
+CONDITION_GLOBALS = {"URIRef": URIRef, "Literal": Literal, "None": None}
+
+# Classes that a vectorized isinstance() test may refer to
+_VECTOR_CLASSES = {"URIRef": URIRef, "Literal": Literal}
+# Variables that a vectorized condition may refer to
+_VECTOR_VARS = ("subj", "obj")
+
+
+class Condition:
+    """
+    An `if` condition of an RDF config, compiled once.
+
+    Attributes:
+        expr (str): The original expression, as written in the config.
+        code (CodeType): The compiled expression.
+        plan (tuple | None): The vector plan of the expression, or None if the expression
+            must be evaluated row by row.
+        uses_row (bool): Whether the expression refers to the `row` variable.
+    """
+
+    __slots__ = ("expr", "code", "plan", "uses_row")
+
+    def __init__(self, expr: str):
+        """
+        Compile a condition expression.
+
+        Args:
+            expr (str): The Python expression to compile.
+
+        Raises:
+            SyntaxError: If the expression is not a valid Python expression.
+        """
+        self.expr = expr
+        tree = ast.parse(expr.strip(), mode="eval")
+        self.code = compile(tree, f"<if: {expr}>", "eval")
+        self.plan = _vector_plan(tree.body)
+        self.uses_row = "row" in self.code.co_names
+
+    def __str__(self) -> str:
+        return self.expr
+
+    def __reduce__(self):
+        # Code objects cannot be pickled: recompile when sent to another process
+        return (Condition, (self.expr,))
+
+    def __repr__(self) -> str:
+        return f"Condition({self.expr!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Condition) and other.expr == self.expr
+
+    def __hash__(self) -> int:
+        return hash(self.expr)
+
+    def evaluate(self, subj: Any, obj: Any, row: Any = None) -> bool:
+        """
+        Evaluate the condition for a single row.
+
+        Args:
+            subj: The subject node of the triple.
+            obj: The object node of the triple.
+            row: The CSV row, as a pandas Series indexed by column name.
+
+        Returns:
+            bool: Whether the triple should be created.
+        """
+        return bool(
+            eval(  # pylint: disable=eval-used
+                self.code, CONDITION_GLOBALS, {"subj": subj, "obj": obj, "row": row}
+            )
+        )
+
+    def mask(
+        self,
+        subjects: np.ndarray,
+        objects: np.ndarray,
+        memo: dict | None = None,
+    ) -> np.ndarray:
+        """
+        Evaluate a vectorizable condition on whole columns.
+
+        Args:
+            subjects (np.ndarray): Object array of subject nodes (or None).
+            objects (np.ndarray): Object array of object nodes (or None), aligned with
+                `subjects`.
+            memo (dict, optional): Cache of elementary tests, shared between the
+                conditions of one table so that a test such as `isinstance(subj, URIRef)`
+                on the PRIMARY_KEY column is only computed once.
+
+        Returns:
+            np.ndarray: Boolean mask, True where the triple should be created.
+
+        Raises:
+            ValueError: If the condition has no vector plan.
+        """
+        if self.plan is None:
+            raise ValueError(f"Condition '{self.expr}' cannot be vectorized.")
+        arrays = {"subj": subjects, "obj": objects}
+        memo = {} if memo is None else memo
+        return _eval_plan(self.plan, arrays, memo, len(objects))
+
+
+def _vector_plan(node: ast.AST) -> tuple | None:
+    """
+    Translate an expression AST into a vector plan, or return None if the expression uses
+    anything other than None/type tests on `subj` and `obj`.
+
+    Plans are nested tuples:
+        ("const", bool)
+        ("truthy", var)
+        ("none", var)
+        ("isinstance", var, (class name, ...))
+        ("not", plan)
+        ("and", (plan, ...)) / ("or", (plan, ...))
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, bool):
+        return ("const", node.value)
+    if isinstance(node, ast.Name) and node.id in _VECTOR_VARS:
+        return ("truthy", node.id)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        inner = _vector_plan(node.operand)
+        return ("not", inner) if inner else None
+    if isinstance(node, ast.BoolOp):
+        parts = tuple(_vector_plan(value) for value in node.values)
+        if any(part is None for part in parts):
+            return None
+        return ("and" if isinstance(node.op, ast.And) else "or", parts)
+    if isinstance(node, ast.Compare) and len(node.ops) == 1:
+        # `x is None`, `x is not None`, `x == None`, `x != None` (either side)
+        left, right = node.left, node.comparators[0]
+        if _is_none(right) and isinstance(left, ast.Name):
+            var = left.id
+        elif _is_none(left) and isinstance(right, ast.Name):
+            var = right.id
+        else:
+            return None
+        if var not in _VECTOR_VARS:
+            return None
+        # RDF nodes never compare equal to None, so `==` behaves like `is`
+        if isinstance(node.ops[0], (ast.Is, ast.Eq)):
+            return ("none", var)
+        if isinstance(node.ops[0], (ast.IsNot, ast.NotEq)):
+            return ("not", ("none", var))
+        return None
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "isinstance"
+        and len(node.args) == 2
+        and not node.keywords
+    ):
+        var, classes = node.args
+        if not (isinstance(var, ast.Name) and var.id in _VECTOR_VARS):
+            return None
+        class_nodes = classes.elts if isinstance(classes, ast.Tuple) else [classes]
+        names = []
+        for class_node in class_nodes:
+            if not (
+                isinstance(class_node, ast.Name) and class_node.id in _VECTOR_CLASSES
+            ):
+                return None
+            names.append(class_node.id)
+        return ("isinstance", var.id, tuple(sorted(names)))
+    return None
+
+
+def _is_none(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and node.value is None
+
+
+def _eval_plan(plan: tuple, arrays: dict, memo: dict, size: int) -> np.ndarray:
+    """Evaluate a vector plan on the `subj`/`obj` arrays."""
+    kind = plan[0]
+    if kind == "const":
+        return np.full(size, plan[1], dtype=bool)
+    if kind == "not":
+        return ~_eval_plan(plan[1], arrays, memo, size)
+    if kind in ("and", "or"):
+        results = [_eval_plan(part, arrays, memo, size) for part in plan[1]]
+        combine = np.logical_and if kind == "and" else np.logical_or
+        return combine.reduce(results)
+
+    # Elementary tests are cached per array, since the same column is often tested by
+    # several conditions of a table
+    values = arrays[plan[1]]
+    key = (id(values),) + plan[:1] + plan[2:]
+    if key not in memo:
+        if kind == "truthy":
+            result = values.astype(bool)
+        elif kind == "none":
+            result = np.equal(values, None)
+        else:
+            classes = tuple(_VECTOR_CLASSES[name] for name in plan[2])
+            result = np.fromiter(
+                (isinstance(value, classes) for value in values),
+                dtype=bool,
+                count=len(values),
+            )
+        # Keep a reference to the array so that its id cannot be reused while cached
+        memo[key] = (values, result)
+    return memo[key][1]
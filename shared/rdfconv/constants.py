@@ -0,0 +1,25 @@
+"""
+Constants shared by the RDF conversion script and the CSV profiler.
+
+They live in their own module so that `rdfconv.csvprofile` (imported by `rdfconv.tomlgen`)
+does not need to import the converter and its dependencies.
+"""
+
+# Cell values read as empty in CSV files
+NA_VALUES = [
+    "",  # Empty string
+    " ",  # Space
+    "NA",  # Capitalized NA
+    "N/A",  # Common spreadsheet notation
+    "na",  # lowercase
+    "n/a",  # lowercase
+    "-",  # Often used to indicate "no data"
+    "--",  # Sometimes double-dash
+    "None",  # Pythonic
+    "none",  # lowercase variant
+    "NULL",  # SQL style
+    "null",  # lowercase
+    "NaN",  # Python/NumPy/Pandas
+    "nan",  # lowercase
+    "?",  # Occasionally used for unknowns
+]
@@ -10,20 +10,40 @@ for loading into a triple store.
 """
 
 import time
+import tempfile
+import shutil
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Union, Any
+from typing import Union, Any, Iterator
 import logging
 from urllib.parse import quote
 import argparse
+import numpy as np
 import pandas as pd
 import tomli
 from tqdm import tqdm
 from rdflib import Graph, URIRef, Literal, Namespace, XSD, RDF
+from rdflib.plugin import PluginException
 from isodate.isoerror import ISO8601Error
 from isodate.isodates import parse_date
 from isodate.isodatetime import parse_datetime
 from wikidata_utils import extract_wd_id
-
+from rdfconv import terms
+from rdfconv.conditions import Condition
+from rdfconv.constants import NA_VALUES
+from rdfconv.manifest import BuildManifest
+from rdfconv.stats import ConversionStats
+from rdfconv.writers import (
+    COMPRESSIONS,
+    TripleWriter,
+    TurtleWriter,
+    NTriplesWriter,
+    write_shard_manifest,
+)
 
 # === Setup Logger ===
 logger = logging.getLogger(__name__)
@@ -33,6 +53,24 @@ if not logger.hasHandlers():
 # === Suppress rdflib Warnings ===
 logging.getLogger("rdflib").setLevel(logging.ERROR)
 
+# Supported values of `output_format` in [general], with their file extension
+OUTPUT_FORMATS = {"turtle": ".ttl", "ntriples": ".nt"}
+# Supported values of `graph_store` in [general]
+GRAPH_STORES = ("memory", "oxigraph", "auto")
+# With `graph_store = "auto"`, CSV folders bigger than this (in bytes) use an Oxigraph store
+GRAPH_STORE_CUTOFF = 1_000_000_000
+# Folder of `rdf_output_folder` holding the per-table shards of incremental runs
+CACHE_FOLDER = ".rdfconv_cache"
+# Keys allowed in the inline dict of a column
+COLUMN_KEYS = ("pred", "datatype", "lang", "subj", "if", "prefix", "type")
+# Bump when `rdf_process_predicates` or the layout of cached config plans changes, so that
+# plans compiled by an older version of the converter are not reused
+CONFIG_CACHE_VERSION = 1
+# Suffix of the conversion statistics file written next to the output file
+STATS_SUFFIX = ".stats.json"
+# Suffix of the manifest listing the output shards (see `output_options`)
+SHARDS_SUFFIX = ".shards.json"
+
 
 def to_rdf_node(
     val: str,
@@ -43,6 +81,9 @@ def to_rdf_node(
 ) -> Union[URIRef, Literal, None]:
     """
     Convert a value to the appropriate RDF node (URIRef or Literal) for RDF triple creation.
+    Wikidata nodes are interned (see `rdfconv.terms`), so that a QID repeated across
+    columns, tables and chunks gives the same object. Other values are mostly unique
+    (subjects, free text) and are converted once per chunk by `convert_column` already.
 
     - Returns a URIRef if the value is a Wikidata ID, a full URI, or a value with a specified
       prefix.
@@ -64,7 +105,7 @@ def to_rdf_node(
         return None
     qid = extract_wd_id(val)
     if qid:
-        return URIRef(f"{namespaces['wd']}{qid}")
+        return terms.uri(f"{namespaces['wd']}{qid}")
     if val.startswith("http") and datatype not in ("xsd:anyURI", XSD.anyURI):
         try:
             # Attempt to create a URIRef and validate it
@@ -155,6 +196,7 @@ def rdf_process_predicates(
             - Converting the 'pred' key into a URIRef.
             - Expanding 'type' prefixed values into full URIs.
             - Ensuring that 'datatype' and 'lang' are not both specified.
+            - Compiling 'if' expressions into `Condition` objects.
             - Removing any empty fields from the configuration.
         - Ignores entirely empty columns or configurations.
 
@@ -202,15 +244,7 @@ def rdf_process_predicates(
             elif isinstance(col_schema, dict):
                 # Complex config value
                 for key, val in col_schema.items():
-                    if key not in (
-                        "pred",
-                        "datatype",
-                        "lang",
-                        "subj",
-                        "if",
-                        "prefix",
-                        "type",
-                    ):
+                    if key not in COLUMN_KEYS:
                         raise ValueError(
                             f"Config[{file}]: invalid key '{key}' in column '{col}'"
                         )
@@ -239,6 +273,14 @@ def rdf_process_predicates(
                             new_col_schema["type"] = f"{ns_uri}{body}"
                 if "pred" in new_col_schema:
                     new_col_schema["pred"] = to_predicate(new_col_schema["pred"], ns)
+                # Compile the condition once instead of for every row
+                if "if" in new_col_schema:
+                    try:
+                        new_col_schema["if"] = Condition(new_col_schema["if"])
+                    except SyntaxError as e:
+                        raise ValueError(
+                            f"Config[{file}]: invalid 'if' expression in column '{col}': {e.msg}"
+                        ) from e
                 new_file_schema[col] = new_col_schema
             else:
                 raise ValueError(
@@ -250,15 +292,74 @@ def rdf_process_predicates(
     return new_config
 
 
+def convert_column(
+    series: pd.Series,
+    ns: dict,
+    lang: str | None = None,
+    datatype: str | None = None,
+    prefix: str | None = None,
+    cache_stats: dict[str, int] | None = None,
+) -> pd.Series:
+    """
+    Convert a column of raw CSV values to RDF nodes, converting each distinct value once.
+
+    - The column is factorized into integer codes and unique values; `to_rdf_node` is
+      called once per unique value, and the resulting nodes are mapped back onto the rows
+      with the codes.
+    - Empty cells (NaN) become None without calling `to_rdf_node`.
+
+    Args:
+        series (pd.Series): The raw column values.
+        ns (dict): Namespaces from the config.
+        lang (str, optional): Language code passed to `to_rdf_node`.
+        datatype (str, optional): Datatype passed to `to_rdf_node`.
+        prefix (str, optional): Namespace prefix passed to `to_rdf_node`.
+        cache_stats (dict, optional): If provided, "cells" (non-empty values),
+            "conversions" (calls to `to_rdf_node`) and "ill_typed_literals" (cells with a
+            `datatype` whose literal is ill-typed or fell back to a plain literal, e.g. an
+            `xsd:date` of "1685") are incremented in place.
+
+    Returns:
+        pd.Series: The column with values replaced by RDF nodes or None.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    # The last slot of the lookup table holds None, so that the NA code (-1) maps to it
+    lookup = np.empty(len(uniques) + 1, dtype=object)
+    for i, val in enumerate(uniques):
+        lookup[i] = to_rdf_node(val, ns, lang=lang, datatype=datatype, prefix=prefix)
+    lookup[-1] = None
+    if cache_stats is not None:
+        cache_stats["cells"] = cache_stats.get("cells", 0) + int((codes >= 0).sum())
+        cache_stats["conversions"] = cache_stats.get("conversions", 0) + len(uniques)
+        if datatype:
+            # Values that were not converted to a URI but do not fit the datatype
+            ill_typed = [
+                i
+                for i, node in enumerate(lookup[:-1])
+                if isinstance(node, Literal)
+                and (node.datatype is None or node.ill_typed)
+            ]
+            if ill_typed:
+                counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+                cache_stats["ill_typed_literals"] = cache_stats.get(
+                    "ill_typed_literals", 0
+                ) + int(counts[ill_typed].sum())
+    return pd.Series(lookup[codes], index=series.index, name=series.name)
+
+
 def rdf_transform_csv(
-    df: pd.DataFrame, col_mapping: dict[str, str | dict], ns: dict
+    df: pd.DataFrame,
+    col_mapping: dict[str, str | dict],
+    ns: dict,
+    cache_stats: dict[str, int] | None = None,
 ) -> pd.DataFrame:
     """
     Transform values of a DataFrame to RDF nodes based on provided column mappings from the
     config.
 
-    - Applies to_rdf_node for each value, using config info (predicate, datatype, lang,
-      prefix, etc).
+    - Applies to_rdf_node for each distinct value of a column, using config info
+      (predicate, datatype, lang, prefix, etc), and maps the results back onto every row
+      (see `convert_column`).
     - Handles both simple and complex column mappings as described in the config syntax
       guide.
 
@@ -266,6 +367,9 @@ def rdf_transform_csv(
         df (pd.DataFrame): The input DataFrame loaded from a CSV file.
         col_mapping (dict): Mapping of column names to predicate or config dicts.
         ns (dict): Namespaces from the config.
+        cache_stats (dict, optional): Updated in place with the number of converted cells,
+            the number of actual conversions and the number of ill-typed literals (see
+            `convert_column`).
 
     Returns:
         pd.DataFrame: The transformed DataFrame with values as RDF nodes.
@@ -281,24 +385,23 @@ def rdf_transform_csv(
             # mapping is itself a column name in the case of "PRIMARY_KEY"
             if not col_mapping.get(mapping):
                 # Default processing for PRIMARY_KEY column
-                df[mapping] = df[mapping].apply(lambda x: to_rdf_node(x, ns))
+                df[mapping] = convert_column(df[mapping], ns, cache_stats=cache_stats)
                 cols_processed.add(mapping)
                 continue
         elif isinstance(mapping, str) and mapping:
             # Processing all columns with a string value
-            df[column] = df[column].apply(lambda x: to_rdf_node(x, ns))
+            df[column] = convert_column(df[column], ns, cache_stats=cache_stats)
             cols_processed.add(column)
 
         elif isinstance(mapping, dict) and mapping:
             # Processing all columns with an inline dict value
-            df[column] = df[column].apply(
-                lambda x, mapping=mapping: to_rdf_node(
-                    x,
-                    ns,
-                    lang=mapping.get("lang"),
-                    datatype=mapping.get("datatype"),
-                    prefix=mapping.get("prefix"),
-                )
+            df[column] = convert_column(
+                df[column],
+                ns,
+                lang=mapping.get("lang"),
+                datatype=mapping.get("datatype"),
+                prefix=mapping.get("prefix"),
+                cache_stats=cache_stats,
             )
             cols_processed.add(column)
 
@@ -311,14 +414,16 @@ def rdf_transform_csv(
     # Default process for columns only specified as subjects
     for column in subj_columns:
         if column not in cols_processed:
-            df[column] = df[column].apply(lambda x: to_rdf_node(x, ns))
+            df[column] = convert_column(df[column], ns, cache_stats=cache_stats)
             cols_processed.add(column)
         else:
             continue
     return df
 
 
-def fill_down_until_key(df: pd.DataFrame, primary_key: str) -> pd.DataFrame:
+def fill_down_until_key(
+    df: pd.DataFrame, primary_key: str, columns: list[str] | None = None
+) -> pd.DataFrame:
     """
     Fill down all columns in the DataFrame, but only until a non-empty value is encountered
     in the PRIMARY_KEY column.
@@ -327,69 +432,296 @@ def fill_down_until_key(df: pd.DataFrame, primary_key: str) -> pd.DataFrame:
       the user guide.
     - Each block of rows with the same PRIMARY_KEY is filled down from the last non-empty
       value.
+    - Columns are filled one at a time on their underlying arrays: for every row, the last
+      non-empty row of the column is found with a running maximum, and empty cells are only
+      filled if that row belongs to the same block. Neither the DataFrame nor the columns
+      that are not filled are copied.
 
     Args:
         df (pd.DataFrame): The input DataFrame.
         primary_key (str): The column name to use as the block marker for fill-down.
+        columns (list[str], optional): The columns to fill down. Defaults to every column
+            except `primary_key`; columns missing from the DataFrame are ignored.
 
     Returns:
         pd.DataFrame: The DataFrame with fill-down applied.
     """
-    df = df.copy()
-    # Any value not None and not empty string becomes True
-    mask = df[primary_key].notna() & (df[primary_key] != "")
-    group = mask.cumsum()
+    if columns is None:
+        columns = df.columns
+    positions = np.arange(len(df))
+    # Any value not None and not empty string starts a new block
+    keys = df[primary_key]
+    mask = (keys.notna() & (keys != "")).to_numpy()
+    # First row of the block of each row (rows before the first key form block 0)
+    block_start = np.maximum.accumulate(np.where(mask, positions, 0))
 
-    filled_df = df.groupby(group).ffill()
-    # Restore original primary key column to avoid overwriting with filled values
-    filled_df[primary_key] = df[primary_key]
+    filled_df = df.copy(deep=False)
+    for col in columns:
+        # The primary key column itself is never filled
+        if col == primary_key or col not in df.columns:
+            continue
+        series = df[col]
+        valid = series.notna().to_numpy()
+        if valid.all():
+            continue
+        last_valid = np.maximum.accumulate(np.where(valid, positions, -1))
+        fill = ~valid & (last_valid >= block_start)
+        if not fill.any():
+            continue
+        values = series.to_numpy(copy=True)
+        values[fill] = values[last_valid[fill]]
+        filled_df[col] = pd.Series(values, index=df.index, dtype=series.dtype)
 
     return filled_df
 
 
-def build_rdf_graph(
+def fill_down_columns(csv_schema: dict[str, Any]) -> list[str] | None:
+    """
+    Return the columns of a CSV that need to be filled down to produce its triples.
+
+    Args:
+        csv_schema (dict): The processed config table of the CSV file.
+
+    Returns:
+        list[str] | None: The columns mapped in the config and the columns used as
+            subjects, or None (every column) if an `if` condition reads the whole `row`.
+    """
+    columns = []
+    for col, col_value in csv_schema.items():
+        if col == "PRIMARY_KEY":
+            continue
+        columns.append(col)
+        if isinstance(col_value, dict):
+            if subj_col := col_value.get("subj"):
+                columns.append(subj_col)
+            condition = col_value.get("if")
+            if isinstance(condition, str):
+                condition = Condition(condition)
+            if condition is not None and condition.uses_row:
+                return None
+    return list(dict.fromkeys(columns))
+
+
+def read_csv_table(
+    csv_file: Path, chunk_size: int | None = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV file as strings, treating common placeholders (see `NA_VALUES`) as empty.
+
+    Args:
+        csv_file (Path): The CSV file to read.
+        chunk_size (int, optional): If provided, the file is read `chunk_size` rows at a
+            time; otherwise it is read at once.
+
+    Yields:
+        pd.DataFrame: The whole table, or consecutive chunks of it.
+    """
+    read_options = {"dtype": str, "keep_default_na": False, "na_values": NA_VALUES}
+    if not chunk_size:
+        yield pd.read_csv(csv_file, **read_options)
+        return
+    with pd.read_csv(csv_file, chunksize=chunk_size, **read_options) as reader:
+        yield from reader
+
+
+def resolve_csv_folder(config: dict[str, dict]) -> Path:
+    """
+    Resolve the `csv_folder` of a config, relative to the script directory.
+
+    Args:
+        config (dict): The (raw or processed) config dict.
+
+    Returns:
+        Path: The absolute path of the CSV folder.
+
+    Raises:
+        ValueError: If `csv_folder` is missing from `[general]`.
+    """
+    try:
+        rel_inp_dir = Path(config["general"]["csv_folder"])
+    except KeyError as e:
+        raise ValueError(f" {config} is missing required key: {e}") from e
+    script_dir = Path(__file__).parent.resolve()
+    return (script_dir / rel_inp_dir).resolve()
+
+
+def column_nodes(df: pd.DataFrame, column: str | None) -> np.ndarray | None:
+    """
+    Return the values of a DataFrame column as an object array, with NaN replaced by None.
+
+    Args:
+        df (pd.DataFrame): The DataFrame holding RDF nodes.
+        column (str | None): The column to extract.
+
+    Returns:
+        np.ndarray | None: The column values, or None if the column does not exist.
+    """
+    if column is None or column not in df.columns:
+        return None
+    values = df[column].to_numpy(dtype=object, copy=True)
+    values[pd.isna(values)] = None
+    return values
+
+
+def iter_table_triples(
+    df: pd.DataFrame,
+    csv_schema: dict[str, Any],
+    stats: ConversionStats | None = None,
+    csv_name: str = "",
+) -> Iterator[tuple[str, Any, list[tuple]]]:
+    """
+    Generate the RDF triples of a transformed and filled-down DataFrame, one config entry
+    at a time.
+
+    Instead of walking the DataFrame row by row, every config entry is processed as a whole
+    column: subjects, predicate and objects are aligned as arrays, rows without an object
+    (or failing the `if` condition) are filtered out with boolean masks, and the remaining
+    triples are returned in bulk.
+
+    - A row produces a triple only if its subject, predicate and object are all truthy,
+      matching the row-by-row behavior of previous versions.
+    - rdf:type triples are produced for every object that passes the `if` condition.
+    - `if` conditions that only test `subj`/`obj` types are evaluated as column masks;
+      other conditions are evaluated only on rows that have an object.
+
+    Args:
+        df (pd.DataFrame): The DataFrame with values converted to RDF nodes.
+        csv_schema (dict): The processed config table of the CSV file.
+        stats (ConversionStats, optional): If provided, the empty cells, rows without
+            subject and rows filtered out by `if` of each column are counted in it.
+        csv_name (str): The table name under which `stats` are counted.
+
+    Yields:
+        tuple: The column name, its config value and the list of triples it produced.
+    """
+    n_rows = len(df)
+    primary_nodes = column_nodes(df, csv_schema["PRIMARY_KEY"])
+    if primary_nodes is None:
+        primary_nodes = np.full(n_rows, None, dtype=object)
+    rows = None
+    # Elementary tests shared by the vectorized conditions of this table
+    memo = {}
+
+    for col, col_value in csv_schema.items():
+        if col == "PRIMARY_KEY":
+            continue
+        object_nodes = column_nodes(df, col)
+        # == No object value found ==
+        if object_nodes is None:
+            continue
+        mask = pd.notna(object_nodes)
+        if stats is not None:
+            column_stats = stats.column(csv_name, col)
+            column_stats["nulls"] += n_rows - int(mask.sum())
+        rdf_type = None
+        # == Process String Mapping ==
+        if isinstance(col_value, URIRef):
+            subject_nodes = primary_nodes
+            predicate = col_value
+        # == Process Inline Dict Mapping ==
+        elif isinstance(col_value, dict):
+            predicate = col_value.get("pred")
+            subject_nodes = primary_nodes
+            if subj_col := col_value.get("subj"):
+                subject_nodes = column_nodes(df, subj_col)
+                if subject_nodes is None:
+                    subject_nodes = np.full(n_rows, None, dtype=object)
+            if condition := col_value.get("if"):
+                candidates = int(mask.sum())
+                if not isinstance(condition, Condition):
+                    condition = Condition(condition)
+                if condition.plan is not None:
+                    mask &= condition.mask(subject_nodes, object_nodes, memo)
+                else:
+                    if condition.uses_row and rows is None:
+                        # `row` is exposed to conditions as a pandas Series, with
+                        # None for empty cells, as `df.iterrows()` used to yield it
+                        rows = df.astype(object).where(df.notna(), None)
+                    for i in np.flatnonzero(mask):
+                        mask[i] = condition.evaluate(
+                            subject_nodes[i],
+                            object_nodes[i],
+                            rows.iloc[i] if rows is not None else None,
+                        )
+                if stats is not None:
+                    column_stats["filtered"] += candidates - int(mask.sum())
+            rdf_type = col_value.get("type")
+        else:
+            continue
+
+        triples = []
+        if rdf_type:
+            type_node = terms.uri(rdf_type)
+            triples.extend((o, RDF.type, type_node) for o in object_nodes[mask])
+        if predicate:
+            if stats is not None:
+                column_stats["missing_subjects"] += int(
+                    (mask & ~subject_nodes.astype(bool)).sum()
+                )
+            mask &= subject_nodes.astype(bool) & object_nodes.astype(bool)
+            triples.extend(
+                zip(subject_nodes[mask], repeat(predicate), object_nodes[mask])
+            )
+        yield col, col_value, triples
+
+
+def iter_rdf_triples(
     config: dict[str, dict],
-) -> Graph:
+    stats: ConversionStats | None = None,
+) -> Iterator[tuple[str, str, Any, list[tuple]]]:
     """
-    Build an RDF graph from CSV files and a processed config dict.
+    Generate the RDF triples of every CSV file listed in a processed config dict.
 
     For each CSV listed in the config:
         - convert all values to RDF nodes (URIRef or Literal)
         - applies fill-down
         - generates RDF triples according to config mapping.
     - Handles both test mode and full conversion.
+    - If `chunk_size` is set in `[general]`, CSVs are read `chunk_size` rows at a time.
+      The last filled-down row of each chunk is carried into the next one, so that a
+      record split across two chunks is filled down exactly as if the CSV had been read
+      at once.
     - Adds rdf:type triples for columns with a 'type' key.
     - Add prefixes to column with `prefix` key
+    - Triples are emitted column by column (see `iter_table_triples`).
+    - If `stats` is provided, rows, triples and conversions are counted in it, and the
+      time spent reading, transforming, filling down and emitting is recorded.
 
     Args:
         config (dict): The processed config dict with predicates/types resolved to RDF URIs
             and objects.
+        stats (ConversionStats, optional): Statistics updated in place.
 
-    Returns:
-        Graph: The constructed RDFLib Graph containing all triples.
+    Yields:
+        tuple: The CSV table name, the column name, its config value, and the list of
+            triples produced by that column.
 
     Raises:
-        ValueError: If required config fields are missing or if triple creation fails.
+        ValueError: If required config fields are missing.
     """
     try:
         rdf_ns = config["namespaces"]
-        rel_inp_dir = Path(config["general"]["csv_folder"])
     except KeyError as e:
         raise ValueError(f" {config} is missing required key: {e}") from e
-    # === Initialize RDF Graph ===
-    graph = Graph()
-    # === Bind Namespaces ===
-    for prefix, ns in rdf_ns.items():
-        graph.bind(prefix, Namespace(ns))
 
     # === Resolve CSV Folder Path ===
-    script_dir = Path(__file__).parent.resolve()
-    csv_folder = (script_dir / rel_inp_dir).resolve()
+    csv_folder = resolve_csv_folder(config)
     # === Check for Test Mode ===
     # If test_mode is set to True, only sample up to 20 rows per CSV
     test_mode = config["general"].get("test_mode")
     if test_mode is True:
         logger.info("Running in test mode — sampling up to 20 rows per CSV file.")
+    # === Check for Chunked Reading ===
+    # If chunk_size is set, CSVs are read and converted chunk_size rows at a time
+    chunk_size = config["general"].get("chunk_size")
+    if chunk_size is not None and (
+        not isinstance(chunk_size, int)
+        or isinstance(chunk_size, bool)
+        or chunk_size < 1
+    ):
+        raise ValueError(f"'chunk_size' must be a positive integer, got {chunk_size!r}")
+    if stats is None:
+        stats = ConversionStats()
     # === Opening csv files ===
     for csv_name, csv_schema in config.items():
         # "general" and "namespaces" are not CSV files
@@ -400,95 +732,596 @@ def build_rdf_graph(
         if not csv_file.exists():
             logger.warning("'%s' not found. Skipping.", csv_file)
             continue
-        try:
-            df = pd.read_csv(
-                csv_file,
-                dtype=str,
-                keep_default_na=False,
-                na_values=[
-                    "",  # Empty string
-                    " ",  # Space
-                    "NA",  # Capitalized NA
-                    "N/A",  # Common spreadsheet notation
-                    "na",  # lowercase
-                    "n/a",  # lowercase
-                    "-",  # Often used to indicate "no data"
-                    "--",  # Sometimes double-dash
-                    "None",  # Pythonic
-                    "none",  # lowercase variant
-                    "NULL",  # SQL style
-                    "null",  # lowercase
-                    "NaN",  # Python/NumPy/Pandas
-                    "nan",  # lowercase
-                    "?",  # Occasionally used for unknowns
-                ],
-            )
-        except Exception as e:
-            logger.error("Error reading '%s'. Skipping. %s", csv_file, e)
-            continue
         if test_mode is True:
-            df = df.sample(n=min(20, len(df)))
+            # Sampling needs the whole table, so test runs are never chunked
+            chunks = read_csv_table(csv_file)
+        else:
+            chunks = read_csv_table(csv_file, chunk_size)
         logger.info("Processing %s...", csv_file.name)
-        # === Convert entire csv to rdf node ===
-        df = rdf_transform_csv(df, csv_schema, rdf_ns)
-        # === Fill down records using PRIMARY_KEY as block marker ===
         primary_key = csv_schema["PRIMARY_KEY"]
-        df = fill_down_until_key(df, primary_key)
-        # === Make sure that Pandas does not store any NaN ===
-        df = df.where(pd.notna(df), None)
-        # === Iterate through all the rows of the CSV file ===
-        for _, row in tqdm(df.iterrows(), total=len(df)):
-            primary_node = row[primary_key]
-            # == Process each column according to the config ==
-            for col, col_value in csv_schema.items():
-                if col == "PRIMARY_KEY":
-                    continue
-                object_node = row.get(col, None)
-                # == No object value found ==
-                if object_node is None:
-                    continue
-                # == Process String Mapping ==
-                if isinstance(col_value, URIRef):
-                    subject_node = primary_node
-                    predicate = col_value
-                # == Process Inline Dict Mapping ==
-                elif isinstance(col_value, dict):
-                    predicate = col_value.get("pred")
-                    if subj_col := col_value.get("subj"):
-                        subject_node = row.get(subj_col, None)
-                    else:
-                        # Use the value from "PRIMARY_KEY" column
-                        subject_node = primary_node
-                    if not eval(
-                        col_value.get("if", "True"),
-                        {"URIRef": URIRef, "Literal": Literal, "None": None},
-                        {"subj": subject_node, "obj": object_node, "row": row},
-                    ):
-                        continue
-                    rdf_type = col_value.get("type")
-                    if rdf_type:
-                        graph.add((object_node, RDF.type, URIRef(rdf_type)))
+        # Columns not referenced by the config are left as they are
+        fill_columns = fill_down_columns(csv_schema)
+        table_stats = stats.table(csv_name)
+        cache_stats = {}
+        # Last filled-down row of the previous chunk, carrying the open record
+        carry = None
+        chunk_num = 0
+        while True:
+            try:
+                with stats.phase("read"):
+                    df = next(chunks, None)
+            except Exception as e:
+                if chunk_num:
+                    logger.error(
+                        "Error reading '%s' after %d chunks. Skipping the rest. %s",
+                        csv_file,
+                        chunk_num,
+                        e,
+                    )
                 else:
-                    continue
-                if subject_node and predicate and object_node:
+                    logger.error("Error reading '%s'. Skipping. %s", csv_file, e)
+                break
+            if df is None:
+                break
+            chunk_num += 1
+            if test_mode is True:
+                df = df.sample(n=min(20, len(df)))
+            table_stats["rows"] += len(df)
+            # === Convert entire csv to rdf node ===
+            with stats.phase("transform"):
+                df = rdf_transform_csv(df, csv_schema, rdf_ns, cache_stats=cache_stats)
+            # === Fill down records using PRIMARY_KEY as block marker ===
+            with stats.phase("fill_down"):
+                if carry is None:
+                    df = fill_down_until_key(df, primary_key, fill_columns)
+                else:
+                    # Rows before the first PRIMARY_KEY of this chunk continue the last
+                    # record of the previous chunk: fill them down from its last row
+                    df = fill_down_until_key(
+                        pd.concat([carry, df]), primary_key, fill_columns
+                    )
+                    df = df.iloc[1:]
+            if chunk_size and len(df):
+                carry = df.iloc[[-1]]
+            # === Emit triples column by column ===
+            desc = f"{csv_name} [{chunk_num}]" if chunk_size else csv_name
+            for col, col_value, triples in tqdm(
+                stats.timed(
+                    "emit", iter_table_triples(df, csv_schema, stats, csv_name)
+                ),
+                total=len(csv_schema) - 1,
+                desc=desc,
+            ):
+                stats.add_triples(csv_name, col, triples)
+                yield csv_name, col, col_value, triples
+        for counter, value in cache_stats.items():
+            table_stats[counter] += value
+        if cache_stats.get("cells"):
+            logger.info(
+                "Converted %d cells with %d conversions (cache hit ratio: %.1f%%)",
+                cache_stats["cells"],
+                cache_stats["conversions"],
+                100 * (1 - cache_stats["conversions"] / cache_stats["cells"]),
+            )
+
+
+def create_graph(namespaces: dict[str, str], store_path: Path | None = None) -> Graph:
+    """
+    Create an empty RDF graph with the namespaces of the config bound.
+
+    Args:
+        namespaces (dict): Prefixes and namespace URIs from the config.
+        store_path (Path, optional): If provided, the graph is kept in an on-disk Oxigraph
+            store created in this folder instead of in memory. The graph must be closed
+            once serialized.
+
+    Returns:
+        Graph: The empty graph.
+
+    Raises:
+        ValueError: If an Oxigraph store is requested but oxrdflib is not installed.
+    """
+    if store_path is None:
+        graph = Graph()
+    else:
+        try:
+            # Only the namespaces of the config are bound, as in the output of ox-turtle
+            graph = Graph("Oxigraph", bind_namespaces="none")
+        except PluginException as e:
+            raise ValueError(
+                "graph_store 'oxigraph' requires the oxrdflib package."
+            ) from e
+        graph.open(str(store_path), create=True)
+    for prefix, ns in namespaces.items():
+        graph.bind(prefix, Namespace(ns))
+    return graph
+
+
+def resolve_graph_store(config: dict[str, dict]) -> str:
+    """
+    Resolve the `graph_store` of a config to "memory" or "oxigraph".
+
+    With `graph_store = "auto"`, an Oxigraph store is used if the CSV files of the config
+    are bigger than `GRAPH_STORE_CUTOFF` (test runs always use memory).
+
+    Args:
+        config (dict): The (raw or processed) config dict.
+
+    Returns:
+        str: "memory" or "oxigraph".
+
+    Raises:
+        ValueError: If `graph_store` is not one of `GRAPH_STORES`.
+    """
+    graph_store = config["general"].get("graph_store", "memory")
+    if graph_store not in GRAPH_STORES:
+        raise ValueError(
+            f"Invalid graph_store '{graph_store}'. Expected one of: {', '.join(GRAPH_STORES)}"
+        )
+    if graph_store != "auto":
+        return graph_store
+    if config["general"].get("test_mode") is True:
+        return "memory"
+    csv_folder = resolve_csv_folder(config)
+    csv_size = sum(
+        csv_file.stat().st_size
+        for name in config
+        if name not in ("general", "namespaces")
+        and (csv_file := (csv_folder / name).with_suffix(".csv")).exists()
+    )
+    return "oxigraph" if csv_size > GRAPH_STORE_CUTOFF else "memory"
+
+
+def output_options(config: dict[str, dict]) -> dict[str, Any]:
+    """
+    Read the compression and shard settings of `[general]`, as `TripleWriter` arguments.
+
+    - `compression`: "gzip" or "zstd".
+    - `shard_triples`: start a new output shard after this many triples.
+    - `shard_bytes`: start a new output shard before exceeding this size (in bytes, before
+      compression).
+
+    Args:
+        config (dict): The (raw or processed) config dict.
+
+    Returns:
+        dict: "compression", "max_triples" and "max_bytes", None when not set.
+
+    Raises:
+        ValueError: If a setting is invalid.
+    """
+    general = config["general"]
+    compression = general.get("compression")
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(
+            f"Invalid compression '{compression}'. Expected one of: {', '.join(COMPRESSIONS)}"
+        )
+    options = {"compression": compression}
+    for key, option in (("shard_triples", "max_triples"), ("shard_bytes", "max_bytes")):
+        value = general.get(key)
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, int) or value < 1
+        ):
+            raise ValueError(f"Invalid {key} '{value}'. Expected a positive integer.")
+        options[option] = value
+    return options
+
+
+def build_rdf_graph(
+    config: dict[str, dict],
+    stats: ConversionStats | None = None,
+    graph: Graph | None = None,
+) -> Graph:
+    """
+    Build an RDF graph from CSV files and a processed config dict.
+
+    Triples are generated by `iter_rdf_triples` and added to the graph in bulk.
+
+    Args:
+        config (dict): The processed config dict with predicates/types resolved to RDF URIs
+            and objects.
+        stats (ConversionStats, optional): Statistics updated in place (see
+            `iter_rdf_triples`); time spent adding triples counts as the "store" phase.
+        graph (Graph, optional): The graph to add triples to (e.g. one backed by an
+            Oxigraph store, see `create_graph`). Defaults to a new in-memory graph.
+
+    Returns:
+        Graph: The constructed RDFLib Graph containing all triples.
+
+    Raises:
+        ValueError: If required config fields are missing or if triple creation fails.
+    """
+    # === Initialize RDF Graph ===
+    if graph is None:
+        graph = create_graph(config.get("namespaces", {}))
+
+    if stats is None:
+        stats = ConversionStats()
+    for _, col, col_value, triples in iter_rdf_triples(config, stats):
+        try:
+            with stats.phase("store"):
+                graph.addN((s, p, o, graph) for s, p, o in triples)
+        except Exception as e:
+            raise ValueError(
+                f"Error adding triples defined by '{col}={col_value}'"
+            ) from e
+
+    return graph
+
+
+def stream_rdf(
+    config: dict[str, dict],
+    writer: TripleWriter,
+    stats: ConversionStats | None = None,
+) -> int:
+    """
+    Convert CSV files to RDF and stream the triples to a writer, without building an
+    in-memory graph.
+
+    The writer is opened if needed and closed at the end.
+
+    Args:
+        config (dict): The processed config dict with predicates/types resolved to RDF URIs
+            and objects.
+        writer (TripleWriter): The streaming writer (N-Triples or Turtle).
+        stats (ConversionStats, optional): Statistics updated in place (see
+            `iter_rdf_triples`); time spent writing counts as the "store" phase.
+
+    Returns:
+        int: The number of triples written.
+
+    Raises:
+        ValueError: If required config fields are missing or if a triple cannot be
+            serialized.
+    """
+    if stats is None:
+        stats = ConversionStats()
+    with writer:
+        for _, col, col_value, triples in iter_rdf_triples(config, stats):
+            try:
+                with stats.phase("store"):
+                    writer.write(triples)
+            except ValueError as e:
+                raise ValueError(
+                    f"Error writing triples defined by '{col}={col_value}': {e}"
+                ) from e
+    return writer.triple_count
+
+
+def table_config(config: dict[str, dict], csv_name: str) -> dict[str, dict]:
+    """
+    Return a processed config dict restricted to a single CSV table.
+
+    Args:
+        config (dict): The processed config dict.
+        csv_name (str): The CSV table to keep.
+
+    Returns:
+        dict: A config dict with `general`, `namespaces` and the CSV table only.
+    """
+    return {
+        "general": config["general"],
+        "namespaces": config["namespaces"],
+        csv_name: config[csv_name],
+    }
+
+
+def convert_table_to_shard(
+    config: dict[str, dict],
+    csv_name: str,
+    shard_path: Path,
+    output_format: str,
+    header: bool = True,
+) -> tuple[int, dict[str, Any]]:
+    """
+    Convert a single CSV table and stream its triples to a shard file.
+
+    This is the unit of work of parallel conversions: it runs in a worker process and only
+    exchanges the (picklable) processed config, file paths and statistics with the main
+    process.
+
+    Args:
+        config (dict): The processed config dict.
+        csv_name (str): The CSV table to convert.
+        shard_path (Path): The shard file to write.
+        output_format (str): "turtle" or "ntriples".
+        header (bool): Whether to write the header (prefixes) in the shard.
+
+    Returns:
+        tuple[int, dict]: The number of triples written to the shard, and the conversion
+            statistics of the table (see `ConversionStats.to_dict`).
+    """
+    writer_class = TurtleWriter if output_format == "turtle" else NTriplesWriter
+    writer = writer_class(shard_path, config["namespaces"], header=header)
+    stats = ConversionStats()
+    triple_count = stream_rdf(table_config(config, csv_name), writer, stats)
+    return triple_count, stats.to_dict()
+
+
+def convert_tables_to_shards(
+    config: dict[str, dict],
+    shard_paths: dict[str, Path],
+    output_format: str,
+    jobs: int,
+    header: bool = True,
+) -> dict[str, tuple[int, dict[str, Any]]]:
+    """
+    Convert CSV tables of a config to shard files, one shard per table.
+
+    With more than one job, tables are converted in a process pool.
+
+    Args:
+        config (dict): The processed config dict.
+        shard_paths (dict[str, Path]): The tables to convert and their shard files.
+        output_format (str): "turtle" or "ntriples".
+        jobs (int): Number of worker processes.
+        header (bool): Whether to write the header (prefixes) in each shard.
+
+    Returns:
+        dict[str, tuple[int, dict]]: The triple count and statistics of each shard (see
+            `convert_table_to_shard`), in the order of `shard_paths` (regardless of the
+            order in which workers finish).
+    """
+    if jobs == 1 or len(shard_paths) <= 1:
+        return {
+            name: convert_table_to_shard(config, name, path, output_format, header)
+            for name, path in shard_paths.items()
+        }
+    logger.info("Converting %d tables with %d processes...", len(shard_paths), jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            name: executor.submit(
+                convert_table_to_shard, config, name, path, output_format, header
+            )
+            for name, path in shard_paths.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def convert_tables_incrementally(
+    raw_config: dict[str, dict],
+    config: dict[str, dict],
+    cache_dir: Path,
+    output_format: str,
+    jobs: int,
+    header: bool = True,
+    stats: ConversionStats | None = None,
+) -> dict[str, tuple[Path, int]]:
+    """
+    Convert only the CSV tables whose fingerprint changed since the last run, reusing the
+    cached shards of the others (see `rdfconv.manifest`).
+
+    Args:
+        raw_config (dict): The raw TOML config, used to fingerprint each table.
+        config (dict): The processed config dict.
+        cache_dir (Path): Folder holding the build manifest and the cached shards.
+        output_format (str): "turtle" or "ntriples".
+        jobs (int): Number of worker processes.
+        header (bool): Whether to write the header (prefixes) in each shard.
+        stats (ConversionStats, optional): Statistics to which the statistics of each
+            table are added, including the recorded statistics of cached tables.
+
+    Returns:
+        dict[str, tuple[Path, int]]: The shard path and triple count of every table, in
+            the order of the tables in the config.
+    """
+    tables = [name for name in config if name not in ("general", "namespaces")]
+    csv_folder = resolve_csv_folder(config)
+    suffix = OUTPUT_FORMATS[output_format]
+    manifest = BuildManifest.load(cache_dir)
+    manifest.prune(tables)
+
+    fingerprints = {}
+    stale = {}
+    for name in tables:
+        csv_file = (csv_folder / name).with_suffix(".csv")
+        fingerprints[name] = manifest.fingerprint(csv_file, raw_config, name)
+        if not manifest.is_fresh(name, fingerprints[name]):
+            stale[name] = manifest.shard_path(name, suffix)
+    logger.info(
+        "Incremental build: %d of %d tables changed%s",
+        len(stale),
+        len(tables),
+        f" ({', '.join(stale)})" if stale else "",
+    )
+
+    results = convert_tables_to_shards(config, stale, output_format, jobs, header)
+    for name, path in stale.items():
+        triple_count, table_stats = results[name]
+        manifest.record(name, fingerprints[name], path, triple_count, table_stats)
+    manifest.save()
+
+    shards = {}
+    for name in tables:
+        if name in stale:
+            shards[name] = (stale[name], results[name][0])
+        else:
+            shards[name] = (
+                manifest.shard_path(name, suffix),
+                manifest.triple_count(name),
+            )
+        if stats is not None:
+            if name in stale:
+                # The manifest leaves out the timings: merge the fresh statistics
+                stats.merge(results[name][1])
+            else:
+                stats.merge(manifest.table_stats(name))
+                stats.cached_tables.append(name)
+    return shards
+
+
+def config_cache_dir() -> Path:
+    """Return the folder of cached config plans (`$XDG_CACHE_HOME/rdfconv`)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rdfconv"
+
+
+def config_to_plan(config: dict[str, dict]) -> dict[str, dict]:
+    """
+    Convert a processed config to a JSON-serializable plan (see `config_from_plan`).
+
+    Predicates are stored as strings and `if` conditions as their expressions.
+
+    Args:
+        config (dict): The processed config dict (see `rdf_process_predicates`).
+
+    Returns:
+        dict: The plan.
+    """
+    plan = {}
+    for section, schema in config.items():
+        if section in ("general", "namespaces"):
+            plan[section] = schema
+            continue
+        plan[section] = {
+            col: (
+                str(value)
+                if isinstance(value, str)
+                else {key: str(val) for key, val in value.items()}
+            )
+            for col, value in schema.items()
+        }
+    return plan
+
+
+def config_from_plan(plan: dict[str, dict]) -> dict[str, dict]:
+    """
+    Rebuild a processed config from a plan written by `config_to_plan`.
+
+    The structure of the plan is checked again and its `if` conditions are compiled again,
+    so that a damaged or edited plan file is rejected instead of being trusted.
+
+    Args:
+        plan (dict): The plan, as loaded from JSON.
+
+    Returns:
+        dict: The processed config dict.
+
+    Raises:
+        ValueError: If the plan is not a valid processed config.
+    """
+    config = {}
+    for section, schema in plan.items():
+        if section in ("general", "namespaces"):
+            config[section] = schema
+            continue
+        if not isinstance(schema, dict) or not isinstance(
+            schema.get("PRIMARY_KEY"), str
+        ):
+            raise ValueError(f"Config plan [{section}]: missing 'PRIMARY_KEY' value.")
+        new_schema = {}
+        for col, value in schema.items():
+            if col == "PRIMARY_KEY":
+                new_schema[col] = value
+            elif isinstance(value, str):
+                new_schema[col] = URIRef(value)
+            elif isinstance(value, dict) and all(
+                key in COLUMN_KEYS and isinstance(val, str)
+                for key, val in value.items()
+            ):
+                new_col_schema = dict(value)
+                if "pred" in new_col_schema:
+                    new_col_schema["pred"] = URIRef(new_col_schema["pred"])
+                if "if" in new_col_schema:
                     try:
-                        graph.add((subject_node, predicate, object_node))
-                    except Exception as e:
+                        new_col_schema["if"] = Condition(new_col_schema["if"])
+                    except SyntaxError as e:
                         raise ValueError(
-                            f"Error adding triple ({subject_node}, {predicate}, {object_node}): defined by '{col}={col_value}'"
+                            f"Config plan [{section}]: invalid 'if' expression in column '{col}'"
                         ) from e
+                new_schema[col] = new_col_schema
+            else:
+                raise ValueError(
+                    f"Config plan [{section}]: invalid value for column '{col}'"
+                )
+        config[section] = new_schema
+    return config
 
-    # dynamically add the number of triples as a attribute of graph
-    return graph
+
+def load_config(
+    config_path: Path, cache_dir: Path | None = None
+) -> tuple[dict[str, dict], dict[str, dict]]:
+    """
+    Load a TOML config file and process it with `rdf_process_predicates`, reusing the plan
+    cached by a previous run if the file did not change, e.g. from a driver script
+    converting several datasets:
+
+        raw_config, config = load_config(config_path)
+        graph = build_rdf_graph(config)
+
+    Plans are JSON files (see `config_to_plan`) named after the SHA-256 hash of the TOML
+    file and of `CONFIG_CACHE_VERSION`, so that editing the config or upgrading the
+    converter compiles the config again.
+
+    Args:
+        config_path (Path): The TOML config file.
+        cache_dir (Path, optional): Folder of cached plans. Defaults to
+            `config_cache_dir()`. Plans are not cached if it cannot be written, or if the
+            raw config cannot be stored as JSON (e.g. TOML dates).
+
+    Returns:
+        tuple[dict, dict]: The raw config, as parsed from the TOML file, and the processed
+            config.
+
+    Raises:
+        ValueError: If the config is invalid (see `rdf_process_predicates`).
+    """
+    data = Path(config_path).read_bytes()
+    key = hashlib.sha256(f"{CONFIG_CACHE_VERSION}\n".encode() + data).hexdigest()
+    cache_path = (cache_dir or config_cache_dir()) / f"config-{key}.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("version") == CONFIG_CACHE_VERSION and isinstance(
+            cached["raw"], dict
+        ):
+            return cached["raw"], config_from_plan(cached["plan"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing, unreadable or invalid plan: compile the config again
+        pass
+
+    raw_config = tomli.loads(data.decode("utf-8"))
+    processed_config = rdf_process_predicates(raw_config)
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": CONFIG_CACHE_VERSION,
+                    "raw": raw_config,
+                    "plan": config_to_plan(processed_config),
+                },
+                f,
+            )
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError) as e:
+        logger.debug("Config plan not cached: %s", e)
+    return raw_config, processed_config
 
 
 def main():
     """
     Main entry point for the general RDF conversion script.
 
-    - Parses command-line arguments and loads the TOML config file.
+    - Parses command-line arguments and loads the TOML config file, or the plan cached by a
+      previous run for the same file (see `load_config`).
     - Processes the config and builds the RDF graph from all CSVs listed.
     - Serializes the graph to a TTL file at the specified output location.
+    - If `streaming` is true in `[general]`, triples are instead written to the output file
+      as they are produced, in the `output_format` of `[general]` ("turtle" or
+      "ntriples").
+    - With `--jobs N`, CSV tables are converted by N worker processes, each writing its
+      own shard; shards are merged in table order.
+    - Without streaming, the graph is kept in memory or, depending on `graph_store` in
+      `[general]`, in a temporary on-disk Oxigraph store.
+    - With `--incremental`, shards are kept in a cache folder with a build manifest, and
+      only tables whose CSV or config section changed are converted again.
+    - With `compression`, `shard_triples` or `shard_bytes` in `[general]` (see
+      `output_options`), the output is compressed and/or split into shards that each
+      carry the header, listed in `{name}.shards.json`.
+    - Conversion statistics (see `rdfconv.stats`) are logged and saved next to the output
+      file as `{name}.stats.json`.
 
     Raises:
         ValueError: If required config fields are missing or invalid.
@@ -500,48 +1333,208 @@ def main():
         description="Convert a CSV to RDF using a TOML configuration file."
     )
     parser.add_argument("config", type=str, help="Path to the TOML configuration file")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of processes converting CSV tables in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only re-convert the CSV tables whose file or config section changed since "
+        "the last incremental run, reusing the cached output of the others",
+    )
+    parser.add_argument(
+        "--no-config-cache",
+        action="store_true",
+        help="Always parse and validate the config file instead of reusing the plan "
+        "cached by a previous run",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
     config_path = Path(args.config)
-    # === Load TOML config ===
-    with open(config_path, "rb") as f:
-        config = tomli.load(f)
+    # === Load TOML config and process predicates ===
+    if args.no_config_cache:
+        with open(config_path, "rb") as f:
+            config = tomli.load(f)
+        processed_config = rdf_process_predicates(config)
+    else:
+        config, processed_config = load_config(config_path)
     # == Retrieve output information from config ==
     try:
         rel_out_dir = Path(config["general"]["rdf_output_folder"])
         ttl_name = config["general"]["name"]
     except KeyError as e:
         raise ValueError(f" {config} is missing required key: {e}") from e
-    # == Process predicates in config ==
-    processed_config = rdf_process_predicates(config)
-    # == Convert CSVs to RDF graph
-    rdf_graph = build_rdf_graph(processed_config)
-
-    if rdf_graph:
-        logger.info("RDF graph built successfully")
-        logger.info("Serializing... (this may take a while)")
+    streaming = config["general"].get("streaming") is True
+    output_format = config["general"].get("output_format", "turtle")
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Invalid output_format '{output_format}'. Expected one of: {', '.join(OUTPUT_FORMATS)}"
+        )
+    if output_format == "ntriples" and not streaming:
+        raise ValueError("output_format 'ntriples' requires 'streaming = true'.")
+    if config["general"].get("graph_store") == "oxigraph" and streaming:
+        raise ValueError(
+            "graph_store 'oxigraph' cannot be used with 'streaming = true'."
+        )
+    graph_store = "memory" if streaming else resolve_graph_store(config)
+    options = output_options(config)
 
     # === Find Output Directory ===
     script_dir = Path(__file__).parent.resolve()
     rdf_folder = (script_dir / rel_out_dir).resolve()
     ttl_path = rdf_folder / ttl_name
+    suffix = OUTPUT_FORMATS[output_format]
     if config["general"].get("test_mode") is True:
-        ttl_path = ttl_path.with_name(f"{ttl_path.stem}_test").with_suffix(".ttl")
+        ttl_path = ttl_path.with_name(f"{ttl_path.stem}_test").with_suffix(suffix)
     else:
-        ttl_path = ttl_path.with_suffix(".ttl")
-
-    # === Serializing RDF Graph ===
+        ttl_path = ttl_path.with_suffix(suffix)
     rdf_folder.mkdir(parents=True, exist_ok=True)
-    rdf_graph.serialize(destination=ttl_path, format="turtle")
-    logger.info("RDF conversion completed. Output saved to: %s", ttl_path.resolve())
+
+    writer_class = TurtleWriter if output_format == "turtle" else NTriplesWriter
+    incremental = args.incremental
+    if incremental and config["general"].get("test_mode") is True:
+        # Test runs sample random rows, so their triples cannot be cached
+        logger.warning("--incremental is ignored in test mode.")
+        incremental = False
+
+    stats = ConversionStats()
+    rdf_graph = None
+    store_path = None
+    writer = None
+    if graph_store == "oxigraph":
+        # The store is deleted once the graph is serialized
+        store_path = Path(tempfile.mkdtemp(prefix=".oxigraph-", dir=rdf_folder))
+        logger.info("Using an on-disk Oxigraph store: %s", store_path)
+    try:
+        if not streaming:
+            rdf_graph = create_graph(processed_config["namespaces"], store_path)
+        if incremental or args.jobs > 1:
+            # == Convert each table to its own shard, then merge shards in table order ==
+            # Streamed shards are written without header and copied into the output files
+            # of the writer; otherwise shards are Turtle files loaded back into the graph
+            with tempfile.TemporaryDirectory(dir=rdf_folder) as shard_dir:
+                if incremental:
+                    shards = convert_tables_incrementally(
+                        config,
+                        processed_config,
+                        rdf_folder / CACHE_FOLDER / ttl_path.stem,
+                        output_format,
+                        args.jobs,
+                        header=not streaming,
+                        stats=stats,
+                    )
+                else:
+                    tables = [
+                        name
+                        for name in processed_config
+                        if name not in ("general", "namespaces")
+                    ]
+                    shard_paths = {
+                        name: Path(shard_dir) / f"{i:04d}-{name}{suffix}"
+                        for i, name in enumerate(tables)
+                    }
+                    results = convert_tables_to_shards(
+                        processed_config,
+                        shard_paths,
+                        output_format,
+                        args.jobs,
+                        header=not streaming,
+                    )
+                    shards = {}
+                    for name, path in shard_paths.items():
+                        triple_count, table_stats = results[name]
+                        stats.merge(table_stats)
+                        shards[name] = (path, triple_count)
+                if streaming:
+                    with stats.phase("serialize"):
+                        writer = writer_class(
+                            ttl_path, processed_config["namespaces"], **options
+                        )
+                        with writer:
+                            for path, count in shards.values():
+                                writer.copy_shard(path, count)
+                    triple_count = writer.triple_count
+                else:
+                    with stats.phase("store"):
+                        for path, _ in shards.values():
+                            rdf_graph.parse(
+                                path, format="ox-turtle" if store_path else "turtle"
+                            )
+        elif streaming:
+            # == Stream triples to the output file ==
+            writer = writer_class(ttl_path, processed_config["namespaces"], **options)
+            triple_count = stream_rdf(processed_config, writer, stats)
+        else:
+            # == Convert CSVs to RDF graph
+            rdf_graph = build_rdf_graph(processed_config, stats, rdf_graph)
+
+        if not streaming:
+            # The graph holds each distinct triple once
+            triple_count = len(rdf_graph)
+            if triple_count:
+                logger.info("RDF graph built successfully")
+                logger.info("Serializing... (this may take a while)")
+
+            # === Serializing RDF Graph ===
+            with stats.phase("serialize"):
+                if any(options.values()):
+                    # Compressed or sharded output goes through the streaming writer
+                    writer = writer_class(
+                        ttl_path, processed_config["namespaces"], **options
+                    )
+                    with writer:
+                        writer.write(rdf_graph)
+                else:
+                    # Oxigraph serializes its own store much faster than rdflib
+                    rdf_graph.serialize(
+                        destination=ttl_path,
+                        format="ox-turtle" if store_path else "turtle",
+                    )
+    finally:
+        if store_path is not None:
+            if rdf_graph is not None:
+                rdf_graph.close()
+            shutil.rmtree(store_path, ignore_errors=True)
+
+    output_path = ttl_path
+    if writer is not None and writer.sharded:
+        output_path = ttl_path.with_name(f"{ttl_path.stem}{SHARDS_SUFFIX}")
+        write_shard_manifest(writer, output_path, output_format)
+        logger.info("Wrote %d shards, listed in %s", len(writer.shards), output_path)
+    elif writer is not None:
+        output_path = writer.shard_path(1)
+
+    # === Report Statistics ===
+    # Streaming writers only remove duplicates within a chunk, so their count is not the
+    # number of distinct triples
+    stats.output = {
+        "path": str(output_path.resolve()),
+        "triples": triple_count,
+        "distinct": not streaming,
+    }
+    if writer is not None and writer.sharded:
+        stats.output["shards"] = len(writer.shards)
+    stats_path = ttl_path.with_name(f"{ttl_path.stem}{STATS_SUFFIX}")
+    stats.save(stats_path)
+    stats.log_summary()
+    # Tables converted in worker processes use their own caches
+    logger.info("Interned terms: %s", terms.format_cache_info())
+    logger.info("RDF conversion completed. Output saved to: %s", output_path.resolve())
     elapsed_time = time.time() - start_time
     logger.info("Script finished in %.2f seconds.", elapsed_time)
-    # Each non-empty line in ttl (except prefix) is a triple
-    non_empty_lines = sum(
-        1
-        for line in ttl_path.open("r", encoding="utf-8")
-        if line.strip() and not line.lstrip().startswith("@prefix")
-    )
-    logger.info("TTL file contains %d triples.", non_empty_lines)
+    if streaming:
+        logger.info(
+            "Wrote %d triples (duplicates across chunks, tables or shards are kept).",
+            triple_count,
+        )
+    else:
+        logger.info("Output file contains %d distinct triples.", triple_count)
+    logger.info("Conversion statistics saved to: %s", stats_path)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,487 @@
+"""
+Column profiles of CSV files, used by `rdfconv.tomlgen` to suggest config mappings.
+
+`profile_csv` reads a CSV file once with the `csv` module, and keeps a fixed amount of state
+for each column, whatever the size of the file:
+
+- the number of cells and of empty cells (see `rdfconv.constants.NA_VALUES`);
+- the number of values of each of `KINDS`, classified the way the conversion script reads
+  them: Wikidata IDs, URLs, ISO dates and date-times, numbers and other text;
+- the writing system of the text values (see `SCRIPTS`), as a hint of their language;
+- the number of distinct values, exact up to `DISTINCT_SAMPLE` values and estimated beyond
+  (k minimum values sketch).
+
+Rows are read in batches of `BATCH_SIZE`, and each distinct value of a batch is classified
+once, so that categorical columns cost little. A reservoir sample of `ROW_SAMPLE_SIZE` rows
+is also kept, to relate columns of the same rows (e.g. identifiers and URLs).
+
+Files larger than the sample size are not read in full: `SAMPLE_WINDOWS` windows spread over
+the file are parsed instead, and row counts are estimated from them. A window can start
+inside a multi-line quoted cell; rows that do not have as many cells as the header are then
+skipped.
+
+`profile_csv_files` profiles several files in parallel, one worker process per file.
+
+Usage:
+    ```python
+    profiles = profile_csv_files(sorted(folder.glob("*.csv")), jobs=4)
+    for column in profiles[csv_file].columns.values():
+        print(column.name, column.null_rate, column.fraction("date"))
+    ```
+"""
+
+import csv
+import hashlib
+import heapq
+import io
+import logging
+import math
+import random
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from wikidata_utils import extract_wd_id
+from rdfconv.constants import NA_VALUES
+
+logger = logging.getLogger(__name__)
+
+_NA_SET = frozenset(NA_VALUES)
+
+# Kinds of non-empty values, in the order in which they are tested
+KINDS = ("wikidata", "url", "date", "datetime", "number", "text")
+# Files larger than this (in bytes) are profiled from a sample of windows
+SAMPLE_BYTES = 32 << 20
+# Number of windows read from a sampled file
+SAMPLE_WINDOWS = 64
+# Number of rows profiled at once
+BATCH_SIZE = 10_000
+# Number of rows kept in the reservoir sample of a file
+ROW_SAMPLE_SIZE = 256
+# Number of hashes kept by the distinct-value sketch of a column (~2% error beyond)
+DISTINCT_SAMPLE = 4096
+_HASH_MASK = (1 << 64) - 1
+
+_DATE = r"-?\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|[12]\d|3[01])"
+_TIME = r"T(?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+# Kinds recognized by pattern (other than Wikidata IDs), as groups of a single regex so
+# that a value is matched once
+KIND_PATTERN = re.compile(
+    rf"(?P<url>http.*)|(?P<date>{_DATE})|(?P<datetime>{_DATE}{_TIME})"
+    r"|(?P<number>[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)",
+    re.DOTALL,
+)
+# Values made of a single token, such as the local part of a URI ("1", "tune-23")
+IDENTIFIER_PATTERN = re.compile(r"[\w.\-~]+")
+_ASCII_LETTER = re.compile(r"[A-Za-z]")
+# Unicode blocks of the writing systems told apart, other than Latin
+SCRIPTS = (
+    (0x0370, 0x03FF, "Greek"),
+    (0x0400, 0x052F, "Cyrillic"),
+    (0x0590, 0x05FF, "Hebrew"),
+    (0x0600, 0x06FF, "Arabic"),
+    (0x0900, 0x097F, "Devanagari"),
+    (0x3040, 0x30FF, "Kana"),
+    (0x3400, 0x9FFF, "Han"),
+    (0xAC00, 0xD7AF, "Hangul"),
+)
+
+
+def classify(value: str) -> str:
+    """
+    Return the kind of a non-empty value (see `KINDS`).
+
+    As in `rdfconv.convert.to_rdf_node`, values containing a Wikidata ID become Wikidata
+    nodes even if they are URLs.
+
+    Args:
+        value (str): A non-empty cell value.
+
+    Returns:
+        str: One of `KINDS`.
+    """
+    if ("Q" in value or "P" in value) and extract_wd_id(value):
+        return "wikidata"
+    match = KIND_PATTERN.fullmatch(value)
+    return match.lastgroup if match else "text"
+
+
+def text_script(value: str) -> str | None:
+    """
+    Return the writing system of a text value.
+
+    Japanese text mixes Han characters and Kana, so Kana wins over Han.
+
+    Args:
+        value (str): A text value.
+
+    Returns:
+        str | None: "Latin", one of the names of `SCRIPTS`, or None if the value has no
+            letter.
+    """
+    if value.isascii():
+        return "Latin" if _ASCII_LETTER.search(value) else None
+    found = None
+    for char in value:
+        code = ord(char)
+        if code < 0x0370:
+            if found is None and char.isalpha():
+                found = "Latin"
+            continue
+        for start, end, name in SCRIPTS:
+            if start <= code <= end:
+                if name != "Han":
+                    return name
+                found = name
+                break
+    return found
+
+
+def stable_hash(value: str) -> int:
+    """
+    Return a 64-bit hash of a value for the distinct-value sketch.
+
+    Unlike `hash()`, which is salted per process (PYTHONHASHSEED), it gives the same hash
+    in every run, so that profiling a file twice gives the same estimates.
+
+    Args:
+        value (str): A cell value.
+
+    Returns:
+        int: The hash, between 0 and `_HASH_MASK`.
+    """
+    digest = hashlib.blake2b(value.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def mangle_header(header: list[str]) -> list[str]:
+    """
+    Name columns the way `pandas.read_csv` does, as the conversion script reads CSV files
+    with pandas: unnamed columns become "Unnamed: {index}" and duplicates get a ".1", ".2"...
+    suffix.
+
+    Args:
+        header (list[str]): The cells of the header row.
+
+    Returns:
+        list[str]: The column names.
+    """
+    names = []
+    seen: Counter = Counter()
+    for index, name in enumerate(header):
+        if name == "":
+            name = f"Unnamed: {index}"
+        base = name
+        while seen[name]:
+            name = f"{base}.{seen[base]}"
+            seen[base] += 1
+        seen[name] += 1
+        names.append(name)
+    return names
+
+
+class ColumnProfile:
+    """
+    Counters of the values of a CSV column.
+
+    Attributes:
+        name (str): The column name.
+        cells (int): Number of cells read.
+        nulls (int): Number of empty cells.
+        kinds (Counter): Number of non-empty values of each of `KINDS`.
+        scripts (Counter): Number of text values in each writing system.
+        identifiers (int): Number of non-empty values matching `IDENTIFIER_PATTERN`.
+        distinct (int): Number of distinct non-empty values, set by `finish`.
+        distinct_exact (bool): Whether `distinct` is exact or estimated.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.cells = 0
+        self.nulls = 0
+        self.kinds: Counter = Counter()
+        self.scripts: Counter = Counter()
+        self.identifiers = 0
+        self.distinct = 0
+        self.distinct_exact = True
+        # Smallest hashes seen, as a max-heap of negated hashes, and as a set
+        self._heap: list[int] = []
+        self._hashes: set[int] = set()
+
+    @property
+    def values(self) -> int:
+        """Number of non-empty cells."""
+        return self.cells - self.nulls
+
+    @property
+    def null_rate(self) -> float:
+        """Fraction of empty cells."""
+        return self.nulls / self.cells if self.cells else 0.0
+
+    def fraction(self, *kinds: str) -> float:
+        """Return the fraction of non-empty values that are of one of the given kinds."""
+        if not self.values:
+            return 0.0
+        return sum(self.kinds[kind] for kind in kinds) / self.values
+
+    def add(self, counts: Counter) -> None:
+        """
+        Add values to the profile.
+
+        Args:
+            counts (Counter): Number of cells of each value.
+        """
+        kinds = self.kinds
+        self.cells += counts.total()
+        for value in _NA_SET.intersection(counts):
+            self.nulls += counts.pop(value)
+        for value, count in counts.items():
+            kind = classify(value)
+            kinds[kind] += count
+            if kind == "number":
+                # Numbers are always identifiers
+                self.identifiers += count
+            elif kind == "text":
+                script = text_script(value)
+                if script:
+                    self.scripts[script] += count
+                if IDENTIFIER_PATTERN.fullmatch(value):
+                    self.identifiers += count
+        self._add_hashes([stable_hash(value) for value in counts])
+
+    def _add_hashes(self, hashes: list[int]) -> None:
+        # Keep the DISTINCT_SAMPLE smallest hashes seen (k minimum values)
+        heap, known = self._heap, self._hashes
+        if len(heap) >= DISTINCT_SAMPLE:
+            # Most hashes are larger than the largest kept one once the sketch is full
+            largest = -heap[0]
+            hashes = [value_hash for value_hash in hashes if value_hash < largest]
+        for value_hash in hashes:
+            if value_hash in known:
+                continue
+            if len(heap) < DISTINCT_SAMPLE:
+                heapq.heappush(heap, -value_hash)
+                known.add(value_hash)
+            elif value_hash < -heap[0]:
+                known.discard(-heapq.heapreplace(heap, -value_hash))
+                known.add(value_hash)
+
+    def finish(self) -> None:
+        """Compute `distinct` and free the distinct-value sketch."""
+        if len(self._heap) < DISTINCT_SAMPLE:
+            self.distinct = len(self._heap)
+            self.distinct_exact = True
+        else:
+            # The k-th smallest of n uniform hashes is about k / n of the hash space
+            self.distinct = int(
+                (DISTINCT_SAMPLE - 1) * (_HASH_MASK + 1) / -self._heap[0]
+            )
+            self.distinct_exact = False
+        self._heap = []
+        self._hashes = set()
+
+
+class TableProfile:
+    """
+    Profile of a CSV file.
+
+    Attributes:
+        path (Path): The CSV file.
+        columns (dict[str, ColumnProfile]): The profile of each column, in header order.
+        rows (int): Number of rows profiled.
+        skipped_rows (int): Number of rows skipped because they had more cells than the
+            header (or, in windows of a sampled file, a different number of cells).
+        file_bytes (int): Size of the file.
+        sampled_bytes (int): Number of bytes read, equal to `file_bytes` unless sampled.
+        row_sample (list[list[str]]): Reservoir sample of the profiled rows.
+    """
+
+    def __init__(self, path: Path, header: list[str], file_bytes: int):
+        self.path = path
+        self.columns = {name: ColumnProfile(name) for name in mangle_header(header)}
+        self.rows = 0
+        self.skipped_rows = 0
+        self.file_bytes = file_bytes
+        self.sampled_bytes = file_bytes
+        self.row_sample: list[list[str]] = []
+
+    @property
+    def sampled(self) -> bool:
+        """Whether only part of the file was read."""
+        return self.sampled_bytes < self.file_bytes
+
+    @property
+    def estimated_rows(self) -> int:
+        """Number of rows of the file, estimated from the sample if needed."""
+        if not self.sampled or not self.sampled_bytes:
+            return self.rows
+        return round(self.rows * self.file_bytes / self.sampled_bytes)
+
+
+class _Reservoir:
+    # Uniform sample of `size` rows of a stream of batches (algorithm L), which draws
+    # random numbers only for the rows it keeps
+
+    def __init__(self, size: int, rows: list[list[str]]):
+        self.size = size
+        self.rows = rows
+        self.seen = 0
+        # Seeded, so that a file always gives the same profile
+        self._rng = random.Random(0)
+        self._weight = math.exp(math.log(self._uniform()) / size)
+        self._next = size + self._skip()
+
+    def _uniform(self) -> float:
+        return self._rng.random() or 1e-300
+
+    def _skip(self) -> int:
+        return int(math.log(self._uniform()) / math.log(1 - self._weight))
+
+    def add(self, batch: list[list[str]]) -> None:
+        start = self.seen
+        self.seen += len(batch)
+        if len(self.rows) < self.size:
+            self.rows.extend(batch[: self.size - len(self.rows)])
+        while self._next < self.seen:
+            self.rows[self._rng.randrange(self.size)] = batch[self._next - start]
+            self._weight *= math.exp(math.log(self._uniform()) / self.size)
+            self._next += self._skip() + 1
+
+
+def _read_windows(csv_file: Path, size: int, sample_bytes: int) -> Iterator[bytes]:
+    # Yield SAMPLE_WINDOWS windows spread over the file, each extended to the end of its
+    # last line; all but the first start after the first line break
+    window_bytes = max(sample_bytes // SAMPLE_WINDOWS, 1)
+    stride = size / SAMPLE_WINDOWS
+    with open(csv_file, "rb") as f:
+        for index in range(SAMPLE_WINDOWS):
+            f.seek(int(index * stride))
+            if index:
+                f.readline()
+            data = f.read(window_bytes) + f.readline()
+            if data:
+                yield data
+
+
+def _iter_batches(
+    csv_file: Path, size: int, sample_bytes: int
+) -> Iterator[tuple[list[list[str]], int]]:
+    # Yield batches of rows (the header being the first row of the first batch), with the
+    # number of bytes read so far, or -1 when the whole file is read
+    if size <= sample_bytes:
+        with open(csv_file, "r", encoding="utf-8-sig", newline="") as f:
+            reader = csv.reader(f)
+            while batch := list(islice(reader, BATCH_SIZE)):
+                yield batch, -1
+        return
+    read = 0
+    for data in _read_windows(csv_file, size, sample_bytes):
+        read += len(data)
+        text = data.decode("utf-8-sig" if read == len(data) else "utf-8", "replace")
+        reader = csv.reader(io.StringIO(text, newline=""))
+        try:
+            while batch := list(islice(reader, BATCH_SIZE)):
+                yield batch, read
+        except csv.Error:
+            # A window starting inside a quoted cell can leave a quote open
+            continue
+
+
+def profile_csv(csv_file: Path, sample_bytes: int = SAMPLE_BYTES) -> TableProfile:
+    """
+    Profile the columns of a CSV file in a single pass.
+
+    Args:
+        csv_file (Path): The CSV file, encoded in UTF-8.
+        sample_bytes (int): Files larger than this are profiled from windows adding up to
+            about this size.
+
+    Returns:
+        TableProfile: The profile. Files without header have no columns.
+    """
+    size = csv_file.stat().st_size
+    table = None
+    reservoir = None
+    read = -1
+    for batch, read in _iter_batches(csv_file, size, sample_bytes):
+        if table is None:
+            table = TableProfile(csv_file, batch[0], size)
+            reservoir = _Reservoir(ROW_SAMPLE_SIZE, table.row_sample)
+            batch = batch[1:]
+        columns = list(table.columns.values())
+        width = len(columns)
+        if any(len(row) != width for row in batch):
+            batch = _fix_rows(table, batch, width, sampled=read >= 0)
+        if not batch:
+            continue
+        table.rows += len(batch)
+        reservoir.add(batch)
+        # Profile the batch column by column, each distinct value once
+        for column, values in zip(columns, zip(*batch)):
+            column.add(Counter(values))
+    if table is None:
+        return TableProfile(csv_file, [], size)
+    if read >= 0:
+        table.sampled_bytes = min(read, size)
+    for column in table.columns.values():
+        column.finish()
+    return table
+
+
+def _fix_rows(
+    table: TableProfile, batch: list[list[str]], width: int, sampled: bool
+) -> list[list[str]]:
+    # Drop blank lines, rows with extra cells and, in windows, rows with missing cells;
+    # otherwise, missing cells at the end of a row are empty, as in pandas
+    rows = []
+    for row in batch:
+        if len(row) == width:
+            rows.append(row)
+        elif not row:
+            continue
+        elif len(row) > width or sampled:
+            table.skipped_rows += 1
+        else:
+            rows.append(row + [""] * (width - len(row)))
+    return rows
+
+
+def profile_csv_files(
+    csv_files: Iterable[Path], jobs: int = 1, sample_bytes: int = SAMPLE_BYTES
+) -> dict[Path, TableProfile | Exception]:
+    """
+    Profile CSV files, in parallel if `jobs` > 1.
+
+    Args:
+        csv_files (Iterable[Path]): The CSV files.
+        jobs (int): Number of worker processes.
+        sample_bytes (int): See `profile_csv`.
+
+    Returns:
+        dict: The profile of each file, in the given order, or the exception raised while
+            profiling it.
+    """
+    csv_files = list(csv_files)
+    results: dict[Path, TableProfile | Exception] = {}
+    if jobs <= 1 or len(csv_files) <= 1:
+        for csv_file in csv_files:
+            try:
+                results[csv_file] = profile_csv(csv_file, sample_bytes)
+            except Exception as e:
+                results[csv_file] = e
+        return results
+    logger.info("Profiling %d CSV files with %d processes...", len(csv_files), jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            csv_file: executor.submit(profile_csv, csv_file, sample_bytes)
+            for csv_file in csv_files
+        }
+        for csv_file, future in futures.items():
+            try:
+                results[csv_file] = future.result()
+            except Exception as e:
+                results[csv_file] = e
+    return results
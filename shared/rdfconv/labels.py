@@ -14,9 +14,18 @@ Requires:
 Note:
     This script must be run with the current working directory set to `/code`.
 
+Responses can be cached on disk with `--cache`, or the `WIKIDATA_CACHE` environment
+variable, so that re-running the script on the same IDs does not query Wikidata again (see
+`wikidata_utils.cache`). The `WIKIDATA_RECORD` and `WIKIDATA_REPLAY` environment variables
+record the responses to a fixture archive, or replay them offline (see
+`wikidata_utils.fixtures`). `WIKIDATA_SUBSET` reads the labels from a local index built from
+a Wikidata dump, without network access nor rate limits (see `wikidata_utils.subset`).
+
 Usage:
     python -m rdfconv.labels input.txt --output output.txt
     python -m rdfconv.labels input.txt  # overwrites input.txt
+    python -m rdfconv.labels input.txt --cache ~/.cache/wikidata.sqlite
+    python -m rdfconv.labels input.txt --metrics metrics.json  # request timings
 """
 
 import asyncio
@@ -25,8 +34,15 @@ import re
 from pathlib import Path
 import argparse
 import logging
-from wikidata_utils import extract_wd_id, WikidataAPIClient
-import aiohttp
+import os
+from typing import TYPE_CHECKING
+from wikidata_utils import extract_wd_id
+from wikidata_utils.cache import CACHE_ENV_VAR, ResponseCache
+from wikidata_utils.fixtures import transport_from_env
+from wikidata_utils.metrics import METRICS_ENV_VAR
+
+if TYPE_CHECKING:
+    from wikidata_utils import WikidataAPIClient
 
 logger = logging.getLogger(__name__)
 if not logger.hasHandlers():
@@ -34,7 +50,7 @@ if not logger.hasHandlers():
 
 
 async def add_labels_as_comments(
-    input_path: Path, output_path: Path, client: WikidataAPIClient
+    input_path: Path, output_path: Path, client: "WikidataAPIClient"
 ):
     """
     Reads an input file line-by-line, extracts the last Wikidata ID from each line,
@@ -108,6 +124,11 @@ async def main():
         input_file (str): Path to the input file containing Wikidata IDs.
         --output (str): Optional path to the output file. If omitted, the input file
             will be overwritten.
+        --cache (str): Optional SQLite file caching Wikidata responses. Defaults to the
+            `WIKIDATA_CACHE` environment variable, if set.
+        --metrics (str): Optional JSON file receiving the request metrics of the run (see
+            `wikidata_utils.metrics`). Defaults to the `WIKIDATA_METRICS` environment
+            variable, if set.
     """
     parser = argparse.ArgumentParser(
         description="Script to add Wikidata labels as comments using QID/PID extracted from each line."
@@ -127,14 +148,54 @@ async def main():
         help="Path to the output file. If omitted, the input file will be overwritten.",
     )
 
+    parser.add_argument(
+        "--cache",
+        metavar="CACHE_FILE",
+        type=str,
+        default=os.environ.get(CACHE_ENV_VAR),
+        help=(
+            "SQLite file caching Wikidata responses between runs. "
+            f"Default: ${CACHE_ENV_VAR}, if set."
+        ),
+    )
+
+    parser.add_argument(
+        "--metrics",
+        metavar="METRICS_FILE",
+        type=str,
+        default=os.environ.get(METRICS_ENV_VAR),
+        help=(
+            "JSON file receiving the Wikidata request counts, latencies, limiter waits "
+            f"and errors of the run. Default: ${METRICS_ENV_VAR}, if set."
+        ),
+    )
+
     args = parser.parse_args()
 
     input_file = Path(args.input_file)
     output_file = Path(args.output) if args.output else input_file
 
-    async with aiohttp.ClientSession() as session:
-        client = WikidataAPIClient(session)
-        await add_labels_as_comments(input_file, output_file, client)
+    # Imported here so that `--help` and argument errors do not wait for aiohttp
+    import aiohttp
+    from wikidata_utils import WikidataAPIClient
+
+    cache = ResponseCache(args.cache) if args.cache else None
+    transport = transport_from_env()
+    try:
+        async with aiohttp.ClientSession() as session:
+            client = WikidataAPIClient(session, cache=cache, transport=transport)
+            await add_labels_as_comments(input_file, output_file, client)
+            logger.info("Wikidata requests: %s", client.format_request_stats())
+            if args.metrics:
+                logger.info("Wikidata metrics:\n%s", client.metrics.format_summary())
+                client.metrics.dump(args.metrics)
+                logger.info("Wikidata metrics written to %s", args.metrics)
+    finally:
+        if cache is not None:
+            logger.info("Wikidata cache: %s", cache.format_stats())
+            cache.close()
+        if transport is not None:
+            transport.close()
 
 
 if __name__ == "__main__":
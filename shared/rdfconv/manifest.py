@@ -0,0 +1,286 @@
+"""
+Build manifest for incremental runs of the general RDF conversion script.
+
+An incremental run keeps the triples of each CSV table in its own shard file inside a cache
+folder, next to a `manifest.json` that records the fingerprint each shard was built from.
+The fingerprint of a table combines:
+
+- a content hash (SHA-256) of its CSV file,
+- its section of the TOML config, normalized (keys sorted) so that reformatting the file or
+  reordering columns does not invalidate it,
+- the `[namespaces]` and the `[general]` settings that affect the triples produced.
+
+On the next run, only tables whose fingerprint changed are converted again; the output file
+is then reassembled from the cached shards.
+
+Hashing a multi-gigabyte CSV takes a few seconds, so the manifest also remembers the size
+and modification time of each CSV: if both are unchanged, the stored hash is reused.
+
+Usage:
+    ```python
+    manifest = BuildManifest.load(cache_dir)
+    fingerprint = manifest.fingerprint(csv_file, raw_config, csv_name)
+    if not manifest.is_fresh(csv_name, fingerprint):
+        ...  # convert the table to manifest.shard_path(csv_name, suffix)
+        manifest.record(csv_name, fingerprint, shard_path, triple_count)
+    manifest.save()
+    ```
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+MANIFEST_NAME = "manifest.json"
+# Bump when a change to the converter changes the triples produced from the same input,
+# so that shards built by previous versions are discarded
+MANIFEST_VERSION = 4
+# `[general]` keys that do not change the triples of a table
+IGNORED_GENERAL_KEYS = (
+    "name",
+    "csv_folder",
+    "rdf_output_folder",
+    "compression",
+    "shard_triples",
+    "shard_bytes",
+)
+
+
+def hash_file(path: Path, block_size: int = 1 << 20) -> str:
+    """
+    Return the SHA-256 hex digest of a file, read by blocks.
+
+    Args:
+        path (Path): The file to hash.
+        block_size (int): Number of bytes read at a time.
+
+    Returns:
+        str: The hex digest.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(block_size):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def normalize_config(value: Any) -> str:
+    """
+    Serialize a raw (unprocessed) TOML config value to a canonical JSON string.
+
+    Args:
+        value: A table or value of the TOML config, as parsed by tomli.
+
+    Returns:
+        str: JSON with sorted keys; non-JSON values (e.g. dates) are converted to strings.
+    """
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class BuildManifest:
+    """
+    Fingerprints and cached shards of the tables converted by previous runs.
+
+    Attributes:
+        cache_dir (Path): Folder holding the manifest and the cached shards.
+        tables (dict[str, dict]): For each table, its "fingerprint", "shard" file name and
+            "triples" count.
+        files (dict[str, dict]): For each CSV file, its "size", "mtime_ns" and "sha256"
+            when it was last hashed.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.tables: dict[str, dict] = {}
+        self.files: dict[str, dict] = {}
+
+    @classmethod
+    def load(cls, cache_dir: Path) -> "BuildManifest":
+        """
+        Load the manifest of a cache folder.
+
+        A missing, unreadable or outdated manifest gives an empty manifest, so that every
+        table is converted again.
+
+        Args:
+            cache_dir (Path): Folder holding the manifest and the cached shards.
+
+        Returns:
+            BuildManifest: The loaded manifest.
+        """
+        manifest = cls(cache_dir)
+        try:
+            with open(manifest.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+        if data.get("version") == MANIFEST_VERSION:
+            manifest.tables = data.get("tables", {})
+            manifest.files = data.get("files", {})
+        return manifest
+
+    @property
+    def path(self) -> Path:
+        """The manifest file."""
+        return self.cache_dir / MANIFEST_NAME
+
+    def save(self) -> None:
+        """Write the manifest atomically, so that an interrupted run cannot corrupt it."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": MANIFEST_VERSION,
+                    "tables": self.tables,
+                    "files": self.files,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, self.path)
+
+    def csv_hash(self, csv_file: Path) -> str | None:
+        """
+        Return the content hash of a CSV file, reusing the stored hash if the file size
+        and modification time did not change.
+
+        Args:
+            csv_file (Path): The CSV file.
+
+        Returns:
+            str | None: The hex digest, or None if the file does not exist.
+        """
+        try:
+            stat = csv_file.stat()
+        except FileNotFoundError:
+            return None
+        key = str(csv_file)
+        known = self.files.get(key)
+        if (
+            known
+            and known.get("size") == stat.st_size
+            and known.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return known["sha256"]
+        sha256 = hash_file(csv_file)
+        self.files[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+        }
+        return sha256
+
+    def fingerprint(
+        self, csv_file: Path, raw_config: dict[str, dict], csv_name: str
+    ) -> str | None:
+        """
+        Compute the fingerprint of a table.
+
+        Args:
+            csv_file (Path): The CSV file of the table.
+            raw_config (dict): The raw TOML config (before `rdf_process_predicates`).
+            csv_name (str): The table name.
+
+        Returns:
+            str | None: The fingerprint, or None if the CSV file does not exist (such tables
+                are never cached).
+        """
+        csv_hash = self.csv_hash(csv_file)
+        if csv_hash is None:
+            return None
+        general = {
+            key: value
+            for key, value in raw_config.get("general", {}).items()
+            if key not in IGNORED_GENERAL_KEYS
+        }
+        digest = hashlib.sha256()
+        for part in (
+            str(MANIFEST_VERSION),
+            csv_hash,
+            normalize_config(raw_config.get(csv_name, {})),
+            normalize_config(raw_config.get("namespaces", {})),
+            normalize_config(general),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def shard_path(self, csv_name: str, suffix: str) -> Path:
+        """Return the cached shard file of a table."""
+        return self.cache_dir / f"{csv_name}{suffix}"
+
+    def is_fresh(self, csv_name: str, fingerprint: str | None) -> bool:
+        """
+        Check whether the cached shard of a table was built from the same fingerprint and
+        still exists.
+
+        Args:
+            csv_name (str): The table name.
+            fingerprint (str | None): The current fingerprint of the table.
+
+        Returns:
+            bool: True if the cached shard can be reused.
+        """
+        entry = self.tables.get(csv_name)
+        return (
+            fingerprint is not None
+            and entry is not None
+            and entry.get("fingerprint") == fingerprint
+            and (self.cache_dir / entry["shard"]).exists()
+        )
+
+    def triple_count(self, csv_name: str) -> int:
+        """Return the number of triples of a cached shard."""
+        return self.tables[csv_name]["triples"]
+
+    def table_stats(self, csv_name: str) -> dict[str, Any]:
+        """Return the conversion statistics recorded with a shard (without timings)."""
+        return self.tables.get(csv_name, {}).get("stats", {})
+
+    def record(
+        self,
+        csv_name: str,
+        fingerprint: str | None,
+        shard_path: Path,
+        triples: int,
+        stats: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Record a freshly converted shard. Tables without fingerprint are forgotten.
+
+        Args:
+            csv_name (str): The table name.
+            fingerprint (str | None): The fingerprint the shard was built from.
+            shard_path (Path): The shard file.
+            triples (int): The number of triples of the shard.
+            stats (dict, optional): The conversion statistics of the table (see
+                `rdfconv.stats.ConversionStats.to_dict`).
+        """
+        if fingerprint is None:
+            self.tables.pop(csv_name, None)
+            return
+        self.tables[csv_name] = {
+            "fingerprint": fingerprint,
+            "shard": shard_path.name,
+            "triples": triples,
+        }
+        if stats:
+            # Timings are left out: cached tables take no time on later runs
+            self.tables[csv_name]["stats"] = {
+                key: value for key, value in stats.items() if key != "phases"
+            }
+
+    def prune(self, csv_names: list[str]) -> None:
+        """
+        Forget the tables that are no longer in the config and delete their shards.
+
+        Args:
+            csv_names (list[str]): The tables of the current config.
+        """
+        for csv_name in set(self.tables) - set(csv_names):
+            entry = self.tables.pop(csv_name)
+            (self.cache_dir / entry["shard"]).unlink(missing_ok=True)
@@ -0,0 +1,194 @@
+"""
+Conversion statistics for the general RDF conversion script.
+
+`ConversionStats` keeps exact counters while triples are emitted, so that the output file
+never has to be read again to know what it contains:
+
+- for each table: rows read, triples emitted, cells converted, conversions done (see
+  `convert.convert_column`) and typed literals whose value does not fit their datatype
+  (e.g. an `xsd:date` of "1685");
+- for each column: triples emitted, empty cells skipped, rows without subject and rows
+  filtered out by the `if` condition;
+- for each predicate: triples emitted;
+- the time spent in each phase of the conversion (see `PHASES`).
+
+Counts are taken before deduplication: a triple produced twice is counted twice. The number
+of triples in the output is recorded separately by `main`: distinct triples for graph
+outputs, written triples for streaming outputs.
+
+Usage:
+    ```python
+    stats = ConversionStats()
+    with stats.phase("read"):
+        df = ...
+    stats.save(path)
+    stats.log_summary()
+    ```
+"""
+
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Phases of a conversion, in the order in which they happen for each chunk of a CSV
+PHASES = ("read", "transform", "fill_down", "emit", "store", "serialize")
+# Counters kept for each column of a table
+COLUMN_COUNTERS = ("triples", "nulls", "missing_subjects", "filtered")
+# Counters kept for each table
+TABLE_COUNTERS = ("rows", "triples", "cells", "conversions", "ill_typed_literals")
+# Sentinel marking the end of a timed iterator
+_END = object()
+
+
+class ConversionStats:
+    """
+    Counters and phase timings of a conversion.
+
+    Instances can be merged, so that the statistics of tables converted in worker processes
+    (or reused from an incremental build) are combined in the main process.
+
+    Attributes:
+        tables (dict[str, dict]): For each table, the `TABLE_COUNTERS` and a "columns"
+            dict holding the `COLUMN_COUNTERS` of each column.
+        predicates (Counter): Number of triples emitted per predicate URI.
+        phases (dict[str, float]): Seconds spent in each phase. Phases of tables converted
+            in parallel are added up, so their sum can exceed the wall time.
+        cached_tables (list[str]): Tables reused from an incremental build.
+        output (dict[str, Any]): Information on the output file (path, triples, and
+            whether they are "distinct").
+    """
+
+    def __init__(self):
+        self.tables: dict[str, dict] = {}
+        self.predicates: Counter = Counter()
+        self.phases: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+        self.cached_tables: list[str] = []
+        self.output: dict[str, Any] = {}
+
+    def table(self, csv_name: str) -> dict:
+        """Return the counters of a table, creating them if needed."""
+        table = self.tables.get(csv_name)
+        if table is None:
+            table = dict.fromkeys(TABLE_COUNTERS, 0)
+            table["columns"] = {}
+            self.tables[csv_name] = table
+        return table
+
+    def column(self, csv_name: str, col: str) -> dict:
+        """Return the counters of a column, creating them if needed."""
+        columns = self.table(csv_name)["columns"]
+        column = columns.get(col)
+        if column is None:
+            column = columns[col] = dict.fromkeys(COLUMN_COUNTERS, 0)
+        return column
+
+    def add_triples(self, csv_name: str, col: str, triples: list[tuple]) -> None:
+        """
+        Count the triples emitted by a column.
+
+        Args:
+            csv_name (str): The table name.
+            col (str): The column name.
+            triples (list[tuple]): The (subject, predicate, object) triples emitted.
+        """
+        self.table(csv_name)["triples"] += len(triples)
+        self.column(csv_name, col)["triples"] += len(triples)
+        self.predicates.update(str(p) for _, p, _ in triples)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the `with` block to a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    def timed(self, name: str, iterable: Iterable) -> Iterator:
+        """
+        Iterate over an iterable, adding the time spent producing each item to a phase.
+
+        The time spent by the caller between items is not counted, so that a lazy
+        generator can be timed separately from its consumer.
+        """
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                item = next(iterator, _END)
+            if item is _END:
+                return
+            yield item
+
+    @property
+    def triple_count(self) -> int:
+        """The number of triples emitted, before deduplication."""
+        return sum(table["triples"] for table in self.tables.values())
+
+    def merge(self, other: "ConversionStats | dict") -> None:
+        """
+        Add the counters and timings of another instance (or of its `to_dict`).
+
+        Args:
+            other (ConversionStats | dict): The statistics to add.
+        """
+        if isinstance(other, ConversionStats):
+            other = other.to_dict()
+        for csv_name, other_table in other.get("tables", {}).items():
+            table = self.table(csv_name)
+            for counter in TABLE_COUNTERS:
+                table[counter] += other_table.get(counter, 0)
+            for col, other_column in other_table.get("columns", {}).items():
+                column = self.column(csv_name, col)
+                for counter in COLUMN_COUNTERS:
+                    column[counter] += other_column.get(counter, 0)
+        self.predicates.update(other.get("predicates", {}))
+        for name, seconds in other.get("phases", {}).items():
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dict."""
+        return {
+            "triples": self.triple_count,
+            "output": self.output,
+            "phases": {name: round(s, 3) for name, s in self.phases.items()},
+            "tables": self.tables,
+            "cached_tables": self.cached_tables,
+            "predicates": dict(self.predicates.most_common()),
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the statistics to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+    def log_summary(self) -> None:
+        """Log the number of triples of each table and the time spent in each phase."""
+        for csv_name, table in self.tables.items():
+            logger.info(
+                "[%s] %d rows -> %d triples%s",
+                csv_name,
+                table["rows"],
+                table["triples"],
+                " (cached)" if csv_name in self.cached_tables else "",
+            )
+            if table["ill_typed_literals"]:
+                logger.info(
+                    "[%s] %d typed literals do not fit their datatype",
+                    csv_name,
+                    table["ill_typed_literals"],
+                )
+        logger.info(
+            "Emitted %d triples with %d predicates.",
+            self.triple_count,
+            len(self.predicates),
+        )
+        logger.info(
+            "Time per phase: %s",
+            ", ".join(f"{name} {s:.2f}s" for name, s in self.phases.items()),
+        )
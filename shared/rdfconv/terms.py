@@ -0,0 +1,106 @@
+"""
+Interned RDF terms shared by the RDF conversion scripts.
+
+Converters create a new `URIRef` or `Literal` for every occurrence of a term, although most
+objects repeat: the same Wikidata QIDs, types, links to other entities and categorical
+values appear thousands to millions of times. rdflib keeps every object it is given, so each
+occurrence costs its own string in a large graph.
+
+`TermFactory` builds terms through bounded LRU caches: equal arguments return the same
+term object, which is only constructed once. Terms are immutable, so sharing them is safe.
+The caches have a size cap, so that a long run over unique values (e.g. record subjects or
+free-text names) cannot grow them without bound; such terms gain nothing from interning and
+are best built directly.
+
+- `uri(value)` returns an interned `URIRef`.
+- `literal(value, lang=..., datatype=...)` returns an interned `Literal`. The value must be
+  hashable (strings, numbers, dates); pass `lang` and `datatype` as keywords.
+- `intern(term)` returns the first equal term seen, e.g. for terms unpickled from a worker
+  process, which are new objects.
+
+The module-level functions use a default factory shared by every converter of a process;
+worker processes each have their own. The project converters (diamm, musicbrainz, rism) import
+this module with `shared/` on `PYTHONPATH`.
+
+Usage:
+    ```python
+    from rdfconv import terms
+
+    g.add((subject, terms.uri(f"{WDT}P31"), terms.uri(f"{WD}{qid}")))
+    g.add((subject, RDFS.label, terms.literal(name, lang="en")))
+    logger.info("Term cache: %s", terms.format_cache_info())
+    ```
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from rdflib import Literal, URIRef
+from rdflib.term import Node
+
+# Default number of terms kept by each cache of a factory
+DEFAULT_MAXSIZE = 1 << 18
+
+
+def _identity(term: Node) -> Node:
+    return term
+
+
+class TermFactory:
+    """
+    Builds URIRef and Literal terms through bounded LRU caches.
+
+    Attributes:
+        maxsize (int | None): Number of terms kept by each cache (None: unbounded).
+        uri (Callable[[str], URIRef]): Returns the interned URIRef of a string.
+        literal (Callable[..., Literal]): Returns the interned Literal of a value, with
+            the same arguments as `Literal`. Arguments are typed, so that e.g. `1` and
+            `True` give different literals.
+        intern (Callable[[Node], Node]): Returns the first term seen that is equal to the
+            given term.
+    """
+
+    def __init__(self, maxsize: int | None = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.uri = lru_cache(maxsize=maxsize)(URIRef)
+        self.literal = lru_cache(maxsize=maxsize, typed=True)(Literal)
+        self.intern = lru_cache(maxsize=maxsize)(_identity)
+
+    def cache_info(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the hits, misses, maxsize and current size of each cache.
+
+        Returns:
+            dict: For "uri", "literal" and "intern", a dict of the counters.
+        """
+        return {
+            name: getattr(self, name).cache_info()._asdict()
+            for name in ("uri", "literal", "intern")
+        }
+
+    def format_cache_info(self) -> str:
+        """Return the counters of the caches as a line of text, for logging."""
+        parts = []
+        for name, info in self.cache_info().items():
+            calls = info["hits"] + info["misses"]
+            if calls:
+                parts.append(
+                    f"{name} {info['hits']}/{calls} hits ({info['currsize']} cached)"
+                )
+        return ", ".join(parts) or "unused"
+
+    def clear(self) -> None:
+        """Empty the caches and reset their counters."""
+        self.uri.cache_clear()
+        self.literal.cache_clear()
+        self.intern.cache_clear()
+
+
+# Factory shared by the converters of a process
+default_factory = TermFactory()
+uri = default_factory.uri
+literal = default_factory.literal
+intern = default_factory.intern
+cache_info = default_factory.cache_info
+format_cache_info = default_factory.format_cache_info
+clear = default_factory.clear
@@ -8,6 +8,12 @@ The generated TOML file will include each CSV file in the folder and its column
 default, all headers are paired with empty string values, which must be manually filled in to
 define how the dataset should be converted to RDF.
 
+Each CSV file is profiled in a single streaming pass (see `rdfconv.csvprofile`), in parallel
+across files; files larger than `--sample-mb` are profiled from a sample. The profile of each
+column (empty cells, distinct values, share of Wikidata IDs, URLs, dates...) is written as a
+comment above it, with a suggested `datatype`, `lang` or `prefix` when the values agree on
+one (see `suggest_mapping`).
+
 Alternatively, the script can update an existing TOML file by scanning the current CSV
 structure in the input folder. Comments are
 not preserved during updating.
@@ -17,28 +23,61 @@ Note:
     This script must be run with the current working directory set to `/code`.
 Usage:
 
-    python -m rdfconv.tomlgen <path to csv folder> --output <config output path>
-    python -m rdfconv.tomlgen --update <config_path>
+    python -m rdfconv.tomlgen --input <path to csv folder> --output <config output path>
+    python -m rdfconv.tomlgen --update <config_path> [--jobs N] [--sample-mb 64]
 
 See the user guide at `doc/rdf_conversion/using_rdfconv_script.md` for detailed instructions
 and workflow context.
 """
 
 import argparse
+from collections import Counter
 from pathlib import Path
 import os
 import logging
-import pandas as pd
+import re
 
 # tomli reads TOML files, tomli_w writes TOML files
 import tomli
 import tomli_w
 
+from rdfconv.csvprofile import (
+    KINDS,
+    SAMPLE_BYTES,
+    ColumnProfile,
+    TableProfile,
+    profile_csv_files,
+)
 
 logger = logging.getLogger(__name__)
 if not logger.hasHandlers():
     logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
+# Share of the non-empty values of a column that must agree for a suggestion
+SUGGESTION_THRESHOLD = 0.95
+# Language codes recognized as the last word of a column name (e.g. "name_fr", "title (de)")
+LANGUAGE_CODES = frozenset(
+    "ar ca cs cy da de el en es eu fi fr ga he hu it ja ko la nl pl pt ru sv tr uk zh".split()
+)
+# Writing systems used by a single language, for text columns without language code
+SCRIPT_LANGUAGES = {"Greek": "el", "Hebrew": "he", "Kana": "ja", "Hangul": "ko"}
+# How each kind of value is named in profile comments
+KIND_LABELS = {
+    "wikidata": "Wikidata IDs",
+    "url": "URLs",
+    "date": "dates",
+    "datetime": "date-times",
+    "number": "numbers",
+    "text": "text",
+}
+DEFAULT_NAMESPACES = {
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+    "wd": "http://www.wikidata.org/entity/",
+    "wdt": "http://www.wikidata.org/prop/direct/",
+}
+
 
 def diff_nested_keys(old_dict, new_dict):
     """
@@ -114,7 +153,57 @@ def log_toml_diff(diff_dict):
     return "\n".join(lines)
 
 
-def create_toml(input_folder: Path):
+def profile_folder(
+    input_folder: Path, jobs: int | None = None, sample_bytes: int = SAMPLE_BYTES
+) -> dict[str, TableProfile]:
+    """
+    Profile the CSV files of a folder (see `rdfconv.csvprofile`).
+
+    Files that cannot be read, or that have no data row, are skipped with a warning.
+
+    Args:
+        input_folder (Path): Path to the folder containing reconciled CSV files.
+        jobs (int, optional): Number of worker processes. Defaults to one per CPU, up to
+            the number of files.
+        sample_bytes (int): Files larger than this are profiled from a sample.
+
+    Returns:
+        dict[str, TableProfile]: The profile of each CSV file, by file name without
+        extension, in file name order.
+
+    Raises:
+        ValueError: If the input folder is invalid or contains no valid CSV files.
+    """
+    # === Search input_folder for CSV files ===
+    if not input_folder.is_dir():
+        raise ValueError(f"'{input_folder}' is not a valid directory.")
+    csv_files = sorted(input_folder.glob("*.csv"))
+    if not csv_files:
+        raise ValueError(f"No CSV file found in '{input_folder}'.")
+    # === Profile CSV files ===
+    if jobs is None:
+        jobs = min(len(csv_files), os.cpu_count() or 1)
+    logger.info("Processing CSV files in '%s':", input_folder)
+    profiles = {}
+    for csv_file, profile in profile_csv_files(csv_files, jobs, sample_bytes).items():
+        if isinstance(profile, Exception):
+            logger.warning("Could not process '%s': %s", csv_file.name, profile)
+        elif not profile.rows:
+            logger.warning("Could not process '%s' because it is empty.", csv_file.name)
+        else:
+            # Use file name without extension
+            profiles[csv_file.stem] = profile
+            logger.info(
+                "Processed '%s' - %d columns", csv_file.name, len(profile.columns)
+            )
+    if not profiles:
+        raise ValueError(f"No valid CSV file can be processed in {input_folder}.")
+    return profiles
+
+
+def create_toml(
+    input_folder: Path, profiles: dict[str, TableProfile] | None = None
+) -> dict:
     """
     Generate a TOML configuration dictionary from CSV files in the input
     folder.
@@ -127,6 +216,8 @@ def create_toml(input_folder: Path):
 
     Args:
         input_folder (Path): Path to the folder containing reconciled CSV files.
+        profiles (dict[str, TableProfile], optional): The profiles of the CSV files, as
+            returned by `profile_folder`. The folder is profiled if not given.
 
     Returns:
         dict: The TOML data as a dictionary, with each table representing a CSV file and its
@@ -135,35 +226,16 @@ def create_toml(input_folder: Path):
     Raises:
         ValueError: If the input folder is invalid or contains no valid CSV files.
     """
-    # === Search input_folder for CSV files ===
-    if not input_folder.is_dir():
-        raise ValueError(f"'{input_folder}' is not a valid directory.")
-    csv_files = list(input_folder.glob("*.csv"))
-    if not csv_files:
-        raise ValueError(f"No CSV file found in '{input_folder}'.")
-    # === Process CSV files ===
-    logger.info("Processing CSV files in '%s':", input_folder)
-    csv_tables = {}
-    for csv_file in sorted(csv_files):
-        try:
-            df = pd.read_csv(csv_file)
-            if df.empty:
-                logger.warning(
-                    "Could not process '%s' because it is empty.", csv_file.name
-                )
-                continue
-            table_name = csv_file.stem  # Use file name without extension
-            csv_tables[table_name] = {
-                # Each table must have a PRIMARY_KEY field
-                "PRIMARY_KEY": df.columns[0],
-                **{col: "" for col in df.columns},
-            }
-            logger.info("Processed '%s' - %d columns", csv_file.name, len(df.columns))
-        except Exception as e:
-            logger.warning("Could not process '%s': %s", csv_file.name, e)
-            continue
-    if not csv_tables:
-        raise ValueError(f"No valid CSV file can be processed in {input_folder}.")
+    if profiles is None:
+        profiles = profile_folder(input_folder)
+    csv_tables = {
+        table_name: {
+            # Each table must have a PRIMARY_KEY field
+            "PRIMARY_KEY": next(iter(profile.columns)),
+            **{col: "" for col in profile.columns},
+        }
+        for table_name, profile in profiles.items()
+    }
     # === Prepare the default TOML tables ===
     # Find the relative path to the input folder from the base path
     script_dir = Path(__file__).parent.resolve()
@@ -174,28 +246,254 @@ def create_toml(input_folder: Path):
         "rdf_output_folder": "",
         "test_mode": False,
     }
-    namespaces = {
-        "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
-        "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
-        "xsd": "http://www.w3.org/2001/XMLSchema#",
-        "wd": "http://www.wikidata.org/entity/",
-        "wdt": "http://www.wikidata.org/prop/direct/",
+    toml_dict = {
+        "general": general_headers,
+        "namespaces": dict(DEFAULT_NAMESPACES),
+        **csv_tables,
     }
-    toml_dict = {"general": general_headers, "namespaces": namespaces, **csv_tables}
     return toml_dict
 
 
-def update_toml(toml_path: Path):
+def find_uri_base(table: TableProfile, column: str) -> str | None:
+    """
+    Find the namespace that turns the values of a column into the URLs of another column
+    of the same rows, e.g. "https://thesession.org/tunes/" for a `tune_id` column next to
+    a `tune_url` column.
+
+    The rows of the reservoir sample of the table are compared.
+
+    Args:
+        table (TableProfile): The profile of the CSV file.
+        column (str): A column of identifiers.
+
+    Returns:
+        str | None: The namespace, if it matches most rows with both values.
+    """
+    names = list(table.columns)
+    index = names.index(column)
+    url_indexes = [
+        i
+        for i, profile in enumerate(table.columns.values())
+        if profile.fraction("url") >= SUGGESTION_THRESHOLD
+    ]
+    best, best_count = None, 0
+    for url_index in url_indexes:
+        bases: Counter = Counter()
+        pairs = 0
+        for row in table.row_sample:
+            value, url = row[index], row[url_index]
+            if not value or not url:
+                continue
+            pairs += 1
+            if (
+                len(url) > len(value)
+                and url.endswith(value)
+                and url[-len(value) - 1] in "/#="
+            ):
+                bases[url[: -len(value)]] += 1
+        if bases:
+            base, count = bases.most_common(1)[0]
+            if (
+                count >= 2
+                and count >= SUGGESTION_THRESHOLD * pairs
+                and count > best_count
+            ):
+                best, best_count = base, count
+    return best
+
+
+def suggest_mapping(
+    table: TableProfile,
+    column: ColumnProfile,
+    namespaces: dict[str, str],
+    primary_key: bool = False,
+) -> tuple[dict[str, str], str | None]:
+    """
+    Suggest mapping keywords for a column from its profile.
+
+    - `datatype = "xsd:date"` or `"xsd:dateTime"` for ISO dates and date-times;
+    - `lang` for text columns whose name ends with a language code, or written in a
+      script used by a single language;
+    - `prefix` for identifiers that complete the URLs of another column (see
+      `find_uri_base`). If the namespace is not in `namespaces` yet, a note asks to add it.
+
+    Args:
+        table (TableProfile): The profile of the CSV file.
+        column (ColumnProfile): The profile of the column.
+        namespaces (dict[str, str]): The namespaces of the config.
+        primary_key (bool): Whether the column is the PRIMARY_KEY, whose values must be
+            URIs.
+
+    Returns:
+        tuple: The suggested keywords and values, and a note (or None).
+    """
+    if not column.values:
+        return {}, None
+    if column.fraction("date") >= SUGGESTION_THRESHOLD:
+        return {"datatype": "xsd:date"}, None
+    if column.fraction("datetime") >= SUGGESTION_THRESHOLD:
+        return {"datatype": "xsd:dateTime"}, None
+    if column.fraction("wikidata", "url") >= SUGGESTION_THRESHOLD:
+        return {}, None
+    if column.identifiers >= SUGGESTION_THRESHOLD * column.values:
+        base = find_uri_base(table, column.name)
+        if base is not None:
+            prefix = next(
+                (name for name, uri in namespaces.items() if uri == base), None
+            )
+            if prefix is not None:
+                return {"prefix": prefix}, None
+            return (
+                {},
+                f'values complete "{base}": add it to [namespaces], then set `prefix`',
+            )
+        if primary_key:
+            return {}, "values are not URIs: set `prefix` so that they can be subjects"
+    if column.fraction("text") >= SUGGESTION_THRESHOLD:
+        words = re.split(r"[^a-z]+", column.name.lower())
+        lang = next((word for word in reversed(words) if word), None)
+        if lang in LANGUAGE_CODES:
+            return {"lang": lang}, None
+        if column.scripts:
+            script, count = column.scripts.most_common(1)[0]
+            if script in SCRIPT_LANGUAGES and count >= SUGGESTION_THRESHOLD * sum(
+                column.scripts.values()
+            ):
+                return {"lang": SCRIPT_LANGUAGES[script]}, None
+    return {}, None
+
+
+def _percent(part: int, total: int) -> str:
+    share = 100 * part / total
+    return "<1%" if 0 < share < 1 else f"{share:.0f}%"
+
+
+def _round(count: int) -> int:
+    # Estimates are rounded to two significant digits, so that they do not change from
+    # one run to the next
+    digits = max(len(str(count)) - 2, 0)
+    return round(count, -digits)
+
+
+def describe_column(column: ColumnProfile) -> str:
+    """
+    Summarize the profile of a column in one line, e.g.
+    "12% empty, ~1,200 distinct: 98% Wikidata IDs, 2% text (Latin)".
+
+    Args:
+        column (ColumnProfile): The profile of the column.
+
+    Returns:
+        str: The summary.
+    """
+    if not column.values:
+        return "always empty"
+    distinct = (
+        f"{column.distinct:,}"
+        if column.distinct_exact
+        else f"~{_round(column.distinct):,}"
+    )
+    parts = [
+        f"{_percent(kind_count, column.values)} {KIND_LABELS[kind]}"
+        for kind in KINDS
+        if (kind_count := column.kinds[kind])
+    ]
+    if column.scripts:
+        scripts = ", ".join(script for script, _ in column.scripts.most_common(2))
+        parts[-1] += f" ({scripts})"
+    return (
+        f"{_percent(column.nulls, column.cells)} empty, "
+        f"{distinct} distinct: " + ", ".join(parts)
+    )
+
+
+def describe_table(table: TableProfile) -> str:
+    """
+    Summarize the profile of a CSV file in one line, e.g. "thesession.csv: 1,000 rows".
+
+    Args:
+        table (TableProfile): The profile of the CSV file.
+
+    Returns:
+        str: The summary.
+    """
+    text = f"{table.path.name}: "
+    if table.sampled:
+        text += (
+            f"~{_round(table.estimated_rows):,} rows, estimated from "
+            f"{table.sampled_bytes / (1 << 20):.0f} MiB of "
+            f"{table.file_bytes / (1 << 20):,.0f} MiB"
+        )
+    else:
+        text += f"{table.rows:,} rows"
+    if table.skipped_rows:
+        text += f" ({table.skipped_rows:,} malformed rows skipped)"
+    return text
+
+
+def dump_toml(toml_data: dict, profiles: dict[str, TableProfile]) -> str:
+    """
+    Write a config as TOML text, with the profile and suggested mapping of each column
+    still unmapped (empty string value) as comments above it.
+
+    Args:
+        toml_data (dict): The config.
+        profiles (dict[str, TableProfile]): The profiles of the CSV files, by table name.
+
+    Returns:
+        str: The TOML text.
+    """
+    namespaces = toml_data.get("namespaces", {})
+    parts = []
+    for table_name, fields in toml_data.items():
+        text = tomli_w.dumps({table_name: fields})
+        table = profiles.get(table_name)
+        if table is None or not isinstance(fields, dict):
+            parts.append(text)
+            continue
+        lines = text.splitlines(keepends=True)
+        comments = {}
+        for name, column in table.columns.items():
+            if fields.get(name) != "":
+                continue
+            suggestion, note = suggest_mapping(
+                table, column, namespaces, name == fields.get("PRIMARY_KEY")
+            )
+            column_comments = [f"# {describe_column(column)}\n"]
+            if suggestion:
+                # Inline TOML, ready to be copied as the value of the column
+                inline = ", ".join(
+                    f'{key} = "{value}"' for key, value in suggestion.items()
+                )
+                column_comments.append(f"# suggested: {{{inline}}}\n")
+            if note:
+                column_comments.append(f"# note: {note}\n")
+            comments[tomli_w.dumps({name: ""})] = column_comments
+        annotated = [f"# {describe_table(table)}\n"]
+        for line in lines:
+            annotated.extend(comments.pop(line, ()))
+            annotated.append(line)
+        parts.append("".join(annotated))
+    return "\n".join(parts)
+
+
+def update_toml(
+    toml_path: Path, jobs: int | None = None, sample_bytes: int = SAMPLE_BYTES
+):
     """
     Update an existing TOML configuration file to match the current structure of the CSV files
     in the specified folder.
 
     The input folder is determined from the [general][csv_folder] field in the TOML file. New
     columns are added, and outdated columns are removed. Existing values are preserved where
-    possible. Changes are logged to standard output.
+    possible. Changes are logged to standard output. Columns that are still unmapped get
+    their profile and suggested mapping as comments (see `dump_toml`).
 
     Args:
         toml_path (Path): Path to the TOML file to update.
+        jobs (int, optional): Number of processes profiling the CSV files (see
+            `profile_folder`).
+        sample_bytes (int): CSV files larger than this are profiled from a sample.
 
     Raises:
         FileNotFoundError: If the TOML file does not exist.
@@ -219,7 +517,8 @@ def update_toml(toml_path: Path):
     csv_path = (script_path / rel_csv_path).resolve()
     logger.info("[UPDATE] Using csv_folder from TOML: %s", csv_path)
     # === Create a new TOML from the CSV files in the input folder ===
-    new_toml = create_toml(csv_path)
+    profiles = profile_folder(csv_path, jobs, sample_bytes)
+    new_toml = create_toml(csv_path, profiles)
     # === Insert the existing general and namespaces headers ===
     new_toml["general"] = existing_toml.get("general", {})
     new_toml["namespaces"] = existing_toml.get("namespaces", {})
@@ -242,8 +541,8 @@ def update_toml(toml_path: Path):
     else:
         logger.info("No changes made. The TOML file is already up-to-date.")
         return
-    with open(toml_path, "wb") as fi:
-        tomli_w.dump(new_toml, fi)
+    with open(toml_path, "w", encoding="utf-8") as fi:
+        fi.write(dump_toml(new_toml, profiles))
     logger.info(40 * "-")
     logger.info("Successfully updated '%s'", toml_path)
 
@@ -284,21 +583,42 @@ def main():
             "[general][csv_folder]."
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of processes profiling CSV files. Default: one per CPU",
+    )
+    parser.add_argument(
+        "--sample-mb",
+        type=int,
+        default=SAMPLE_BYTES >> 20,
+        help=(
+            "CSV files larger than this (in MiB) are profiled from a sample of this size. "
+            f"Default: {SAMPLE_BYTES >> 20}"
+        ),
+    )
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be a positive integer")
+    if args.sample_mb < 1:
+        parser.error("--sample-mb must be a positive integer")
+    sample_bytes = args.sample_mb << 20
     if args.update:
-        update_toml(Path(args.update))
+        update_toml(Path(args.update), args.jobs, sample_bytes)
     elif args.input and args.output:
         # === Ensure that output does not overwrite an existing file ===
         output_path = args.output
         if output_path.exists():
             raise FileExistsError(f"Error: '{output_path}' already exists.")
         # === Create TOML data from the input folder ===
-        toml_data = create_toml(Path(args.input))
+        profiles = profile_folder(Path(args.input), args.jobs, sample_bytes)
+        toml_data = create_toml(Path(args.input), profiles)
         # === Write TOML data to file ===
         logger.info("Finish processing. Saving configuration to '%s'", output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "wb") as f:
-            tomli_w.dump(toml_data, f)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(dump_toml(toml_data, profiles))
         logger.info(40 * "-")
         logger.info("Configuration saved to '%s'", output_path)
     else:
@@ -0,0 +1,482 @@
+"""
+Streaming RDF writers for the general RDF conversion script.
+
+Instead of collecting every triple in an in-memory `rdflib.Graph` and serializing it at the
+end, these writers buffer a bounded chunk of triples and append it to the output file as
+soon as the chunk is full. Peak memory is therefore bounded by the chunk size rather than by
+the size of the dataset.
+
+- `NTriplesWriter` writes one triple per line (N-Triples).
+- `TurtleWriter` writes the `[namespaces]` of the config as `@prefix` declarations, shortens
+  URIs with these prefixes, and groups the triples of each chunk by subject.
+
+Duplicate triples are removed within a chunk only; a triple repeated in two different chunks
+is written twice. Triple stores deduplicate triples on load, so the loaded data is the same
+as with the in-memory graph.
+
+Output can be compressed (gzip, or zstd with the `zstandard` package) and split into rolling
+shards of at most `max_triples` triples or `max_bytes` bytes (before compression). Each
+shard starts with its own header, so that it can be loaded on its own. `write_shard_manifest`
+lists the shards written and their triple counts.
+
+Usage:
+    ```python
+    with TurtleWriter(path, namespaces) as writer:
+        writer.write(triples)
+
+    with TurtleWriter(path, namespaces, compression="gzip", max_triples=10**7) as writer:
+        writer.write(triples)
+    write_shard_manifest(writer, manifest_path, "turtle")
+    ```
+"""
+
+import gzip
+import io
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+from rdflib import URIRef, Literal
+from rdflib.term import Node
+
+# Number of triples buffered before they are written to disk
+DEFAULT_CHUNK_SIZE = 100_000
+# Number of serialized terms kept in memory to avoid re-serializing repeated terms
+TERM_CACHE_SIZE = 500_000
+# Supported output compressions and their file suffixes
+COMPRESSIONS = {"gzip": ".gz", "zstd": ".zst"}
+# gzip level 6 compresses RDF almost as well as 9, several times faster
+GZIP_LEVEL = 6
+# Number of characters of a headerless shard copied at a time by `copy_shard`
+COPY_BATCH_SIZE = 1 << 20
+
+# Simplified Turtle PN_LOCAL: URIs whose local part does not match are written in full
+PN_LOCAL_PATTERN = re.compile(r"^[A-Za-z0-9_](?:[A-Za-z0-9_.\-]*[A-Za-z0-9_\-])?$")
+# Escapes of a quoted lexical form; line breaks are escaped so that every triple (N-Triples)
+# or subject block (Turtle) ends at a line break
+LEXICAL_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def utf8_len(text: str) -> int:
+    """Return the number of bytes of a string encoded in UTF-8."""
+    # str.isascii() does not scan the string, so ASCII text is not encoded
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+def open_output(path: Path, compression: str | None = None) -> TextIO:
+    """
+    Open a text file for writing, optionally compressed.
+
+    Args:
+        path (Path): The file to create or overwrite.
+        compression (str, optional): "gzip" or "zstd" (see `COMPRESSIONS`).
+
+    Returns:
+        TextIO: The open text stream.
+
+    Raises:
+        ValueError: If the compression is unknown, or if zstd is requested and the
+            `zstandard` package is not installed.
+    """
+    if compression is None:
+        return open(path, "w", encoding="utf-8", newline="\n", buffering=1 << 20)
+    if compression == "gzip":
+        return gzip.open(
+            path, "wt", encoding="utf-8", newline="\n", compresslevel=GZIP_LEVEL
+        )
+    if compression == "zstd":
+        try:
+            import zstandard  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ValueError(
+                "compression 'zstd' requires the zstandard package (pip install zstandard)."
+            ) from e
+        return zstandard.open(path, "wt", encoding="utf-8", newline="\n")
+    raise ValueError(
+        f"Invalid compression '{compression}'. Expected one of: {', '.join(COMPRESSIONS)}"
+    )
+
+
+class TripleWriter:
+    """
+    Base class for streaming RDF writers.
+
+    Subclasses implement `header`, `_format_chunk` and `_iter_blocks`.
+
+    Attributes:
+        path (Path): The output file. Compressed files get the suffix of their
+            compression; shards are named `{stem}-00001{suffix}`, `{stem}-00002{suffix}`...
+        namespaces (dict[str, str]): Prefixes and namespace URIs from the config.
+        chunk_size (int): Number of triples buffered before writing to disk.
+        compression (str | None): "gzip", "zstd" or None.
+        max_triples (int | None): Maximum number of triples per shard.
+        max_bytes (int | None): Maximum size of a shard in bytes, before compression. A
+            subject block (Turtle) or triple larger than the limit still makes a single
+            shard.
+        triple_count (int): Number of triples written so far (after in-chunk
+            deduplication).
+        shards (list[dict]): The files closed so far, with their "path" (file name),
+            "triples", "bytes" (before compression) and "file_bytes".
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        namespaces: dict[str, str],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        file: TextIO | None = None,
+        header: bool = True,
+        compression: str | None = None,
+        max_triples: int | None = None,
+        max_bytes: int | None = None,
+    ):
+        """
+        Args:
+            path (Path): The output file. It is created or overwritten.
+            namespaces (dict[str, str]): Prefixes and namespace URIs from the config.
+            chunk_size (int): Number of triples buffered before writing to disk.
+            file (TextIO, optional): An already open text stream to write to instead of
+                opening `path`. Cannot be combined with compression or shards.
+            header (bool): Whether to start the file (or each shard) with the header (e.g.
+                Turtle prefixes). Shards meant to be concatenated are written without
+                header.
+            compression (str, optional): "gzip" or "zstd".
+            max_triples (int, optional): Start a new shard after this many triples.
+            max_bytes (int, optional): Start a new shard before exceeding this size.
+
+        Raises:
+            ValueError: If the compression is unknown, or if compression or shards are
+                requested for an already open stream.
+        """
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ValueError(
+                f"Invalid compression '{compression}'. Expected one of: {', '.join(COMPRESSIONS)}"
+            )
+        if file is not None and (compression or max_triples or max_bytes):
+            raise ValueError("Compression and shards require the writer to open files.")
+        self.path = Path(path)
+        self.namespaces = dict(namespaces)
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self.max_triples = max_triples
+        self.max_bytes = max_bytes
+        self.triple_count = 0
+        self.shards: list[dict[str, Any]] = []
+        # A dict keeps insertion order while removing duplicate triples
+        self._buffer: dict[tuple, None] = {}
+        self._term_cache: dict[Node, str] = {}
+        self._owns_file = file is None
+        self._file = file
+        self._file_path: Path | None = None
+        self._with_header = header
+        self._header_written = not header
+        # Size of the buffer that triggers a flush, so that no shard exceeds max_triples
+        self._flush_at = min(chunk_size, max_triples or chunk_size)
+        self._shard_triples = 0
+        self._shard_bytes = 0
+
+    def __enter__(self) -> "TripleWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def sharded(self) -> bool:
+        """Whether the output is split into shards."""
+        return bool(self.max_triples or self.max_bytes)
+
+    def shard_path(self, index: int) -> Path:
+        """Return the file written for the shard `index` (starting at 1)."""
+        name = self.path.name
+        if self.sharded:
+            name = f"{self.path.stem}-{index:05d}{self.path.suffix}"
+        return self.path.with_name(name + COMPRESSIONS.get(self.compression, ""))
+
+    def open(self) -> "TripleWriter":
+        """Open the output file (or the next shard) if needed and write the header."""
+        if self._file is None:
+            self._file_path = self.shard_path(len(self.shards) + 1)
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open_output(self._file_path, self.compression)
+            self._header_written = not self._with_header
+            self._shard_triples = 0
+            self._shard_bytes = 0
+        if not self._header_written:
+            header = self.header()
+            self._file.write(header)
+            self._shard_bytes += utf8_len(header)
+            self._header_written = True
+        return self
+
+    def write(self, triples: Iterable[tuple[Node, Node, Node]]) -> None:
+        """
+        Buffer triples, writing a chunk to disk each time the buffer is full.
+
+        Args:
+            triples: (subject, predicate, object) tuples of rdflib nodes.
+        """
+        buffer = self._buffer
+        for triple in triples:
+            buffer[triple] = None
+            if len(buffer) >= self._flush_at:
+                self.flush()
+                buffer = self._buffer
+
+    def flush(self) -> None:
+        """Write the buffered triples to disk."""
+        if self._file is None:
+            self.open()
+        if self._buffer:
+            triples = list(self._buffer)
+            self._buffer = {}
+            text = self._format_chunk(triples)
+            if self.max_bytes:
+                # Split the chunk at block boundaries so that shards keep to their size
+                self._write_blocks(self._iter_blocks(io.StringIO(text)))
+            else:
+                self._write_text(text, len(triples))
+            if self.max_triples:
+                room = self.max_triples - self._shard_triples
+                if room <= 0:
+                    # The next chunk starts a new shard
+                    room = self.max_triples
+                self._flush_at = min(self.chunk_size, room)
+
+    def copy_shard(self, shard_path: Path, triple_count: int) -> None:
+        """
+        Append a headerless shard written by the same writer class (see `header`).
+
+        Without shards of its own, the writer copies the file as is; otherwise, it copies
+        it subject block by subject block (see `_iter_blocks`), starting a new shard when
+        the current one is full.
+
+        Args:
+            shard_path (Path): The headerless shard.
+            triple_count (int): The number of triples of the shard.
+        """
+        self.flush()
+        with open(shard_path, "r", encoding="utf-8", newline="\n") as shard:
+            if not self.sharded:
+                shutil.copyfileobj(shard, self._file, COPY_BATCH_SIZE)
+                self.triple_count += triple_count
+                self._shard_triples += triple_count
+                self._shard_bytes += shard_path.stat().st_size
+                return
+            self._write_blocks(self._iter_blocks(shard))
+
+    def close(self) -> None:
+        """Flush remaining triples and close the output file."""
+        self.flush()
+        self._close_file()
+
+    def _overflows(
+        self, triples: int, size: int, pending_triples: int = 0, pending_bytes: int = 0
+    ) -> bool:
+        # Whether adding text to the current shard, after `pending` text not written yet,
+        # would exceed its limits. An empty shard accepts anything, so that no text is
+        # left unwritten.
+        used_triples = self._shard_triples + pending_triples
+        if not used_triples:
+            return False
+        if self.max_triples and used_triples + triples > self.max_triples:
+            return True
+        used_bytes = self._shard_bytes + pending_bytes
+        return bool(self.max_bytes) and used_bytes + size > self.max_bytes
+
+    def _write_blocks(self, blocks: Iterable[tuple[str, int]]) -> None:
+        # Write blocks of triples (see `_iter_blocks`) in batches, never splitting a
+        # block and starting a new shard before the block that does not fit
+        batch: list[str] = []
+        batch_triples = batch_bytes = 0
+        for text, count in blocks:
+            size = utf8_len(text)
+            if batch and (
+                self._overflows(count, size, batch_triples, batch_bytes)
+                or batch_bytes >= COPY_BATCH_SIZE
+            ):
+                self._write_text("".join(batch), batch_triples, batch_bytes)
+                batch, batch_triples, batch_bytes = [], 0, 0
+            batch.append(text)
+            batch_triples += count
+            batch_bytes += size
+        if batch:
+            self._write_text("".join(batch), batch_triples, batch_bytes)
+
+    def _write_text(self, text: str, triples: int, size: int | None = None) -> None:
+        # Write formatted triples, starting a new shard first if they do not fit
+        if size is None:
+            size = utf8_len(text)
+        if self._file is not None and self._overflows(triples, size):
+            self._close_file()
+        if self._file is None:
+            self.open()
+        self._file.write(text)
+        self.triple_count += triples
+        self._shard_triples += triples
+        self._shard_bytes += size
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        if self._owns_file:
+            self._file.close()
+            self.shards.append(
+                {
+                    "path": self._file_path.name,
+                    "triples": self._shard_triples,
+                    "bytes": self._shard_bytes,
+                    "file_bytes": self._file_path.stat().st_size,
+                }
+            )
+        self._file = None
+
+    def term(self, node: Node) -> str:
+        """Serialize an RDF node, using the bounded term cache."""
+        text = self._term_cache.get(node)
+        if text is None:
+            if len(self._term_cache) >= TERM_CACHE_SIZE:
+                self._term_cache.clear()
+            try:
+                text = self._format_term(node)
+            except Exception as e:
+                raise ValueError(f"Cannot serialize RDF term {node!r}: {e}") from e
+            self._term_cache[node] = text
+        return text
+
+    def _format_term(self, node: Node) -> str:
+        if isinstance(node, Literal):
+            # rdflib writes multi-line strings with triple quotes, which N-Triples forbids
+            lexical = '"' + str(node).translate(LEXICAL_ESCAPES) + '"'
+            if node.language:
+                return f"{lexical}@{node.language}"
+            if node.datatype is not None:
+                return f"{lexical}^^{self.term(node.datatype)}"
+            return lexical
+        return node.n3()
+
+    def header(self) -> str:
+        """Return the text written at the start of the output file."""
+        return ""
+
+    def _format_chunk(self, triples: list[tuple[Node, Node, Node]]) -> str:
+        raise NotImplementedError
+
+    def _iter_blocks(self, shard: TextIO) -> Iterator[tuple[str, int]]:
+        """Yield the text and triple count of each block of a headerless shard."""
+        raise NotImplementedError
+
+
+class NTriplesWriter(TripleWriter):
+    """Streaming N-Triples writer (one triple per line, full URIs)."""
+
+    def _format_chunk(self, triples: list[tuple[Node, Node, Node]]) -> str:
+        term = self.term
+        return "".join(f"{term(s)} {term(p)} {term(o)} .\n" for s, p, o in triples)
+
+    def _iter_blocks(self, shard: TextIO) -> Iterator[tuple[str, int]]:
+        for line in shard:
+            yield line, 1
+
+
+class TurtleWriter(TripleWriter):
+    """
+    Streaming Turtle writer.
+
+    - Every namespace of the config is declared with `@prefix`.
+    - URIs are shortened to prefixed names when their local part is a valid Turtle name.
+    - Within a chunk, triples are grouped by subject (`subject p1 o1 ; p2 o2 .`), one
+      predicate-object pair per line, and subject blocks are separated by a blank line.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Longest namespaces first, so that the most specific prefix is used
+        self._prefixes = sorted(
+            ((ns, prefix) for prefix, ns in self.namespaces.items() if ns),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def header(self) -> str:
+        lines = [
+            f"@prefix {prefix}: <{ns}> ." for prefix, ns in self.namespaces.items()
+        ]
+        return "\n".join(lines) + "\n\n" if lines else ""
+
+    def _qname(self, uri: str) -> str | None:
+        for ns, prefix in self._prefixes:
+            if uri.startswith(ns):
+                local = uri[len(ns) :]
+                if local == "" or PN_LOCAL_PATTERN.match(local):
+                    return f"{prefix}:{local}"
+        return None
+
+    def _format_term(self, node: Node) -> str:
+        # Datatypes of literals are shortened too, e.g. "1900-01-01"^^xsd:date
+        if isinstance(node, URIRef):
+            qname = self._qname(str(node))
+            if qname:
+                return qname
+        return super()._format_term(node)
+
+    def _format_chunk(self, triples: list[tuple[Node, Node, Node]]) -> str:
+        term = self.term
+        by_subject: dict[Node, list[str]] = {}
+        for s, p, o in triples:
+            by_subject.setdefault(s, []).append(f"{term(p)} {term(o)}")
+        return "".join(
+            f"{term(s)} " + " ;\n    ".join(pairs) + " .\n\n"
+            for s, pairs in by_subject.items()
+        )
+
+    def _iter_blocks(self, shard: TextIO) -> Iterator[tuple[str, int]]:
+        # Terms never contain line breaks, so each line holds one triple and each
+        # subject block ends with a blank line
+        lines: list[str] = []
+        for line in shard:
+            if line == "\n":
+                if lines:
+                    lines.append(line)
+                    yield "".join(lines), len(lines) - 1
+                    lines = []
+            else:
+                lines.append(line)
+        if lines:
+            yield "".join(lines), len(lines)
+
+
+def write_shard_manifest(
+    writer: TripleWriter, manifest_path: Path, output_format: str
+) -> None:
+    """
+    Write the manifest of the files of a closed writer, and delete the shards listed by
+    the previous manifest that were not written again (e.g. when the output got smaller).
+
+    Args:
+        writer (TripleWriter): The closed writer.
+        manifest_path (Path): The manifest file, next to the shards.
+        output_format (str): The output format ("turtle" or "ntriples").
+    """
+    folder = manifest_path.parent
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            previous = {shard["path"] for shard in json.load(f).get("shards", [])}
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        previous = set()
+    for name in previous - {shard["path"] for shard in writer.shards}:
+        # Only delete plain file names, never paths outside the folder
+        if Path(name).name == name:
+            (folder / name).unlink(missing_ok=True)
+    manifest = {
+        "format": output_format,
+        "compression": writer.compression,
+        "triples": writer.triple_count,
+        "shards": writer.shards,
+    }
+    tmp_path = manifest_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
@@ -0,0 +1,131 @@
+"""
+Import-time benchmark for the command-line tools of the shared folder.
+
+Interactive property lookups (`prop_cli.py`) and small annotation runs (`rdfconv.labels`)
+should not spend most of their wall time importing pandas, rdflib or aiohttp. These tools
+therefore import their heavy dependencies inside the code paths that need them, and this
+script checks that it stays that way.
+
+For each CLI module, the script imports it in fresh interpreters and reports the median
+import time along with the heavy dependencies that got loaded. A CLI fails the benchmark if
+its median import time exceeds its startup budget, or if it loads a heavy dependency at
+import time. The exit code is 1 if any CLI fails, so the script can be used as a check.
+
+Note:
+    This script must be run with the current working directory set to `shared/`.
+
+Usage:
+
+    python startup_benchmark.py
+    python startup_benchmark.py --repeat 10 --budget-scale 2
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Startup budget of each CLI module, in seconds of import time
+STARTUP_BUDGETS = {
+    "prop_cli": 0.15,
+    "rdfconv.labels": 0.15,
+    "rdfconv.tomlgen": 0.15,
+}
+# Dependencies that must only be imported when they are actually used
+HEAVY_MODULES = ("pandas", "numpy", "rdflib", "isodate", "aiohttp", "aiolimiter")
+
+# Code run in a fresh interpreter: import a module and report the import time and the
+# heavy modules that were loaded
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"seconds": seconds, "heavy": heavy}}))
+"""
+
+
+def measure_import(module: str, repeat: int) -> dict:
+    """
+    Import a module in `repeat` fresh interpreters.
+
+    Args:
+        module (str): The dotted module name.
+        repeat (int): The number of interpreters to start.
+
+    Returns:
+        dict: The median import time in "seconds" and the "heavy" modules loaded.
+
+    Raises:
+        RuntimeError: If the module cannot be imported.
+    """
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    times = []
+    heavy: set[str] = set()
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).parent,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Could not import '{module}':\n{result.stderr}")
+        probe = json.loads(result.stdout.splitlines()[-1])
+        times.append(probe["seconds"])
+        heavy.update(probe["heavy"])
+    return {"seconds": statistics.median(times), "heavy": sorted(heavy)}
+
+
+def main():
+    """
+    Entry point of the startup benchmark.
+
+    CLI arguments:
+        --repeat (int): Number of fresh interpreters per CLI (default: 5).
+        --budget-scale (float): Factor applied to every budget, for slow machines
+            (default: 1).
+    """
+    parser = argparse.ArgumentParser(
+        description="Check the import time of the shared command-line tools."
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of fresh interpreters per CLI (default: 5)",
+    )
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Factor applied to every startup budget, for slow machines (default: 1)",
+    )
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    failed = False
+    print(f"{'CLI':<18} {'import':>8} {'budget':>8}  result")
+    for module, budget in STARTUP_BUDGETS.items():
+        budget *= args.budget_scale
+        result = measure_import(module, args.repeat)
+        problems = []
+        if result["seconds"] > budget:
+            problems.append("over budget")
+        if result["heavy"]:
+            problems.append("imports " + ", ".join(result["heavy"]))
+        failed = failed or bool(problems)
+        print(
+            f"{module:<18} {result['seconds']:>7.3f}s {budget:>7.3f}s  "
+            + ("; ".join(problems) if problems else "ok")
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
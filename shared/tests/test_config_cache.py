@@ -0,0 +1,68 @@
+"""
+Tests of the config plans cached by `load_config`.
+
+Run from the shared/ folder:
+    python -m pytest tests
+"""
+
+import json
+
+from rdflib import URIRef
+
+from rdfconv.conditions import Condition
+from rdfconv.convert import load_config
+
+CONFIG = """
+[general]
+name = "test"
+csv_folder = "csv"
+rdf_output_folder = "rdf"
+
+[namespaces]
+wd = "http://www.wikidata.org/entity/"
+wdt = "http://www.wikidata.org/prop/direct/"
+rdfs = "http://www.w3.org/2000/01/rdf-schema#"
+
+[people]
+PRIMARY_KEY = "id"
+id = ""
+name = "rdfs:label"
+born = {pred = "P569", datatype = "xsd:date", if = "isinstance(obj, Literal)"}
+"""
+
+
+def test_cached_plan_gives_the_same_config(tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(CONFIG)
+    raw, config = load_config(config_path, tmp_path / "cache")
+    assert len(list((tmp_path / "cache").glob("config-*.json"))) == 1
+
+    cached_raw, cached_config = load_config(config_path, tmp_path / "cache")
+    assert cached_raw == raw
+    assert cached_config == config
+    born = cached_config["people"]["born"]
+    assert isinstance(cached_config["people"]["name"], URIRef)
+    assert isinstance(born["pred"], URIRef)
+    assert isinstance(born["if"], Condition) and born["if"].plan is not None
+
+
+def test_edited_config_is_compiled_again(tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(CONFIG)
+    load_config(config_path, tmp_path / "cache")
+    config_path.write_text(CONFIG.replace("rdfs:label", "wdt:P1476"))
+    _, config = load_config(config_path, tmp_path / "cache")
+    assert config["people"]["name"] == URIRef(
+        "http://www.wikidata.org/prop/direct/P1476"
+    )
+
+
+def test_invalid_plan_is_ignored(tmp_path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(CONFIG)
+    _, config = load_config(config_path, tmp_path / "cache")
+    (plan_path,) = (tmp_path / "cache").glob("config-*.json")
+    cached = json.loads(plan_path.read_text())
+    cached["plan"]["people"]["born"]["if"] = "isinstance(obj,"
+    plan_path.write_text(json.dumps(cached))
+    assert load_config(config_path, tmp_path / "cache")[1] == config
@@ -0,0 +1,78 @@
+"""
+Tests of incremental rdfconv builds (`convert_tables_incrementally`).
+
+Run from the shared/ folder:
+    python -m pytest tests
+"""
+
+from pathlib import Path
+
+from rdfconv.convert import convert_tables_incrementally, load_config
+from rdfconv.stats import ConversionStats
+
+CONFIG = """
+[general]
+name = "test"
+csv_folder = "{csv_folder}"
+rdf_output_folder = "{rdf_folder}"
+test_mode = false
+
+[namespaces]
+wd = "http://www.wikidata.org/entity/"
+rdfs = "http://www.w3.org/2000/01/rdf-schema#"
+
+[people]
+PRIMARY_KEY = "id"
+id = ""
+name = "rdfs:label"
+
+[places]
+PRIMARY_KEY = "id"
+id = ""
+name = "rdfs:label"
+"""
+
+
+def write_tables(csv_folder: Path, rows: int) -> None:
+    csv_folder.mkdir(exist_ok=True)
+    for table in ("people", "places"):
+        lines = ["id,name"] + [f"Q{i},{table} {i}" for i in range(1, rows + 1)]
+        (csv_folder / f"{table}.csv").write_text("\n".join(lines) + "\n")
+
+
+def run_incremental(tmp_path: Path) -> ConversionStats:
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        CONFIG.format(csv_folder=tmp_path / "csv", rdf_folder=tmp_path / "rdf")
+    )
+    raw_config, config = load_config(config_path)
+    stats = ConversionStats()
+    convert_tables_incrementally(
+        raw_config, config, tmp_path / "cache", "turtle", jobs=1, stats=stats
+    )
+    return stats
+
+
+def test_stale_tables_report_their_phase_timings(tmp_path):
+    write_tables(tmp_path / "csv", rows=2000)
+    stats = run_incremental(tmp_path)
+    assert stats.cached_tables == []
+    for phase in ("read", "transform", "emit"):
+        assert stats.phases.get(phase, 0.0) > 0.0
+
+    # Changing the CSVs makes both tables stale again
+    write_tables(tmp_path / "csv", rows=2001)
+    stats = run_incremental(tmp_path)
+    assert stats.cached_tables == []
+    for phase in ("read", "transform", "emit"):
+        assert stats.phases.get(phase, 0.0) > 0.0
+    assert stats.tables["people"]["rows"] == 2001
+
+
+def test_fresh_tables_reuse_the_recorded_statistics(tmp_path):
+    write_tables(tmp_path / "csv", rows=10)
+    run_incremental(tmp_path)
+    stats = run_incremental(tmp_path)
+    assert stats.cached_tables == ["people", "places"]
+    assert stats.tables["places"]["rows"] == 10
+    assert stats.phases.get("emit", 0.0) == 0.0
@@ -1,2 +1,20 @@
-from .client import WikidataAPIClient
+from typing import TYPE_CHECKING
+
 from .helpers import build_wd_hyperlink, extract_wd_id
+
+if TYPE_CHECKING:
+    from .client import WikidataAPIClient
+
+__all__ = ["WikidataAPIClient", "build_wd_hyperlink", "extract_wd_id"]
+
+
+def __getattr__(name: str):
+    # The client pulls in aiohttp and aiolimiter, which take most of the import time of
+    # the package: load it on first access so that helper-only users (e.g. rdfconv.convert)
+    # start fast.
+    if name == "WikidataAPIClient":
+        from .client import WikidataAPIClient
+
+        globals()[name] = WikidataAPIClient
+        return WikidataAPIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
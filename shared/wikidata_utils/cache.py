@@ -0,0 +1,288 @@
+"""
+Persistent cache of Wikidata API responses.
+
+`ResponseCache` stores the JSON responses received by `WikidataAPIClient` in a single SQLite
+file, keyed by endpoint and normalized request parameters. Re-running a tool on the same IDs
+or search terms then reads the responses from disk instead of waiting for the rate limiters
+again.
+
+- Each endpoint has its own time to live (see `DEFAULT_TTLS`): older responses are fetched
+  again. A TTL of None keeps responses until they are evicted; a TTL of 0 disables caching
+  for the endpoint.
+- The stored responses are kept under a size cap by evicting the least recently used ones.
+- Hits, misses, expired responses, stores and evictions are counted per endpoint (see
+  `stats`).
+- Error responses are never stored, since the client returns an empty dict for them.
+
+SQLite calls are synchronous, but each one is a single indexed lookup or write, which is
+much shorter than a request. Several processes can share a cache file.
+
+Usage:
+    ```python
+    from wikidata_utils import WikidataAPIClient
+    from wikidata_utils.cache import ResponseCache
+
+    with ResponseCache("~/.cache/wikidata.sqlite") as cache:
+        async with aiohttp.ClientSession() as session:
+            client = WikidataAPIClient(session, cache=cache)
+            labels = await client.wbgetentities("Q42", "Q90")
+        print(cache.format_stats())
+    ```
+
+The command-line tools use the file named by the `WIKIDATA_CACHE` environment variable, if
+set (see `ResponseCache.from_env`).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, Optional
+
+# Environment variable naming the cache file of the command-line tools
+CACHE_ENV_VAR = "WIKIDATA_CACHE"
+DAY = 86_400
+# Time to live of the responses of each endpoint, in seconds. Entity data changes slowly;
+# search results and query results follow edits more closely.
+DEFAULT_TTLS: dict[str, Optional[float]] = {
+    "sparql": DAY,
+    "search": DAY,
+    "wbsearchentities": DAY,
+    "wbgetentities": 7 * DAY,
+}
+# Maximum size of the stored responses, in bytes (compressed)
+DEFAULT_MAX_BYTES = 512 << 20
+# Share of the size cap left after an eviction, so that evictions run in batches
+EVICTION_TARGET = 0.9
+# Parameters holding "|"-separated values whose order does not change the response
+UNORDERED_PARAMS = {"wbgetentities": ("ids", "props")}
+# Counters kept for each endpoint
+COUNTERS = ("hits", "misses", "expired", "stores", "evictions")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def cache_key(endpoint: str, params: dict[str, Any]) -> str:
+    """
+    Return the key of a request: a hash of the endpoint and of its parameters, converted to
+    strings, sorted by name and, for `UNORDERED_PARAMS`, with sorted values.
+
+    Args:
+        endpoint (str): The endpoint name (e.g. "wbgetentities").
+        params (dict): The query parameters of the request.
+
+    Returns:
+        str: The key.
+    """
+    normalized = {str(name): str(value) for name, value in params.items()}
+    for name in UNORDERED_PARAMS.get(endpoint, ()):
+        if name in normalized:
+            normalized[name] = "|".join(sorted(set(normalized[name].split("|"))))
+    text = json.dumps([endpoint, normalized], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite cache of JSON responses, with per-endpoint TTLs and LRU eviction.
+
+    Attributes:
+        path (Path): The cache file.
+        ttls (dict[str, float | None]): Time to live of each endpoint, in seconds.
+            Endpoints not listed are not cached.
+        max_bytes (int): Maximum size of the stored responses.
+        counters (dict[str, Counter]): The `COUNTERS` of each endpoint.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttls: Optional[dict[str, Optional[float]]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """
+        Open (or create) a cache file.
+
+        Args:
+            path (str | Path): The cache file. Its folder is created if needed.
+            ttls (dict, optional): TTLs overriding `DEFAULT_TTLS`, by endpoint.
+            max_bytes (int): Maximum size of the stored responses.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.max_bytes = max_bytes
+        self.counters: dict[str, Counter] = {}
+        self.logger = logging.getLogger(__name__)
+        # Autocommit: each statement is its own transaction
+        self._db = sqlite3.connect(self.path, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._size = self._stored_bytes()
+
+    @classmethod
+    def from_env(cls, **kwargs) -> Optional["ResponseCache"]:
+        """
+        Open the cache file named by the `WIKIDATA_CACHE` environment variable.
+
+        Args:
+            **kwargs: Arguments of `ResponseCache`.
+
+        Returns:
+            ResponseCache | None: The cache, or None if the variable is not set.
+        """
+        path = os.environ.get(CACHE_ENV_VAR)
+        return cls(path, **kwargs) if path else None
+
+    def __enter__(self) -> "ResponseCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _count(self, endpoint: str, counter: str, count: int = 1) -> None:
+        self.counters.setdefault(endpoint, Counter())[counter] += count
+
+    def _stored_bytes(self) -> int:
+        return self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def enabled(self, endpoint: str) -> bool:
+        """Return whether the responses of an endpoint are cached."""
+        return endpoint in self.ttls and self.ttls[endpoint] != 0
+
+    def get(self, endpoint: str, params: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """
+        Return the stored response of a request, if it has not expired.
+
+        Args:
+            endpoint (str): The endpoint name.
+            params (dict): The query parameters of the request.
+
+        Returns:
+            dict | None: The JSON response, or None on a miss.
+        """
+        if not self.enabled(endpoint):
+            return None
+        key = cache_key(endpoint, params)
+        row = self._db.execute(
+            "SELECT body, size, created FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self._count(endpoint, "misses")
+            return None
+        body, size, created = row
+        now = time.time()
+        ttl = self.ttls[endpoint]
+        if ttl is not None and now - created > ttl:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._size -= size
+            self._count(endpoint, "expired")
+            self._count(endpoint, "misses")
+            return None
+        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        self._count(endpoint, "hits")
+        return json.loads(zlib.decompress(body))
+
+    def put(self, endpoint: str, params: dict[str, Any], data: dict[str, Any]) -> None:
+        """
+        Store the response of a request, evicting the least recently used responses if the
+        cache gets over its size cap.
+
+        Args:
+            endpoint (str): The endpoint name.
+            params (dict): The query parameters of the request.
+            data (dict): The JSON response.
+        """
+        if not self.enabled(endpoint):
+            return
+        key = cache_key(endpoint, params)
+        text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        # Level 1 is several times faster than the default, and JSON compresses well anyway
+        body = zlib.compress(text.encode("utf-8"), 1)
+        now = time.time()
+        previous = self._db.execute(
+            "SELECT size FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+            (key, endpoint, body, len(body), now, now),
+        )
+        self._size += len(body) - (previous[0] if previous else 0)
+        self._count(endpoint, "stores")
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        # Other processes may share the file: start from the actual size
+        self._size = self._stored_bytes()
+        excess = self._size - int(self.max_bytes * EVICTION_TARGET)
+        if excess <= 0:
+            return
+        evicted = []
+        rows = self._db.execute(
+            "SELECT key, endpoint, size FROM responses ORDER BY accessed"
+        )
+        for key, endpoint, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((key,))
+            excess -= size
+            self._size -= size
+            self._count(endpoint, "evictions")
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.logger.debug("Evicted %d cached responses", len(evicted))
+
+    def clear(self) -> None:
+        """Delete all stored responses and reset the counters."""
+        self._db.execute("DELETE FROM responses")
+        self._size = 0
+        self.counters = {}
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return the counters of the cache.
+
+        Returns:
+            dict: "entries" and "bytes" stored, and for each endpoint used so far, its
+            `COUNTERS` in "endpoints".
+        """
+        entries = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "entries": entries,
+            "bytes": self._size,
+            "endpoints": {
+                endpoint: {name: counters[name] for name in COUNTERS}
+                for endpoint, counters in self.counters.items()
+            },
+        }
+
+    def format_stats(self) -> str:
+        """Return the hit counts of each endpoint as a line of text, for logging."""
+        parts = []
+        for endpoint, counters in self.counters.items():
+            lookups = counters["hits"] + counters["misses"]
+            if lookups:
+                parts.append(f"{endpoint} {counters['hits']}/{lookups} hits")
+        return ", ".join(parts) or "unused"
+
+    def close(self) -> None:
+        """Close the cache file."""
+        self._db.close()
@@ -8,17 +8,25 @@ Supported APIs:
 - Wikidata wbgetentities (Entity retrieval by ID)
 
 Features:
-- Built-in rate limiting to comply with Wikidata usage policies
+- Built-in rate limiting to comply with Wikidata usage policies, slowing down and retrying
+  when requests are throttled (see `wikidata_utils.ratelimit`)
 - Structured JSON parsing
 - Common HTTP error handling
 - Support for asynchronous requests using asyncio and aiohttp
+- Optional persistent response cache (see `wikidata_utils.cache`)
+- Coalescing of identical concurrent requests into a single HTTP call
+- Latency, throughput and error metrics per endpoint (see `wikidata_utils.metrics`)
+- Pluggable transport, e.g. to record responses and replay them offline (see
+  `wikidata_utils.fixtures`), or to answer them from a local index of a Wikidata dump
+  (see `wikidata_utils.subset`)
 
 Dependencies:
 - aiohttp
 - aiolimiter
 
 Usage:
-- Instantiate WikidataAPIClient with an existing aiohttp.ClientSession
+- Instantiate WikidataAPIClient with an existing aiohttp.ClientSession, and optionally a
+  ResponseCache
 - Use client's async methods to perform entity searches, SPARQL queries, and QID/PID-based fetches.
 
 Example:
@@ -37,11 +45,41 @@ Example:
     ```
 """
 
-from typing import Any, Optional, Union, TypeAlias
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Container,
+    Iterable,
+    Optional,
+    Union,
+    TypeAlias,
+)
 import logging
 import asyncio
+import json
+import os
+import re
+import time
+from collections import Counter
+from contextlib import aclosing
+from urllib.parse import quote_plus
 import aiohttp
-from aiolimiter import AsyncLimiter
+from .cache import ResponseCache, cache_key
+from .helpers import extract_wd_id
+from .metrics import ClientMetrics
+from .ratelimit import (
+    THROTTLE_STATUSES,
+    AdaptiveLimiter,
+    RetryPolicy,
+    Throttled,
+    parse_retry_after,
+)
+
+if TYPE_CHECKING:
+    # Only used in annotations: the subset index is only needed for offline runs
+    from .fixtures import RecordTransport, ReplayTransport
+    from .subset import SubsetTransport
 
 # Type aliases allow more informative type hinting
 WikiId: TypeAlias = str
@@ -49,6 +87,29 @@ JsonResponse: TypeAlias = dict[str, Any]
 WikiEntity: TypeAlias = dict[str, Any]
 SparqlResultRow: TypeAlias = dict[str, Any]
 
+# Default URLs, overridden by the environment variables of the same name (e.g. to use a
+# local stand-in server, see `wikidata_utils.standin`)
+WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
+WIKIDATA_SPARQL_URL = "https://query.wikidata.org/sparql"
+# Counters of each endpoint reported by `request_stats` (see `ClientMetrics`)
+REQUEST_COUNTERS = ("requests", "coalesced", "throttled", "retries")
+# Maximum number of IDs per wbgetentities request
+WBGETENTITIES_MAX_IDS = 50
+# Default number of wbgetentities requests in flight when fetching many IDs
+DEFAULT_CONCURRENCY = 8
+# Placeholder of the VALUES block in the query templates of `sparql_values`
+VALUES_PLACEHOLDER = "{values}"
+# Name of the variable bound by the VALUES block
+SPARQL_VAR_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Default maximum number of IDs per query of `sparql_values`, so that queries end well
+# within the query timeout
+SPARQL_VALUES_BATCH_SIZE = 200
+# Maximum length of an encoded SPARQL query sent with GET, under common URL length limits
+MAX_SPARQL_QUERY_LENGTH = 6000
+# Default number of SPARQL queries in flight (the Query Service allows 5 per client)
+SPARQL_CONCURRENCY = 5
+ENTITY_PREFIX = "http://www.wikidata.org/entity/"
+
 
 class _WikidataAPIClientRaw:
     """
@@ -57,6 +118,8 @@ class _WikidataAPIClientRaw:
     Provides asynchronous methods to request different Wikidata API endpoints
     Returns raw JSON responses.
     Handles HTTP errors and rate limiting internally.
+    Identical requests made while one of them is in flight share its HTTP call and its
+    response, instead of each using up the rate limiter.
 
     Supported endpoints:
     - Wikidata Query Service (SPARQL)
@@ -68,6 +131,13 @@ class _WikidataAPIClientRaw:
     def __init__(
         self,
         session: aiohttp.ClientSession,
+        cache: Optional[ResponseCache] = None,
+        api_url: Optional[str] = None,
+        sparql_url: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        transport: Optional[
+            Union["RecordTransport", "ReplayTransport", "SubsetTransport"]
+        ] = None,
     ):
         """
         Initialize the WikidataAPIClient with an aiohttp session.
@@ -75,17 +145,42 @@ class _WikidataAPIClientRaw:
 
         Args:
             session (aiohttp.ClientSession): An active aiohttp session for making requests.
-
-        Initializes two rate limiters:
-            - `limiter_sparql`: For SPARQL queries, allowing 20 requests per second.
-            - `limiter_wikidata`: For all other Wikidata API calls, allowing 30 requests per second.
+            cache (ResponseCache, optional): Persistent cache of responses. Cached
+                responses are returned without waiting for the rate limiters.
+            api_url (str, optional): URL of the Wikidata action API (e.g. a local stand-in
+                server). Defaults to `$WIKIDATA_API_URL`, or to `WIKIDATA_API_URL`.
+            sparql_url (str, optional): URL of the SPARQL endpoint. Defaults to
+                `$WIKIDATA_SPARQL_URL`, or to `WIKIDATA_SPARQL_URL`.
+            retry_policy (RetryPolicy, optional): Retries of throttled requests (HTTP 429
+                or 503). Defaults to `RetryPolicy()`.
+            transport (RecordTransport | ReplayTransport | SubsetTransport, optional):
+                Performs the requests instead of `_get`, within the rate limiters unless
+                its `rate_limited` attribute is false.
+
+        Initializes two adaptive rate limiters, which slow down when requests are
+        throttled and speed up again while they succeed (see `AdaptiveLimiter.rate`):
+            - `limiter_sparql`: For SPARQL queries, allowing up to 20 requests per second.
+            - `limiter_wikidata`: For all other Wikidata API calls, allowing up to 30 requests per second.
         """
 
         self.session = session
-        self.limiter_sparql = AsyncLimiter(max_rate=20, time_period=1)
+        self.cache = cache
+        self.api_url = api_url or os.environ.get("WIKIDATA_API_URL", WIKIDATA_API_URL)
+        self.sparql_url = sparql_url or os.environ.get(
+            "WIKIDATA_SPARQL_URL", WIKIDATA_SPARQL_URL
+        )
+        self.transport = transport
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.limiter_sparql = AdaptiveLimiter(max_rate=20, time_period=1)
         # limiter for all API calls starting with "https://www.wikidata.org/w/api.php"
-        self.limiter_wikidata = AsyncLimiter(max_rate=30, time_period=1)
+        self.limiter_wikidata = AdaptiveLimiter(max_rate=30, time_period=1)
         self.logger = logging.getLogger(__name__)
+        # Requests, errors, bytes received and timings, by endpoint
+        self.metrics = ClientMetrics()
+        # Requests in flight, by key (see `cache_key`)
+        self._in_flight: dict[str, asyncio.Future] = {}
+        # Number of callers waiting for each request in flight
+        self._waiters: Counter = Counter()
 
     async def _get(
         self,
@@ -93,13 +188,28 @@ class _WikidataAPIClientRaw:
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
         timeout: int = 10,
+        endpoint: str = "other",
     ) -> Optional[dict[str, Any]]:
         """
         Internal helper method to perform HTTP GET requests with consistent error handling.
         Returns either the JSON response or None on error.
+        Raises Throttled for the `THROTTLE_STATUSES`, so that the request can be retried.
+        Records the latency, size, decoding time and errors in the metrics of `endpoint`.
         """
         headers = headers or {}
         headers["User-Agent"] = "LinkedMusicDataLake/1.0 (+https://linkedmusic.ca/)"
+        metrics = self.metrics[endpoint]
+        decode_time = 0.0
+
+        def loads(text: str) -> Any:
+            nonlocal decode_time
+            start = time.perf_counter()
+            try:
+                return json.loads(text)
+            finally:
+                decode_time = time.perf_counter() - start
+
+        start = time.perf_counter()
         try:
             async with self.session.get(
                 url,
@@ -107,42 +217,209 @@ class _WikidataAPIClientRaw:
                 headers=headers,
                 timeout=aiohttp.ClientTimeout(total=timeout),
             ) as response:
+                body = await response.read()
+                metrics.latency.add(time.perf_counter() - start)
+                metrics.bytes += len(body)
+                if response.status in THROTTLE_STATUSES:
+                    raise Throttled(
+                        response.status,
+                        parse_retry_after(response.headers.get("Retry-After")),
+                    )
                 response.raise_for_status()
-                return await response.json()
+                data = await response.json(loads=loads)
+                metrics.decode.add(decode_time)
+                return data
+        except Throttled as e:
+            self.metrics.error(endpoint, f"HTTP {e.status}")
+            raise
         except aiohttp.ContentTypeError as e:
+            self.metrics.error(endpoint, type(e).__name__)
             self.logger.error("Content type error at %s: %s", url, e)
             return None
         except aiohttp.ClientConnectionError as e:
+            self.metrics.error(endpoint, type(e).__name__)
             self.logger.error("Connection error at %s: %s", url, e)
             return None
         except aiohttp.ClientResponseError as e:
+            self.metrics.error(endpoint, f"HTTP {e.status}")
             self.logger.error(
                 "HTTP error at %s: Status %s, message: %s", url, e.status, e.message
             )
             return None
         except aiohttp.ClientError as e:
+            self.metrics.error(endpoint, type(e).__name__)
             self.logger.error("Client error at %s: %s", url, e)
             return None
         except Exception as e:
+            self.metrics.error(endpoint, type(e).__name__)
             self.logger.error("Unexpected error at %s: %s", url, e)
             return None
 
+    async def _request(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict[str, Any],
+        limiter: AdaptiveLimiter,
+        headers: Optional[dict[str, str]] = None,
+        timeout: int = 10,
+    ) -> JsonResponse:
+        """
+        Internal helper method shared by the raw methods: returns the cached response of
+        the request if any, otherwise performs it within the rate limiter and caches the
+        response. A request identical to one in flight waits for the response of the
+        latter, which is shared: callers must not modify it.
+        Returns the JSON response, or an empty dictionary on error.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(endpoint, params)
+            if cached is not None:
+                return cached
+        counters = self.metrics[endpoint].counters
+        key = cache_key(endpoint, params)
+        task = self._in_flight.get(key)
+        if task is not None:
+            counters["coalesced"] += 1
+        else:
+            counters["requests"] += 1
+            task = asyncio.ensure_future(
+                self._fetch(endpoint, url, params, limiter, headers, timeout)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        self._waiters[key] += 1
+        try:
+            # Cancelling one caller must not cancel the request for the others
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                if not task.done():
+                    # Nobody is waiting for the response anymore. Forget the request
+                    # before its done callback runs, so that a new caller does not wait
+                    # for the cancelled task
+                    self._forget(key, task)
+                    task.cancel()
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        """Removes a request from the requests in flight, unless it was replaced."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict[str, Any],
+        limiter: AdaptiveLimiter,
+        headers: Optional[dict[str, str]],
+        timeout: int,
+    ) -> JsonResponse:
+        """
+        Performs a request within the rate limiter and caches its response.
+        Throttled requests slow down the limiter and are retried following the retry
+        policy.
+        """
+        metrics = self.metrics[endpoint]
+        counters = metrics.counters
+        attempt = 0
+        while True:
+            try:
+                if self.transport is not None and not self.transport.rate_limited:
+                    data = await self.transport.get(
+                        self, endpoint, url, params, headers, timeout
+                    )
+                    break
+                start = time.perf_counter()
+                async with limiter:
+                    metrics.limiter_wait.add(time.perf_counter() - start)
+                    if self.transport is not None:
+                        data = await self.transport.get(
+                            self, endpoint, url, params, headers, timeout
+                        )
+                    else:
+                        data = await self._get(
+                            url,
+                            params=params,
+                            headers=headers,
+                            timeout=timeout,
+                            endpoint=endpoint,
+                        )
+                break
+            except Throttled as e:
+                counters["throttled"] += 1
+                limiter.throttle(e.retry_after)
+                delay = self.retry_policy.delay(attempt, e.retry_after)
+                if delay is None:
+                    self.logger.error(
+                        "HTTP error at %s: Status %s, giving up after %d retries",
+                        url,
+                        e.status,
+                        attempt,
+                    )
+                    return {}
+                self.logger.debug(
+                    "HTTP %s at %s, retrying in %.1fs (rate: %.1f/s)",
+                    e.status,
+                    url,
+                    delay,
+                    limiter.rate,
+                )
+                counters["retries"] += 1
+                attempt += 1
+                await asyncio.sleep(delay)
+        if not data:
+            return {}
+        limiter.succeed()
+        if self.cache is not None:
+            self.cache.put(endpoint, params, data)
+        return data
+
+    def request_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Return the `REQUEST_COUNTERS` of each endpoint used so far: the requests sent, the
+        requests that were coalesced with an identical one in flight, the responses that
+        were throttled, and the retries. See `metrics` for the other metrics.
+        """
+        return {
+            endpoint: {name: metrics.counters[name] for name in REQUEST_COUNTERS}
+            for endpoint, metrics in self.metrics.endpoints.items()
+        }
+
+    def format_request_stats(self) -> str:
+        """
+        Return the request counts of each endpoint and the current rates of the limiters
+        as a line of text, for logging.
+        """
+        parts = []
+        for endpoint, metrics in self.metrics.endpoints.items():
+            counters = metrics.counters
+            part = f"{endpoint} {counters['requests']} sent, {counters['coalesced']} coalesced"
+            if counters["throttled"]:
+                part += f", {counters['throttled']} throttled, {counters['retries']} retried"
+            parts.append(part)
+        rates = (
+            f"rates {self.limiter_wikidata.rate:g}/s (API), "
+            f"{self.limiter_sparql.rate:g}/s (SPARQL)"
+        )
+        return "; ".join([", ".join(parts) or "none", rates])
+
     async def sparql_raw(self, query: str, timeout: int = 60) -> JsonResponse:
         """
         Executes a SPARQL query at Wikidata Query Service.
 
         Returns raw JSON response, or an empty dictionary on error.
         """
-        url = "https://query.wikidata.org/sparql"
         headers = {"Accept": "application/sparql-results+json"}
-        async with self.limiter_sparql:
-            data = await self._get(
-                url, params={"query": query}, headers=headers, timeout=timeout
-            )
-            if not data:
-                return {}
-            else:
-                return data
+        return await self._request(
+            "sparql",
+            self.sparql_url,
+            {"query": query},
+            self.limiter_sparql,
+            headers=headers,
+            timeout=timeout,
+        )
 
     async def search_raw(
         self,
@@ -163,7 +440,6 @@ class _WikidataAPIClientRaw:
             entity_type (str): Either "item" (namespace 0) or "property" (namespace 120). Defaults to "item" (namespace 0).
             timeout (int): Timeout for the request in seconds. Defaults to 10.
         """
-        url = "https://www.wikidata.org/w/api.php"
         params = {
             "action": "query",
             "list": "search",
@@ -173,12 +449,9 @@ class _WikidataAPIClientRaw:
         params["srlimit"] = str(limit) if limit else "10"
         params["srnamespace"] = "120" if entity_type == "property" else "0"
 
-        async with self.limiter_wikidata:
-            data = await self._get(url, params=params, timeout=timeout)
-            if not data:
-                return {}
-            else:
-                return data
+        return await self._request(
+            "search", self.api_url, params, self.limiter_wikidata, timeout=timeout
+        )
 
     async def wbsearchentities_raw(
         self,
@@ -195,7 +468,6 @@ class _WikidataAPIClientRaw:
 
         By default, the query searches for Wikidata entities ("items") and returns up to 10 results
         """
-        url = "https://www.wikidata.org/w/api.php"
         params = {
             "action": "wbsearchentities",
             "search": term,
@@ -205,12 +477,13 @@ class _WikidataAPIClientRaw:
         }
         if limit:
             params["limit"] = str(limit)
-        async with self.limiter_wikidata:
-            data = await self._get(url, params=params, timeout=timeout)
-            if not data:
-                return {}
-            else:
-                return data
+        return await self._request(
+            "wbsearchentities",
+            self.api_url,
+            params,
+            self.limiter_wikidata,
+            timeout=timeout,
+        )
 
     async def wbgetentities_raw(
         self,
@@ -229,20 +502,13 @@ class _WikidataAPIClientRaw:
         Be default, only the English labels of the entities are returned.
         """
 
-        # Flatten ids_input into a single list of strings
-        ids: list[str] = []
-        for arg in ids_input:
-            if isinstance(arg, list):
-                ids.extend(arg)
-            elif isinstance(arg, str):
-                ids.append(arg)
-        if len(ids) > 50:
+        ids = _flatten_ids(ids_input)
+        if len(ids) > WBGETENTITIES_MAX_IDS:
             self.logger.error("wbgetentities can only handle up to 50 IDs at a time")
             return {}
         # Properties requested simultaneously must be separated by "|"
         # Example: "labels|descriptions|claims"
         props_str = props if isinstance(props, str) else "|".join(props)
-        url = "https://www.wikidata.org/w/api.php"
         params = {
             "action": "wbgetentities",
             "ids": "|".join(ids),
@@ -250,12 +516,13 @@ class _WikidataAPIClientRaw:
             "props": props_str,
             "languages": languages,
         }
-        async with self.limiter_wikidata:
-            data = await self._get(url, params=params, timeout=timeout)
-            if data:
-                return data
-            else:
-                return {}
+        return await self._request(
+            "wbgetentities",
+            self.api_url,
+            params,
+            self.limiter_wikidata,
+            timeout=timeout,
+        )
 
 
 class WikidataAPIClient(_WikidataAPIClientRaw):
@@ -313,6 +580,101 @@ class WikidataAPIClient(_WikidataAPIClientRaw):
         results = [{var: row[var]["value"] for var in row} for row in bindings]
         return results
 
+    async def sparql_values(
+        self,
+        template: str,
+        ids: Iterable[str],
+        var: str = "item",
+        batch_size: int = SPARQL_VALUES_BATCH_SIZE,
+        concurrency: int = SPARQL_CONCURRENCY,
+        timeout: int = 40,
+    ) -> dict[str, list[SparqlResultRow]]:
+        """
+        Run the same SPARQL query for many entities, with their IDs packed into VALUES
+        blocks, and return the result rows of each entity.
+
+        The IDs are split into batches of at most `batch_size` IDs whose encoded query
+        stays under `MAX_SPARQL_QUERY_LENGTH`. Batches run concurrently, at most
+        `concurrency` at a time, within the SPARQL rate limiter.
+
+        Args:
+            template: SPARQL query in which `{values}` is replaced by a VALUES block binding
+                `?var` to the entities (other braces are left as is). The query must
+                select `?var`, so that rows can be assigned to entities.
+                Example: 'SELECT ?item ?class WHERE { {values} ?item wdt:P31 ?class }'
+            ids: Entity IDs (e.g. "Q42"). Duplicates are queried once.
+            var: Name of the variable bound to the entities, without "?"
+                (default: "item").
+            batch_size: Maximum number of IDs per query (default: 200).
+            concurrency: Maximum number of queries in flight (default: 5).
+            timeout: Request timeout of each query in seconds (default: 40).
+
+        Returns:
+            dict: Mapping from entity ID to the list of result rows of that entity, as
+            returned by `sparql`. Entities without results map to an empty list; the IDs
+            of batches whose query failed are missing.
+
+        Raises:
+            ValueError: If the template has no `{values}` placeholder, if `var` is not a
+                variable name, or if an ID is not a QID or PID.
+        """
+        if VALUES_PLACEHOLDER not in template:
+            raise ValueError(
+                f"The query template has no {VALUES_PLACEHOLDER} placeholder"
+            )
+        if not SPARQL_VAR_PATTERN.fullmatch(var):
+            raise ValueError(f"Invalid SPARQL variable name: {var!r}")
+        ids = list(dict.fromkeys(ids))
+        # IDs are pasted into the query: anything else than a bare QID or PID could break
+        # or alter it
+        invalid = [
+            id_ for id_ in ids if not isinstance(id_, str) or extract_wd_id(id_) != id_
+        ]
+        if invalid:
+            raise ValueError(f"Invalid Wikidata IDs: {invalid[:10]}")
+        prefix, suffix = template.split(VALUES_PLACEHOLDER, 1)
+        head = f"VALUES ?{var} {{"
+        base_length = len(quote_plus(prefix + head + " }" + suffix))
+
+        # Pack IDs into batches under the size and query length limits
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        length = base_length
+        for id_ in ids:
+            id_length = len(quote_plus(f" wd:{id_}"))
+            if batch and (
+                len(batch) >= batch_size or length + id_length > MAX_SPARQL_QUERY_LENGTH
+            ):
+                batches.append(batch)
+                batch, length = [], base_length
+            batch.append(id_)
+            length += id_length
+        if batch:
+            batches.append(batch)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(batch: list[str]) -> Optional[JsonResponse]:
+            values = head + "".join(f" wd:{id_}" for id_ in batch) + " }"
+            async with semaphore:
+                data = await self.sparql_raw(prefix + values + suffix, timeout=timeout)
+            return data or None
+
+        responses = await asyncio.gather(*(run(batch) for batch in batches))
+
+        results: dict[str, list[SparqlResultRow]] = {}
+        for batch, data in zip(batches, responses):
+            if data is None:
+                continue
+            for id_ in batch:
+                results[id_] = []
+            for row in data.get("results", {}).get("bindings", []):
+                uri = row.get(var, {}).get("value", "")
+                id_ = uri.removeprefix(ENTITY_PREFIX)
+                if id_ in results:
+                    results[id_].append({name: row[name]["value"] for name in row})
+        return results
+
     async def search(
         self, query: str, limit: int = 10, entity_type: str = "", timeout: int = 10
     ) -> list[WikiEntity]:
@@ -413,6 +775,130 @@ class WikidataAPIClient(_WikidataAPIClientRaw):
 
         Note:
             - wbgetentities uses "labels" whereas wbsearchentities uses "label"
+            - IDs are fetched in chunks of 50, with at most `DEFAULT_CONCURRENCY` requests
+              in flight. Use `iter_wbgetentities` to process very large ID lists as
+              the chunks come in.
+        """
+        results: dict[str, WikiEntity] = {}
+        async for entities in self.iter_wbgetentities(
+            _flatten_ids(ids_input), props=props, languages=languages, timeout=timeout
+        ):
+            results.update(entities)
+        return results
+
+    async def iter_wbgetentities(
+        self,
+        ids: Iterable[str],
+        props: Union[str, list[str]] = "labels",
+        languages: str = "en",
+        timeout: int = 10,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        skip: Optional[Container[str]] = None,
+    ) -> AsyncIterator[dict[str, WikiEntity]]:
+        """
+        Fetch Wikidata entities by ID in chunks of 50, and yield the entities of each chunk
+        as soon as it is received.
+
+        IDs are read from `ids` only as workers become free, and at most `concurrency`
+        requests are in flight, so that memory stays flat with very large (or lazily
+        generated) ID lists. Chunks are yielded in order of completion.
+
+        Args:
+            ids: Entity IDs (e.g. a generator). Duplicates are fetched once.
+            props: Prop or list of props to retrieve (default: "labels").
+                Only supports: "labels", "descriptions", "aliases"
+            languages: Language code of props to retrieve (default: "en").
+            timeout: Request timeout in seconds (default: 10).
+            concurrency: Maximum number of requests in flight (default: 8).
+            skip: IDs not to fetch, e.g. those already in a cache of the caller.
+
+        Yields:
+            dict: Mapping from entity ID to a dictionary of requested props, for the
+            entities of one chunk, as returned by `wbgetentities`. The entities of a chunk
+            whose request failed are missing.
+
+        Example:
+            ```python
+            async for labels in client.iter_wbgetentities(qids, skip=known_labels):
+                known_labels.update(labels)
+            ```
+        """
+        props_list = self._check_entity_props(props)
+        if props_list is None:
+            return
+
+        # Closing the responses cancels the requests in flight if the caller stops early
+        async with aclosing(
+            self._iter_wbgetentities_raw(
+                ids, props, languages, timeout, concurrency, skip
+            )
+        ) as responses:
+            async for response in responses:
+                entities = _parse_entities(response, props_list, languages)
+                if entities:
+                    yield entities
+
+    async def _iter_wbgetentities_raw(
+        self,
+        ids: Iterable[str],
+        props: Union[str, list[str]],
+        languages: str,
+        timeout: int,
+        concurrency: int,
+        skip: Optional[Container[str]],
+    ) -> AsyncIterator[JsonResponse]:
+        """
+        Yields the raw wbgetentities responses of chunks of 50 IDs in order of completion,
+        with at most `concurrency` requests in flight. IDs are read lazily, and duplicates
+        and IDs in `skip` are not requested.
+        """
+
+        def chunks():
+            seen: set[str] = set()
+            group: list[str] = []
+            for id_ in ids:
+                if id_ in seen or (skip is not None and id_ in skip):
+                    continue
+                seen.add(id_)
+                group.append(id_)
+                if len(group) == WBGETENTITIES_MAX_IDS:
+                    yield group
+                    group = []
+            if group:
+                yield group
+
+        groups = chunks()
+        pending: set[asyncio.Task] = set()
+        try:
+            while True:
+                # Top up the pool of workers
+                for group in groups:
+                    pending.add(
+                        asyncio.ensure_future(
+                            self.wbgetentities_raw(
+                                group, props=props, languages=languages, timeout=timeout
+                            )
+                        )
+                    )
+                    if len(pending) >= concurrency:
+                        break
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            # The caller stopped iterating early. Each request is only cancelled if no
+            # other caller waits for it (see `_request`)
+            for task in pending:
+                task.cancel()
+
+    def _check_entity_props(self, props: Union[str, list[str]]) -> Optional[list[str]]:
+        """
+        Returns the props requested from wbgetentities as a list, or None (after logging an
+        error) if some of them are not supported.
         """
         supported_props = {"labels", "descriptions", "aliases"}
         if isinstance(props, str):
@@ -429,43 +915,8 @@ class WikidataAPIClient(_WikidataAPIClientRaw):
                 self.logger.error(
                     "Please use wbget_claims method instead to fetch claims."
                 )
-            return {}
-
-        ids: list[str] = []
-        for arg in ids_input:
-            if isinstance(arg, list):
-                ids.extend(arg)
-            elif isinstance(arg, str):
-                ids.append(arg)
-
-        # Chunk to max 50 IDs per request
-        def chunk(lst: list[str], size: int = 50) -> list[list[str]]:
-            return [lst[i : i + size] for i in range(0, len(lst), size)]
-
-        raw_responses = await asyncio.gather(
-            *(
-                self.wbgetentities_raw(
-                    *group, props=props, languages=languages, timeout=timeout
-                )
-                for group in chunk(ids)
-            )
-        )
-
-        results: dict[str, WikiEntity] = {}
-        for response in raw_responses:
-            entities = response.get("entities", {})
-            for id_, entity in entities.items():
-                item_dict = {}
-                for prop in props_list:
-                    if prop in ("labels", "descriptions"):
-                        item_dict[prop] = (
-                            entity.get(prop, {}).get(languages, {}).get("value", "")
-                        )
-                    elif prop == "aliases":
-                        aliases = entity.get("aliases", {}).get(languages, [])
-                        item_dict[prop] = [alias.get("value", "") for alias in aliases]
-                results[id_] = item_dict
-        return results
+            return None
+        return props_list
 
     async def wbget_claims(
         self,
@@ -476,7 +927,8 @@ class WikidataAPIClient(_WikidataAPIClientRaw):
         Fetches claims/claims about a single Wikidata entity using wbgetentities.
 
         - Exists as a separate method because the JSON response structure is different.
-        - Allows fetching only one entity at a time to simplify the return type.
+        - Allows fetching only one entity at a time to simplify the return type. Use
+          `iter_wbget_claims` to fetch the claims of many entities.
         - Only returns claims in which the object is a Wikidata entity
 
         Args:
@@ -494,12 +946,99 @@ class WikidataAPIClient(_WikidataAPIClientRaw):
         response = await self.wbgetentities_raw(
             entity_id, props="claims", timeout=timeout
         )
-        entities = response.get("entities", {})
-        entity = entities.get(entity_id, {})
-        claims = entity.get("claims", {})
+        return _parse_claims(response).get(entity_id, {})
+
+    async def iter_wbget_claims(
+        self,
+        ids: Iterable[str],
+        pids: Optional[Iterable[str]] = None,
+        timeout: int = 10,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        skip: Optional[Container[str]] = None,
+    ) -> AsyncIterator[dict[str, dict[str, list[str]]]]:
+        """
+        Fetch the claims of many Wikidata entities in chunks of 50, and yield the claims of
+        each chunk as soon as it is received.
 
-        results: dict[str, list[str]] = {}
-        for prop, values in claims.items():
+        IDs are read from `ids` only as workers become free, and at most `concurrency`
+        requests are in flight (see `iter_wbgetentities`). Chunks are yielded in order of
+        completion. As with `wbget_claims`, only claims whose object is a Wikidata entity
+        are returned.
+
+        Args:
+            ids: Entity IDs (e.g. a generator). Duplicates are fetched once.
+            pids: PIDs of the claims to keep (e.g. ["P31", "P279"]); other claims are
+                dropped before being collected. Default: all claims.
+            timeout: Request timeout in seconds (default: 10).
+            concurrency: Maximum number of requests in flight (default: 8).
+            skip: IDs not to fetch, e.g. those already in a cache of the caller.
+
+        Yields:
+            dict: Mapping from entity ID to its claims (mapping from PID to lists of
+            QIDs), for the entities of one chunk.
+                Example: {"Q42": {"P31": ["Q5"]}, "Q90": {"P31": ["Q515", ...]}}
+            Entities without matching claims map to an empty dict; the entities of a
+            chunk whose request failed are missing.
+        """
+        pid_set = set(pids) if pids is not None else None
+        async with aclosing(
+            self._iter_wbgetentities_raw(
+                ids, "claims", "en", timeout, concurrency, skip
+            )
+        ) as responses:
+            async for response in responses:
+                claims = _parse_claims(response, pid_set)
+                if claims:
+                    yield claims
+
+
+def _flatten_ids(ids_input: tuple[Union[str, list[str]], ...]) -> list[str]:
+    """Flattens IDs given as strings or lists of strings into a single list."""
+    ids: list[str] = []
+    for arg in ids_input:
+        if isinstance(arg, list):
+            ids.extend(arg)
+        elif isinstance(arg, str):
+            ids.append(arg)
+    return ids
+
+
+def _parse_entities(
+    response: JsonResponse, props_list: list[str], languages: str
+) -> dict[str, WikiEntity]:
+    """
+    Extracts the requested props of each entity of a wbgetentities response, in the
+    language requested.
+    """
+    results: dict[str, WikiEntity] = {}
+    for id_, entity in response.get("entities", {}).items():
+        item_dict = {}
+        for prop in props_list:
+            if prop in ("labels", "descriptions"):
+                item_dict[prop] = (
+                    entity.get(prop, {}).get(languages, {}).get("value", "")
+                )
+            elif prop == "aliases":
+                aliases = entity.get("aliases", {}).get(languages, [])
+                item_dict[prop] = [alias.get("value", "") for alias in aliases]
+        results[id_] = item_dict
+    return results
+
+
+def _parse_claims(
+    response: JsonResponse, pids: Optional[set[str]] = None
+) -> dict[str, dict[str, list[str]]]:
+    """
+    Extracts the claims whose object is a Wikidata entity from a wbgetentities response,
+    as mappings from PID to lists of QIDs, by entity ID. Only the claims of `pids` are kept,
+    if given.
+    """
+    results: dict[str, dict[str, list[str]]] = {}
+    for entity_id, entity in response.get("entities", {}).items():
+        entity_claims: dict[str, list[str]] = {}
+        for prop, values in entity.get("claims", {}).items():
+            if pids is not None and prop not in pids:
+                continue
             object_list = []
             for statement in values:
                 try:
@@ -511,5 +1050,6 @@ class WikidataAPIClient(_WikidataAPIClientRaw):
                 except KeyError:
                     continue
             if object_list:
-                results[prop] = object_list
-        return results
+                entity_claims[prop] = object_list
+        results[entity_id] = entity_claims
+    return results
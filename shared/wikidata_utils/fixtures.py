@@ -0,0 +1,276 @@
+"""
+Recording and replaying Wikidata API responses, for offline runs and benchmarks.
+
+A `FixtureArchive` is a JSON Lines file (gzip-compressed if its name ends with ".gz") with
+one recorded response per line:
+
+    {"endpoint": "wbgetentities", "params": {"ids": "Q42|Q90", ...}, "body": {...}}
+
+Responses are looked up by endpoint and normalized parameters (see `cache_key`), like in the
+response cache. For wbgetentities, the entities of all recorded responses are also indexed,
+so that requests for other groupings of the same IDs can be answered from the archive.
+
+The client sends its requests through a transport:
+
+- `RecordTransport` performs the requests and appends their responses to an archive.
+- `ReplayTransport` answers the requests from an archive, without network access.
+
+The archive can also be served over HTTP by the stand-in server (see
+`wikidata_utils.standin`), to exercise the whole client, including its rate limiters.
+
+Usage:
+    ```python
+    with FixtureArchive("fixtures.jsonl.gz") as archive:
+        client = WikidataAPIClient(session, transport=RecordTransport(archive))
+        ...
+    ```
+
+The command-line tools record to the file named by the `WIKIDATA_RECORD` environment
+variable, replay the file named by `WIKIDATA_REPLAY`, or answer from the subset index named
+by `WIKIDATA_SUBSET` (see `transport_from_env` and `wikidata_utils.subset`).
+"""
+
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from .cache import cache_key
+
+if TYPE_CHECKING:
+    from .client import _WikidataAPIClientRaw
+    from .subset import SubsetTransport
+
+# Environment variables naming the archive of the command-line tools
+RECORD_ENV_VAR = "WIKIDATA_RECORD"
+REPLAY_ENV_VAR = "WIKIDATA_REPLAY"
+SUBSET_ENV_VAR = "WIKIDATA_SUBSET"
+
+logger = logging.getLogger(__name__)
+
+
+def _entity_set_key(params: dict[str, Any]) -> tuple[str, str]:
+    """Returns the props and languages of a wbgetentities request, normalized."""
+    props = "|".join(sorted(str(params.get("props", "")).split("|")))
+    return props, str(params.get("languages", ""))
+
+
+class FixtureArchive:
+    """
+    Recorded Wikidata API responses, stored in a JSON Lines file.
+
+    Attributes:
+        path (Path): The archive file.
+        responses (dict[str, dict]): Recorded responses, by request key.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Load an archive file, if it exists. New responses are appended to it.
+
+        Args:
+            path (str | Path): The archive file. A ".gz" suffix compresses it.
+        """
+        self.path = Path(path).expanduser()
+        self.responses: dict[str, dict[str, Any]] = {}
+        # Entities of the wbgetentities responses, by props and languages, then by ID
+        self._entities: dict[tuple[str, str], dict[str, Any]] = {}
+        self._file = None
+        if self.path.exists():
+            with self._open("rt") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._index(
+                            record["endpoint"], record["params"], record["body"]
+                        )
+            logger.debug("Loaded %d responses from %s", len(self.responses), self.path)
+
+    def _open(self, mode: str):
+        if self.path.suffix == ".gz":
+            return gzip.open(self.path, mode, encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def __enter__(self) -> "FixtureArchive":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def _index(
+        self, endpoint: str, params: dict[str, Any], body: dict[str, Any]
+    ) -> None:
+        self.responses[cache_key(endpoint, params)] = body
+        if endpoint == "wbgetentities":
+            entities = self._entities.setdefault(_entity_set_key(params), {})
+            entities.update(body.get("entities", {}))
+
+    def get(
+        self, endpoint: str, params: dict[str, Any], partial: bool = False
+    ) -> Optional[dict[str, Any]]:
+        """
+        Return the recorded response of a request.
+
+        A wbgetentities request that was not recorded as such is answered if all its IDs
+        were recorded with the same props and languages.
+
+        Args:
+            endpoint (str): The endpoint name (e.g. "wbgetentities").
+            params (dict): The query parameters of the request.
+            partial (bool): Also answer wbgetentities requests for which only some IDs
+                were recorded, the others being reported as missing like nonexistent
+                entities.
+
+        Returns:
+            dict | None: The JSON response, or None if it was not recorded.
+        """
+        body = self.responses.get(cache_key(endpoint, params))
+        if body is not None or endpoint != "wbgetentities":
+            return body
+        entities = self._entities.get(_entity_set_key(params), {})
+        ids = [id_ for id_ in str(params.get("ids", "")).split("|") if id_]
+        if not ids or not (partial or all(id_ in entities for id_ in ids)):
+            return None
+        return {
+            "entities": {
+                id_: entities.get(id_, {"id": id_, "missing": ""}) for id_ in ids
+            },
+            "success": 1,
+        }
+
+    def add(self, endpoint: str, params: dict[str, Any], body: dict[str, Any]) -> None:
+        """
+        Record the response of a request, and append it to the archive file.
+
+        Args:
+            endpoint (str): The endpoint name.
+            params (dict): The query parameters of the request.
+            body (dict): The JSON response.
+        """
+        params = {str(name): str(value) for name, value in params.items()}
+        if self.responses.get(cache_key(endpoint, params)) == body:
+            return
+        self._index(endpoint, params, body)
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self._open("at")
+        record = {"endpoint": endpoint, "params": params, "body": body}
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        """Close the archive file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RecordTransport:
+    """
+    Performs the requests of a client over HTTP and records their responses.
+
+    Attributes:
+        archive (FixtureArchive): The archive receiving the responses.
+    """
+
+    # Requests are sent within the rate limiters of the client
+    rate_limited = True
+
+    def __init__(self, archive: FixtureArchive):
+        self.archive = archive
+
+    async def get(
+        self,
+        client: "_WikidataAPIClientRaw",
+        endpoint: str,
+        url: str,
+        params: dict[str, Any],
+        headers: Optional[dict[str, str]],
+        timeout: int,
+    ) -> Optional[dict[str, Any]]:
+        """Performs a request (see `_WikidataAPIClientRaw._get`) and records its response."""
+        data = await client._get(
+            url, params=params, headers=headers, timeout=timeout, endpoint=endpoint
+        )
+        if data:
+            self.archive.add(endpoint, params, data)
+        return data
+
+    def close(self) -> None:
+        """Close the archive file."""
+        self.archive.close()
+
+
+class ReplayTransport:
+    """
+    Answers the requests of a client from recorded responses, without network access.
+    Requests that were not recorded fail like requests with an HTTP error.
+
+    Attributes:
+        archive (FixtureArchive): The recorded responses.
+        misses (int): Number of requests that were not recorded.
+    """
+
+    # Requests are sent within the rate limiters of the client
+    rate_limited = True
+
+    def __init__(self, archive: FixtureArchive):
+        self.archive = archive
+        self.misses = 0
+
+    async def get(
+        self,
+        client: "_WikidataAPIClientRaw",
+        endpoint: str,
+        url: str,
+        params: dict[str, Any],
+        headers: Optional[dict[str, str]],
+        timeout: int,
+    ) -> Optional[dict[str, Any]]:
+        """Returns the recorded response of a request, or None if it was not recorded."""
+        data = self.archive.get(endpoint, params)
+        if data is None:
+            self.misses += 1
+            logger.warning("No recorded %s response for %s", endpoint, params)
+        return data
+
+    def close(self) -> None:
+        """Close the archive file."""
+        self.archive.close()
+
+
+def transport_from_env() -> (
+    "Optional[RecordTransport | ReplayTransport | SubsetTransport]"
+):
+    """
+    Return the transport set by the `WIKIDATA_RECORD`, `WIKIDATA_REPLAY` or
+    `WIKIDATA_SUBSET` environment variable.
+
+    Returns:
+        RecordTransport | ReplayTransport | SubsetTransport | None: A transport recording
+        to (or replaying) the archive named by the variable, or answering from the subset
+        index, or None if none is set.
+
+    Raises:
+        ValueError: If several variables are set, or if the subset index does not exist.
+    """
+    names = (RECORD_ENV_VAR, REPLAY_ENV_VAR, SUBSET_ENV_VAR)
+    record, replay, subset = (os.environ.get(name) for name in names)
+    if sum(bool(value) for value in (record, replay, subset)) > 1:
+        raise ValueError(f"Set only one of {', '.join(names)}")
+    if record:
+        return RecordTransport(FixtureArchive(record))
+    if replay:
+        return ReplayTransport(FixtureArchive(replay))
+    if subset:
+        # Imported here: the index is only needed for offline runs
+        from .subset import SubsetIndex, SubsetTransport
+
+        if not Path(subset).expanduser().exists():
+            raise ValueError(f"Subset index '{subset}' does not exist")
+        return SubsetTransport(SubsetIndex(subset))
+    return None
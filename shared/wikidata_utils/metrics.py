@@ -0,0 +1,185 @@
+"""
+Latency and throughput metrics of the Wikidata API client.
+
+`WikidataAPIClient.metrics` records, for each endpoint:
+
+- counters: requests sent, requests coalesced with an identical one in flight, throttled
+  responses, retries and errors;
+- errors by class (e.g. "HTTP 429", "TimeoutError");
+- bytes received;
+- histograms of the time spent waiting for the rate limiter, of the HTTP latency (until the
+  body is received), and of the JSON decoding time.
+
+Comparing the histograms tells what bounds a slow job: long limiter waits mean that the
+rate limits are the bottleneck, long latencies point to the network or the servers, and
+long decoding times to the size of the responses.
+
+Usage:
+    ```python
+    client = WikidataAPIClient(session)
+    ...
+    print(client.metrics.format_summary())
+    client.metrics.dump("metrics.json")
+    ```
+
+The command-line tools write the metrics to the file named by the `WIKIDATA_METRICS`
+environment variable, if set.
+"""
+
+import bisect
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+# Environment variable naming the metrics file of the command-line tools
+METRICS_ENV_VAR = "WIKIDATA_METRICS"
+# Upper bounds of the histogram buckets, in seconds (the last bucket has no bound)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# Histograms kept for each endpoint
+TIMINGS = ("limiter_wait", "latency", "decode")
+
+
+class Histogram:
+    """
+    Histogram of durations, with fixed buckets.
+
+    Attributes:
+        counts (list[int]): Number of durations in each bucket of `BUCKETS`, plus one for
+            longer durations.
+        count (int): Number of durations.
+        total (float): Sum of the durations, in seconds.
+        max (float): Longest duration, in seconds.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        """Record a duration, in seconds."""
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        Return an upper bound of a quantile: the bound of the bucket holding it (or the
+        longest duration, for the last bucket).
+
+        Args:
+            q (float): The quantile, between 0 and 1 (e.g. 0.95).
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the histogram as a JSON-serializable dict."""
+        return {
+            "count": self.count,
+            "total": round(self.total, 6),
+            "mean": round(self.total / self.count, 6) if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "max": round(self.max, 6),
+            "buckets": {
+                f"le_{bound:g}": count for bound, count in zip(BUCKETS, self.counts)
+            }
+            | {"inf": self.counts[-1]},
+        }
+
+
+class EndpointMetrics:
+    """
+    Metrics of one endpoint.
+
+    Attributes:
+        counters (Counter): "requests", "coalesced", "throttled", "retries" and "errors"
+            (including throttled responses).
+        errors (Counter): Errors by class (e.g. "HTTP 429", "ClientConnectorError").
+        bytes (int): Bytes received.
+        limiter_wait (Histogram): Time spent waiting for the rate limiter.
+        latency (Histogram): Time from sending a request to receiving its body.
+        decode (Histogram): Time spent decoding the JSON responses.
+    """
+
+    def __init__(self):
+        self.counters: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.bytes = 0
+        self.limiter_wait = Histogram()
+        self.latency = Histogram()
+        self.decode = Histogram()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the metrics as a JSON-serializable dict."""
+        return {
+            "counters": dict(self.counters),
+            "errors": dict(self.errors),
+            "bytes": self.bytes,
+            **{name: getattr(self, name).to_dict() for name in TIMINGS},
+        }
+
+
+class ClientMetrics:
+    """
+    Metrics of a client, by endpoint.
+
+    Attributes:
+        endpoints (dict[str, EndpointMetrics]): The metrics of each endpoint used so far.
+    """
+
+    def __init__(self):
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def __getitem__(self, endpoint: str) -> EndpointMetrics:
+        """Return the metrics of an endpoint, created on first access."""
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def error(self, endpoint: str, error: str) -> None:
+        """Count an error of an endpoint, by class."""
+        metrics = self[endpoint]
+        metrics.counters["errors"] += 1
+        metrics.errors[error] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the metrics of each endpoint as a JSON-serializable dict."""
+        return {
+            endpoint: metrics.to_dict() for endpoint, metrics in self.endpoints.items()
+        }
+
+    def dump(self, path: str | Path) -> None:
+        """Write the metrics to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def format_summary(self) -> str:
+        """Return the main metrics of each endpoint as lines of text, for logging."""
+        lines = []
+        for endpoint, metrics in self.endpoints.items():
+            latency = metrics.latency
+            lines.append(
+                f"{endpoint}: {metrics.counters['requests']} requests, "
+                f"{metrics.bytes / 1e6:.1f} MB, "
+                f"latency mean {latency.total / max(latency.count, 1):.3f}s "
+                f"p95 {latency.quantile(0.95):.3f}s, "
+                f"limiter wait {metrics.limiter_wait.total:.1f}s, "
+                f"decoding {metrics.decode.total:.1f}s, "
+                f"{metrics.counters['errors']} errors, "
+                f"{metrics.counters['retries']} retries"
+            )
+        return "\n".join(lines) or "No requests"
@@ -0,0 +1,232 @@
+"""
+Adaptive rate limiting and retries for the Wikidata API client.
+
+Wikidata answers HTTP 429 (Too Many Requests) or 503 (Service Unavailable) when a client
+sends requests faster than the servers can take, often with a `Retry-After` header giving
+the number of seconds to wait. A fixed rate limiter either stays below what the servers
+accept, or keeps sending requests that are refused.
+
+`AdaptiveLimiter` is an `aiolimiter.AsyncLimiter` whose rate follows the responses
+(additive increase, multiplicative decrease):
+
+- `throttle()` divides the rate (by `DECREASE_FACTOR`) when a request is throttled, at most
+  once per `time_period`, since the requests of a burst are refused together. With a
+  `Retry-After` delay, no request is let through before the delay is over.
+- `succeed()` adds `increase` to the rate for every `time_period` of successful requests,
+  up to the initial rate, which is the rate allowed by the usage policy.
+
+`RetryPolicy` gives the delays between the attempts of a throttled request: exponential
+backoff with full jitter, or the `Retry-After` delay if longer, up to `max_retries` retries.
+
+Usage:
+    ```python
+    limiter = AdaptiveLimiter(30, 1)
+    policy = RetryPolicy(max_retries=4)
+    attempt = 0
+    while True:
+        try:
+            async with limiter:
+                data = await get(url)
+        except Throttled as e:
+            limiter.throttle(e.retry_after)
+            delay = policy.delay(attempt, e.retry_after)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
+        else:
+            limiter.succeed()
+            break
+    ```
+"""
+
+import asyncio
+import random
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from aiolimiter import AsyncLimiter
+
+# HTTP statuses meaning that the request should be sent again more slowly
+THROTTLE_STATUSES = (429, 503)
+# Factor applied to the rate of a limiter when a request is throttled
+DECREASE_FACTOR = 0.5
+# Lowest rate of a limiter, as a share of its initial rate
+MIN_RATE_SHARE = 0.05
+# Default retry policy
+MAX_RETRIES = 4
+BASE_DELAY = 0.5
+MAX_DELAY = 60.0
+
+
+class Throttled(Exception):
+    """
+    Raised for a response with one of the `THROTTLE_STATUSES`.
+
+    Attributes:
+        status (int): The HTTP status.
+        retry_after (float | None): The delay given by the `Retry-After` header, in
+            seconds.
+    """
+
+    def __init__(self, status: int, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}, retry after {retry_after}s")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a `Retry-After` header, either a number of seconds or an HTTP date.
+
+    Args:
+        value (str | None): The header value.
+
+    Returns:
+        float | None: The delay in seconds (0 for a date in the past), or None if the header
+        is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter(AsyncLimiter):
+    """
+    Leaky bucket rate limiter whose rate decreases multiplicatively when requests are
+    throttled and increases additively while they succeed.
+
+    Attributes:
+        initial_rate (float): The highest rate, in requests per second.
+        min_rate (float): The lowest rate, in requests per second.
+        increase (float): Rate added after each `time_period` of successful requests.
+        counters (Counter): "throttled" requests, "decreases" and "increases" of the rate.
+    """
+
+    def __init__(
+        self,
+        max_rate: float,
+        time_period: float = 1,
+        min_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+    ):
+        """
+        Args:
+            max_rate (float): Requests allowed per `time_period`, at most and initially.
+            time_period (float): Duration of the period, in seconds.
+            min_rate (float, optional): Lowest rate, in requests per second. Defaults to
+                `MIN_RATE_SHARE` of the initial rate.
+            increase (float, optional): Rate added after each `time_period` of
+                successful requests, in requests per second. Defaults to a tenth of the
+                initial rate.
+        """
+        super().__init__(max_rate, time_period)
+        self.initial_rate = max_rate / time_period
+        self.min_rate = min_rate or self.initial_rate * MIN_RATE_SHARE
+        self.increase = increase or self.initial_rate / 10
+        self.counters: Counter = Counter()
+        self._paused_until = 0.0
+        self._last_change = self._last_decrease = 0.0
+
+    @property
+    def rate(self) -> float:
+        """The current rate, in requests per second."""
+        return self._rate_per_sec
+
+    def _set_rate(self, rate: float) -> None:
+        # Leak the bucket at the old rate up to now, then reschedule the waiting requests
+        self._leak()
+        self._rate_per_sec = rate
+        # The bucket holds the requests of one period, and at least one request
+        self.max_rate = max(rate * self.time_period, 1.0)
+        self._last_change = time.monotonic()
+        self._wake_next()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait for the end of a `Retry-After` delay, then acquire capacity."""
+        while (delay := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+        await super().acquire(amount)
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Slow down after a throttled request.
+
+        Args:
+            retry_after (float, optional): Delay given by the server, in seconds. No
+                request is let through before it is over.
+        """
+        self.counters["throttled"] += 1
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        # Requests sent before the last decrease do not reflect the new rate yet
+        if time.monotonic() - self._last_decrease < self.time_period:
+            return
+        rate = max(self.rate * DECREASE_FACTOR, self.min_rate)
+        if rate < self.rate:
+            self.counters["decreases"] += 1
+            self._set_rate(rate)
+            self._last_decrease = self._last_change
+
+    def succeed(self) -> None:
+        """Speed up, after a period without throttled requests."""
+        if self.rate >= self.initial_rate:
+            return
+        if time.monotonic() - self._last_change < self.time_period:
+            return
+        self.counters["increases"] += 1
+        self._set_rate(min(self.rate + self.increase, self.initial_rate))
+
+
+class RetryPolicy:
+    """
+    Delays between the attempts of a throttled request: exponential backoff with full
+    jitter, so that the requests refused together are not sent again together.
+
+    Attributes:
+        max_retries (int): Retries allowed per request (0 disables retries).
+        base_delay (float): Upper bound of the first delay, in seconds.
+        max_delay (float): Upper bound of every delay, in seconds. A longer `Retry-After`
+            delay gives up the request.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = MAX_RETRIES,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Return the delay before retrying a request.
+
+        Args:
+            attempt (int): Number of retries so far.
+            retry_after (float, optional): Delay given by the server, in seconds.
+
+        Returns:
+            float | None: The delay in seconds, or None if the request should not be
+            retried.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if retry_after is not None and retry_after > self.max_delay:
+            return None
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+        return max(backoff, retry_after or 0.0)
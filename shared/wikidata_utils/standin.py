@@ -0,0 +1,250 @@
+"""
+Local stand-in for the Wikidata API and Query Service, serving recorded responses.
+
+The server answers the requests of `WikidataAPIClient` from a fixture archive (see
+`wikidata_utils.fixtures`), so that the client and the tools built on it can be load-tested
+and benchmarked reproducibly without network access:
+
+- `/w/api.php`: `action=wbgetentities`, `action=wbsearchentities` and `list=search`.
+- `/sparql`: SPARQL queries, answered with SPARQL JSON results.
+- `/stats`: the number of requests, misses and injected errors, as JSON.
+
+wbgetentities requests are answered for any grouping of the recorded IDs; IDs that were not
+recorded are reported as missing. Other requests that were not recorded get empty results.
+
+Latency and failures of the live services can be simulated:
+
+- `--latency` and `--jitter` delay each response.
+- `--error-rate` answers a share of the requests with `--error-status` (e.g. 503).
+- `--max-rate` answers HTTP 429 to the requests over a number per second, like the
+  Wikidata rate limits, with a `Retry-After` header if `--retry-after` is set.
+
+Usage:
+    python -m wikidata_utils.standin fixtures.jsonl.gz --port 8765 --latency 0.2 --max-rate 30
+
+Point the command-line tools to the server with environment variables:
+    WIKIDATA_API_URL=http://127.0.0.1:8765/w/api.php \\
+    WIKIDATA_SPARQL_URL=http://127.0.0.1:8765/sparql \\
+    python -m rdfconv.labels input.txt
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Optional
+
+from aiohttp import web
+
+from .fixtures import FixtureArchive
+
+logger = logging.getLogger(__name__)
+if not logger.hasHandlers():
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+# Responses to requests that were not recorded
+EMPTY_RESPONSES = {
+    "search": {"batchcomplete": "", "query": {"search": []}},
+    "wbsearchentities": {"search": [], "success": 1},
+    "sparql": {"head": {"vars": []}, "results": {"bindings": []}},
+}
+# Actions of the API served besides list=search, named like the endpoints of the client
+API_ACTIONS = ("wbgetentities", "wbsearchentities")
+
+
+class StandInServer:
+    """
+    aiohttp application serving recorded Wikidata responses, with simulated latency,
+    errors and rate limits.
+
+    Attributes:
+        archive (FixtureArchive): The recorded responses.
+        counters (dict[str, Counter]): "requests", "misses", "errors" and "throttled" of
+            each endpoint.
+    """
+
+    def __init__(
+        self,
+        archive: FixtureArchive,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        max_rate: Optional[float] = None,
+        retry_after: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            archive (FixtureArchive): The recorded responses.
+            latency (float): Delay of each response, in seconds.
+            jitter (float): Maximum random delay added to `latency`, in seconds.
+            error_rate (float): Share of the requests answered with `error_status`.
+            error_status (int): HTTP status of the injected errors.
+            max_rate (float, optional): Requests accepted per second; the others get
+                HTTP 429.
+            retry_after (float, optional): `Retry-After` delay sent with the HTTP 429 and
+                injected errors, in seconds.
+            seed (int, optional): Seed of the random latencies and errors.
+
+        Raises:
+            ValueError: If `error_rate` is not between 0 and 1.
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"error_rate must be between 0 and 1, got {error_rate}")
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.max_rate = max_rate
+        self.retry_after = retry_after
+        self.counters: dict[str, Counter] = {}
+        self._random = random.Random(seed)
+        # Times of the requests accepted during the last second
+        self._accepted: deque[float] = deque()
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application of the server."""
+        app = web.Application()
+        app.router.add_get("/w/api.php", self.handle_api)
+        app.router.add_get("/sparql", self.handle_sparql)
+        app.router.add_get("/stats", self.handle_stats)
+        return app
+
+    def _throttled(self) -> bool:
+        if self.max_rate is None:
+            return False
+        now = time.monotonic()
+        while self._accepted and now - self._accepted[0] >= 1:
+            self._accepted.popleft()
+        if len(self._accepted) >= self.max_rate:
+            return True
+        self._accepted.append(now)
+        return False
+
+    def _error(self, status: int) -> web.Response:
+        headers = {}
+        if self.retry_after is not None:
+            headers["Retry-After"] = f"{self.retry_after:g}"
+        return web.Response(status=status, headers=headers)
+
+    async def _respond(self, endpoint: str, params: dict[str, str]) -> web.Response:
+        counters = self.counters.setdefault(endpoint, Counter())
+        counters["requests"] += 1
+        if self._throttled():
+            counters["throttled"] += 1
+            return self._error(429)
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if self._random.random() < self.error_rate:
+            counters["errors"] += 1
+            return self._error(self.error_status)
+        body = self.archive.get(endpoint, params, partial=True)
+        if body is None:
+            counters["misses"] += 1
+            body = EMPTY_RESPONSES.get(endpoint, {})
+        content_type = (
+            "application/sparql-results+json"
+            if endpoint == "sparql"
+            else "application/json"
+        )
+        return web.json_response(body, content_type=content_type)
+
+    async def handle_api(self, request: web.Request) -> web.Response:
+        """Answers a request to the action API."""
+        params = dict(request.query)
+        action = params.get("action")
+        if action == "query" and params.get("list") == "search":
+            endpoint = "search"
+        elif action in API_ACTIONS:
+            endpoint = action
+        else:
+            raise web.HTTPBadRequest(text=f"Unsupported request: {params}")
+        return await self._respond(endpoint, params)
+
+    async def handle_sparql(self, request: web.Request) -> web.Response:
+        """Answers a SPARQL query."""
+        return await self._respond("sparql", dict(request.query))
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        """Returns the counters of the server."""
+        return web.json_response(
+            {endpoint: dict(counters) for endpoint, counters in self.counters.items()}
+        )
+
+
+def main():
+    """
+    CLI entry point of the stand-in server.
+
+    CLI arguments:
+        archive (str): Fixture archive to serve (see `wikidata_utils.fixtures`).
+        --host, --port: Address of the server (default: 127.0.0.1:8765).
+        --latency, --jitter (float): Delay of each response, in seconds.
+        --error-rate (float), --error-status (int): Injected errors.
+        --max-rate (float): Requests accepted per second.
+        --retry-after (float): `Retry-After` delay of throttled and failed requests.
+        --seed (int): Seed of the random latencies and errors.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve recorded Wikidata responses on a local HTTP server."
+    )
+    parser.add_argument("archive", type=Path, help="Fixture archive (JSON Lines).")
+    parser.add_argument("--host", default="127.0.0.1", help="Default: 127.0.0.1.")
+    parser.add_argument("--port", type=int, default=8765, help="Default: 8765.")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Response delay in seconds."
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Maximum random extra delay."
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Share of failed requests."
+    )
+    parser.add_argument(
+        "--error-status", type=int, default=503, help="Status of failed requests."
+    )
+    parser.add_argument(
+        "--max-rate", type=float, help="Requests accepted per second (others: 429)."
+    )
+    parser.add_argument(
+        "--retry-after", type=float, help="Retry-After of throttled/failed requests."
+    )
+    parser.add_argument("--seed", type=int, help="Seed of the random delays/errors.")
+    args = parser.parse_args()
+
+    if not args.archive.exists():
+        parser.error(f"Archive '{args.archive}' does not exist.")
+    archive = FixtureArchive(args.archive)
+    logger.info("Serving %d recorded responses from %s", len(archive), args.archive)
+    server = StandInServer(
+        archive,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        max_rate=args.max_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    try:
+        web.run_app(
+            server.app(), host=args.host, port=args.port, print=None, access_log=None
+        )
+    finally:
+        logger.info(
+            "Requests: %s",
+            {
+                endpoint: dict(counters)
+                for endpoint, counters in server.counters.items()
+            },
+        )
+
+
+if __name__ == "__main__":
+    main()
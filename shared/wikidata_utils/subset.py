@@ -0,0 +1,704 @@
+"""
+Local index of a Wikidata subset, built from a dump, for offline label and claim lookups.
+
+Looking up the labels and claims of tens of thousands of entities through the API takes
+hours at the Wikidata rate limits. When the entities of a job are known in advance (e.g. the
+IDs in the output of a converter), `build_index` extracts them from a locally downloaded
+dump instead, and stores them in a SQLite file:
+
+- terms: labels, descriptions and aliases, in the languages kept;
+- claims: the truthy ("wdt:") statements whose object is an entity.
+
+The dump is either the truthy N-Triples dump (`latest-truthy.nt.gz`, `.bz2` or plain) or
+the JSON dump (`latest-all.json.gz`), whose statements are reduced to the truthy ones (the
+preferred statements of a property, or its normal ones if none is preferred).
+
+Only the entities reachable from the seeds are kept. Each pass over the dump stores the
+entities of one level: the seeds first, then the objects and properties of the claims of
+the previous level, up to `depth`. A last pass stores the terms (but not the claims) of the
+entities referenced by the deepest level, so that every claim can be displayed with labels.
+Each pass reads the whole dump, so a full dump takes hours per pass; lines of other
+entities are skipped without being parsed.
+
+`SubsetTransport` answers the requests of `WikidataAPIClient` from the index, at disk speed
+and without rate limits: wbgetentities (labels, descriptions, aliases and claims) and
+wbsearchentities (prefix match of labels and aliases). Full-text searches and SPARQL queries
+cannot be answered offline, and fail like requests with an HTTP error.
+
+Usage:
+    python -m wikidata_utils.subset latest-truthy.nt.gz output.ttl -o subset.sqlite
+
+    ```python
+    with SubsetIndex("subset.sqlite") as index:
+        client = WikidataAPIClient(session, transport=SubsetTransport(index))
+        labels = await client.wbgetentities("Q42", "Q90")
+    ```
+
+The command-line tools read the index named by the `WIKIDATA_SUBSET` environment variable,
+if set (see `wikidata_utils.fixtures.transport_from_env`).
+"""
+
+import argparse
+import bz2
+import gzip
+import json
+import logging
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from .helpers import extract_wd_id
+
+if TYPE_CHECKING:
+    from .client import _WikidataAPIClientRaw
+
+DEFAULT_LANGUAGES = ("en",)
+# Rows inserted per transaction while building an index
+BATCH_SIZE = 50_000
+# Lines read between two progress messages
+PROGRESS_LINES = 50_000_000
+
+ENTITY_IRI = "http://www.wikidata.org/entity/"
+DIRECT_IRI = "http://www.wikidata.org/prop/direct/"
+# Predicates of the terms in the truthy dump (which also has schema:name and
+# skos:prefLabel copies of the labels)
+TERM_PREDICATES = {
+    "http://www.w3.org/2000/01/rdf-schema#label": "labels",
+    "http://schema.org/description": "descriptions",
+    "http://www.w3.org/2004/02/skos/core#altLabel": "aliases",
+}
+# Codes of the term kinds in the index
+TERM_KINDS = {"labels": 0, "descriptions": 1, "aliases": 2}
+
+# Start of the N-Triples lines about an entity, and of the IRI of an entity as an object
+_SUBJECT_START = f"<{ENTITY_IRI}"
+_ENTITY_ID_START = len(_SUBJECT_START)
+# ID of an entity in a line of the JSON dump ("type" and "id" come first)
+_JSON_ID_PATTERN = re.compile(r'"id":"([A-Z]\d+)"')
+_JSON_ID_SPAN = 200
+# Escape sequences of N-Triples literals
+_ESCAPE_PATTERN = re.compile(r"\\(?:u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|(.))")
+_ESCAPES = {"t": "\t", "b": "\b", "n": "\n", "r": "\r", "f": "\f"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entities (
+    id TEXT PRIMARY KEY,
+    depth INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (
+    id TEXT NOT NULL,
+    kind INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (id, kind, language, value)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS claims (
+    id TEXT NOT NULL,
+    property TEXT NOT NULL,
+    object TEXT NOT NULL,
+    PRIMARY KEY (id, property, object)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS names (
+    language TEXT NOT NULL,
+    name TEXT NOT NULL,
+    id TEXT NOT NULL,
+    PRIMARY KEY (language, name, id)
+) WITHOUT ROWID;
+"""
+
+logger = logging.getLogger(__name__)
+if not logger.hasHandlers():
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
+# A record of an entity: (ID, "labels" | "descriptions" | "aliases", language, text) or
+# (ID, "claims", PID, object ID)
+Record = tuple[str, str, str, str]
+
+
+def open_dump(path: str | Path):
+    """
+    Open a dump as text, decompressing it if its name ends with ".gz" or ".bz2".
+
+    Args:
+        path (str | Path): The dump file.
+    """
+    path = Path(path).expanduser()
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".bz2":
+        return bz2.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def dump_format(path: str | Path) -> str:
+    """
+    Return the format of a dump from its name: "nt" (N-Triples) or "json".
+
+    Raises:
+        ValueError: If the name has neither a ".nt" nor a ".json" suffix.
+    """
+    suffixes = Path(path).suffixes
+    if ".nt" in suffixes:
+        return "nt"
+    if ".json" in suffixes:
+        return "json"
+    raise ValueError(f"Unknown dump format (expected .nt or .json): {path}")
+
+
+def _unescape(literal: str) -> str:
+    """Decodes the escape sequences of an N-Triples literal."""
+    if "\\" not in literal:
+        return literal
+
+    def replace(match: re.Match) -> str:
+        code = match.group(1) or match.group(2)
+        if code:
+            return chr(int(code, 16))
+        char = match.group(3)
+        return _ESCAPES.get(char, char)
+
+    return _ESCAPE_PATTERN.sub(replace, literal)
+
+
+def iter_ntriples(lines: Iterable[str], wanted: set[str]) -> Iterator[Record]:
+    """
+    Yield the records of the `wanted` entities from the lines of a truthy N-Triples dump.
+
+    Args:
+        lines (Iterable[str]): The lines of the dump.
+        wanted (set[str]): IDs of the entities to extract.
+    """
+    for line in lines:
+        if not line.startswith(_SUBJECT_START):
+            continue
+        end = line.find(">", _ENTITY_ID_START)
+        id_ = line[_ENTITY_ID_START:end]
+        if id_ not in wanted:
+            continue
+        predicate_end = line.find(">", end + 2)
+        predicate = line[end + 3 : predicate_end]
+        # The object, without the final " ."
+        obj = line[predicate_end + 2 :].rstrip()[:-1].rstrip()
+        if predicate.startswith(DIRECT_IRI):
+            if obj.startswith(_SUBJECT_START):
+                pid = predicate[len(DIRECT_IRI) :]
+                yield id_, "claims", pid, obj[_ENTITY_ID_START:-1]
+        elif predicate in TERM_PREDICATES:
+            quote = obj.rfind('"@')
+            if obj.startswith('"') and quote > 0:
+                yield (
+                    id_,
+                    TERM_PREDICATES[predicate],
+                    obj[quote + 2 :],
+                    _unescape(obj[1:quote]),
+                )
+
+
+def _truthy_statements(statements: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Returns the preferred statements if any, otherwise the normal ones."""
+    preferred = [s for s in statements if s.get("rank") == "preferred"]
+    return preferred or [s for s in statements if s.get("rank", "normal") == "normal"]
+
+
+def entity_records(entity: dict[str, Any]) -> Iterator[Record]:
+    """
+    Yield the records of an entity of the JSON dump (or of a wbgetentities response).
+
+    Args:
+        entity (dict): The JSON entity.
+    """
+    id_ = entity["id"]
+    for kind in ("labels", "descriptions"):
+        for language, term in entity.get(kind, {}).items():
+            yield id_, kind, language, term["value"]
+    for language, aliases in entity.get("aliases", {}).items():
+        for alias in aliases:
+            yield id_, "aliases", language, alias["value"]
+    for pid, statements in entity.get("claims", {}).items():
+        for statement in _truthy_statements(statements):
+            value = statement.get("mainsnak", {}).get("datavalue", {}).get("value")
+            if isinstance(value, dict) and "id" in value:
+                yield id_, "claims", pid, value["id"]
+
+
+def iter_json(lines: Iterable[str], wanted: set[str]) -> Iterator[Record]:
+    """
+    Yield the records of the `wanted` entities from the lines of a JSON dump (one entity
+    per line, in a JSON array).
+
+    Args:
+        lines (Iterable[str]): The lines of the dump.
+        wanted (set[str]): IDs of the entities to extract.
+    """
+    for line in lines:
+        match = _JSON_ID_PATTERN.search(line, 0, _JSON_ID_SPAN)
+        if match is None or match.group(1) not in wanted:
+            continue
+        yield from entity_records(json.loads(line.rstrip().rstrip(",")))
+
+
+def read_seeds(paths: Iterable[str | Path]) -> set[str]:
+    """
+    Return the Wikidata IDs found in text files: lists of IDs, Turtle files, CSV files...
+
+    Args:
+        paths (Iterable[str | Path]): The files.
+    """
+    seeds: set[str] = set()
+    for path in paths:
+        with open(Path(path).expanduser(), encoding="utf-8") as f:
+            for line in f:
+                seeds.update(extract_wd_id(line, all_match=True) or ())
+    return seeds
+
+
+class SubsetIndex:
+    """
+    SQLite index of the terms and truthy claims of a Wikidata subset.
+
+    Attributes:
+        path (Path): The index file.
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Open (or create) an index file.
+
+        Args:
+            path (str | Path): The index file. Its folder is created if needed.
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(_SCHEMA)
+
+    def __enter__(self) -> "SubsetIndex":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __contains__(self, id_: str) -> bool:
+        return (
+            self._db.execute(
+                "SELECT 1 FROM terms WHERE id = ? LIMIT 1", (id_,)
+            ).fetchone()
+            is not None
+            or self._db.execute(
+                "SELECT 1 FROM entities WHERE id = ?", (id_,)
+            ).fetchone()
+            is not None
+        )
+
+    def meta(self) -> dict[str, str]:
+        """Return the build parameters of the index (dump, depth, languages...)."""
+        return dict(self._db.execute("SELECT key, value FROM meta"))
+
+    def add(self, records: Iterable[Record]) -> None:
+        """
+        Store records of entities, in one transaction.
+
+        Args:
+            records (Iterable[Record]): Terms and claims, as yielded by `iter_ntriples`.
+        """
+        terms, claims = [], []
+        for id_, kind, key, value in records:
+            if kind == "claims":
+                claims.append((id_, key, value))
+            else:
+                terms.append((id_, TERM_KINDS[kind], key, value))
+        with self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO terms VALUES (?, ?, ?, ?)", terms
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO claims VALUES (?, ?, ?)", claims
+            )
+
+    def mark(self, ids: Iterable[str], depth: int) -> None:
+        """Record that the claims of entities are stored, with their distance to the seeds."""
+        with self._db:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO entities VALUES (?, ?)",
+                ((id_, depth) for id_ in ids),
+            )
+
+    def finish(self, meta: dict[str, str]) -> None:
+        """
+        Build the search index of the labels and aliases, store the build parameters and
+        compact the file.
+
+        Args:
+            meta (dict[str, str]): The build parameters.
+        """
+        with self._db:
+            self._db.execute("DELETE FROM names")
+            self._db.execute(
+                "INSERT OR IGNORE INTO names SELECT language, lower(value), id FROM terms"
+                " WHERE kind IN (?, ?)",
+                (TERM_KINDS["labels"], TERM_KINDS["aliases"]),
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)", meta.items()
+            )
+        self._db.execute("VACUUM")
+
+    def entity(
+        self, id_: str, props: Iterable[str], languages: Iterable[str]
+    ) -> dict[str, Any]:
+        """
+        Return an entity in the format of the wbgetentities API.
+
+        Args:
+            id_ (str): The entity ID.
+            props (Iterable[str]): Props to include: labels, descriptions, aliases, claims.
+            languages (Iterable[str]): Languages of the terms.
+
+        Returns:
+            dict: The entity, or `{"id": id_, "missing": ""}` if it is not in the index.
+        """
+        if id_ not in self:
+            return {"id": id_, "missing": ""}
+        props = set(props)
+        languages = list(languages)
+        entity: dict[str, Any] = {
+            "type": "property" if id_.startswith("P") else "item",
+            "id": id_,
+        }
+        kinds = [TERM_KINDS[kind] for kind in TERM_KINDS if kind in props]
+        for kind in TERM_KINDS:
+            if kind in props:
+                entity[kind] = {}
+        if kinds and languages:
+            rows = self._db.execute(
+                f"SELECT kind, language, value FROM terms WHERE id = ?"
+                f" AND kind IN ({','.join('?' * len(kinds))})"
+                f" AND language IN ({','.join('?' * len(languages))})",
+                (id_, *kinds, *languages),
+            )
+            names = {code: kind for kind, code in TERM_KINDS.items()}
+            for code, language, value in rows:
+                term = {"language": language, "value": value}
+                if names[code] == "aliases":
+                    entity["aliases"].setdefault(language, []).append(term)
+                else:
+                    entity[names[code]][language] = term
+        if "claims" in props:
+            claims: dict[str, list[dict[str, Any]]] = {}
+            rows = self._db.execute(
+                "SELECT property, object FROM claims WHERE id = ?", (id_,)
+            )
+            for pid, obj in rows:
+                claims.setdefault(pid, []).append(_statement(pid, obj))
+            entity["claims"] = claims
+        return entity
+
+    def search(
+        self,
+        term: str,
+        language: str = "en",
+        entity_type: str = "item",
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Return the entities whose label or alias starts with a term (case-insensitive),
+        exact matches first, in the format of the wbsearchentities API.
+
+        Args:
+            term (str): The search term.
+            language (str): Language of the labels and aliases.
+            entity_type (str): "item" or "property".
+            limit (int): Maximum number of results.
+        """
+        prefix = term.strip().lower()
+        if not prefix:
+            return []
+        rows = self._db.execute(
+            "SELECT id, MIN(length(name)) AS shortest FROM names"
+            " WHERE language = ? AND name >= ? AND name < ? AND id LIKE ?"
+            " GROUP BY id ORDER BY MAX(name = ?) DESC, shortest, id LIMIT ?",
+            (
+                language,
+                prefix,
+                prefix + "\U0010ffff",
+                "P%" if entity_type == "property" else "Q%",
+                prefix,
+                limit,
+            ),
+        ).fetchall()
+        results = []
+        for id_, _ in rows:
+            entity = self.entity(id_, ("labels", "descriptions"), (language,))
+            result: dict[str, Any] = {"id": id_}
+            for kind, key in (("labels", "label"), ("descriptions", "description")):
+                if language in entity[kind]:
+                    result[key] = entity[kind][language]["value"]
+            results.append(result)
+        return results
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the size of the index: "entities" with claims, entities with "terms",
+        "claims", and "bytes" of the file.
+        """
+        queries = {
+            "entities": "SELECT COUNT(*) FROM entities",
+            "terms": "SELECT COUNT(DISTINCT id) FROM terms",
+            "claims": "SELECT COUNT(*) FROM claims",
+        }
+        stats = {
+            name: self._db.execute(query).fetchone()[0]
+            for name, query in queries.items()
+        }
+        return stats | {"bytes": self.path.stat().st_size}
+
+    def close(self) -> None:
+        """Close the index file."""
+        self._db.close()
+
+
+def _statement(pid: str, obj: str) -> dict[str, Any]:
+    """Returns a truthy claim as a statement of the wbgetentities API."""
+    entity_type = "property" if obj.startswith("P") else "item"
+    return {
+        "mainsnak": {
+            "snaktype": "value",
+            "property": pid,
+            "datavalue": {
+                "value": {"entity-type": entity_type, "id": obj},
+                "type": "wikibase-entityid",
+            },
+        },
+        "type": "statement",
+        "rank": "normal",
+    }
+
+
+def _scan(
+    dump: Path, wanted: set[str], index: SubsetIndex, languages: set[str], claims: bool
+) -> tuple[set[str], set[str]]:
+    """
+    Stores the records of the `wanted` entities found in a dump: their terms in
+    `languages` and, if `claims` is set, their claims.
+
+    Returns:
+        tuple[set[str], set[str]]: The IDs found, and the objects and properties of their
+        claims.
+    """
+    parse = iter_ntriples if dump_format(dump) == "nt" else iter_json
+    found: set[str] = set()
+    referenced: set[str] = set()
+    batch: list[Record] = []
+    lines = 0
+
+    def counted(f) -> Iterator[str]:
+        nonlocal lines
+        for lines, line in enumerate(f, 1):
+            if lines % PROGRESS_LINES == 0:
+                logger.info(
+                    "%d million lines read, %d entities found",
+                    lines // 10**6,
+                    len(found),
+                )
+            yield line
+
+    with open_dump(dump) as f:
+        for record in parse(counted(f), wanted):
+            id_, kind, key, value = record
+            found.add(id_)
+            if kind == "claims":
+                if not claims:
+                    continue
+                referenced.add(key)
+                referenced.add(value)
+            elif key not in languages:
+                continue
+            batch.append(record)
+            if len(batch) >= BATCH_SIZE:
+                index.add(batch)
+                batch = []
+    index.add(batch)
+    logger.debug("Read %d lines", lines)
+    return found, referenced
+
+
+def build_index(
+    dump: str | Path,
+    seeds: Iterable[str],
+    path: str | Path,
+    depth: int = 0,
+    languages: Iterable[str] = DEFAULT_LANGUAGES,
+) -> SubsetIndex:
+    """
+    Build the index of the entities reachable from seeds, from a Wikidata dump.
+
+    Args:
+        dump (str | Path): The truthy N-Triples dump or the JSON dump (see `open_dump`).
+        seeds (Iterable[str]): IDs of the entities to start from.
+        path (str | Path): The index file. Entities already in it are kept.
+        depth (int): Number of claim hops from the seeds whose entities get their claims
+            stored. The entities one more hop away get their terms only.
+        languages (Iterable[str]): Languages of the terms to keep.
+
+    Returns:
+        SubsetIndex: The open index.
+
+    Raises:
+        ValueError: If the dump format is unknown or `depth` is negative.
+    """
+    dump = Path(dump).expanduser()
+    dump_format(dump)
+    if depth < 0:
+        raise ValueError(f"depth must be positive or zero, got {depth}")
+    languages = set(languages)
+    index = SubsetIndex(path)
+    level = set(seeds)
+    done: set[str] = set()
+    for hop in range(depth + 2):
+        # The last pass only stores the terms of the entities referenced so far
+        with_claims = hop <= depth
+        wanted = level - done
+        if not wanted:
+            break
+        start = time.perf_counter()
+        logger.info(
+            "Pass %d over %s: %d entities (%s)",
+            hop + 1,
+            dump.name,
+            len(wanted),
+            "terms and claims" if with_claims else "terms",
+        )
+        found, referenced = _scan(dump, wanted, index, languages, with_claims)
+        if with_claims:
+            index.mark(found, hop)
+        logger.info(
+            "Pass %d: %d of %d entities found in %.0fs",
+            hop + 1,
+            len(found),
+            len(wanted),
+            time.perf_counter() - start,
+        )
+        done |= wanted
+        level = referenced
+    index.finish(
+        {
+            "dump": str(dump),
+            "depth": str(depth),
+            "languages": "|".join(sorted(languages)),
+        }
+    )
+    return index
+
+
+class SubsetTransport:
+    """
+    Answers the wbgetentities and wbsearchentities requests of a client from a subset
+    index, without network access nor rate limits. Other requests fail like requests with
+    an HTTP error.
+
+    Attributes:
+        index (SubsetIndex): The index.
+        misses (int): Number of requests that could not be answered.
+    """
+
+    # Requests are answered at disk speed: the client skips its rate limiters
+    rate_limited = False
+
+    def __init__(self, index: SubsetIndex):
+        self.index = index
+        self.misses = 0
+
+    async def get(
+        self,
+        client: "_WikidataAPIClientRaw",
+        endpoint: str,
+        url: str,
+        params: dict[str, Any],
+        headers: Optional[dict[str, str]],
+        timeout: int,
+    ) -> Optional[dict[str, Any]]:
+        """Returns the response of a request built from the index, or None."""
+        if endpoint == "wbgetentities":
+            ids = [id_ for id_ in str(params.get("ids", "")).split("|") if id_]
+            props = str(params.get("props", "")).split("|")
+            languages = str(params.get("languages", "")).split("|")
+            return {
+                "entities": {
+                    id_: self.index.entity(id_, props, languages) for id_ in ids
+                },
+                "success": 1,
+            }
+        if endpoint == "wbsearchentities":
+            results = self.index.search(
+                str(params.get("search", "")),
+                language=str(params.get("language", "en")),
+                entity_type=str(params.get("type", "item")),
+                limit=int(params.get("limit", 7)),
+            )
+            return {"search": results, "success": 1}
+        self.misses += 1
+        logger.warning("%s requests cannot be answered from a subset index", endpoint)
+        return None
+
+    def close(self) -> None:
+        """Close the index file."""
+        self.index.close()
+
+
+def main():
+    """
+    CLI entry point building a subset index.
+
+    CLI arguments:
+        dump (str): The truthy N-Triples dump or the JSON dump.
+        seeds (str): Files holding the IDs of the seeds (lists of IDs, Turtle files...).
+        -o, --output (str): The index file (default: wikidata-subset.sqlite).
+        --depth (int): Claim hops whose entities get their claims stored (default: 0).
+        --languages (str): Languages of the terms to keep (default: en).
+    """
+    parser = argparse.ArgumentParser(
+        description="Build a local index of the Wikidata entities reachable from seeds."
+    )
+    parser.add_argument("dump", type=Path, help="Truthy N-Triples or JSON dump.")
+    parser.add_argument(
+        "seeds", type=Path, nargs="+", help="Files holding the seed IDs."
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path("wikidata-subset.sqlite"),
+        help="Index file (default: wikidata-subset.sqlite).",
+    )
+    parser.add_argument(
+        "--depth", type=int, default=0, help="Claim hops with claims (default: 0)."
+    )
+    parser.add_argument(
+        "--languages", nargs="+", default=list(DEFAULT_LANGUAGES), help="Default: en."
+    )
+    args = parser.parse_args()
+
+    if not args.dump.exists():
+        parser.error(f"Dump '{args.dump}' does not exist.")
+    seeds = read_seeds(args.seeds)
+    if not seeds:
+        parser.error("No Wikidata IDs found in the seed files.")
+    logger.info("%d seeds", len(seeds))
+    try:
+        index = build_index(
+            args.dump, seeds, args.output, depth=args.depth, languages=args.languages
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    with index:
+        logger.info("Index %s: %s", args.output, index.stats())
+
+
+if __name__ == "__main__":
+    main()